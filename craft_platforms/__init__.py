@@ -15,29 +15,68 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Package base for craft_platforms."""
 
-from ._architectures import DebianArchitecture, parse_base_and_architecture
-from ._build import get_build_plan
-from ._buildinfo import BuildInfo
-from . import charm, rock, snap
-from ._distro import BaseName, DistroBase, is_ubuntu_like
-from ._errors import (
-    CraftError,
-    CraftPlatformsError,
-    AllOnlyBuildError,
-    AllSinglePlatformError,
-    InvalidBaseError,
-    InvalidPlatformNameError,
-    InvalidPlatformError,
-    NeedBuildBaseError,
-    RequiresBaseError,
-    InvalidMultiBaseError,
-)
-from ._platforms import (
-    PlatformDict,
-    Platforms,
-    get_platforms_build_plan,
-    parse_base_and_name,
-)
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from ._architectures import DebianArchitecture, parse_base_and_architecture
+    from ._build import get_build_plan, get_build_plan_errors, iter_build_plan
+    from ._batch import BatchResult, get_build_plans
+    from ._async import get_build_plan_async, get_build_plans_async
+    from ._buildinfo import BuildInfo, FrozenBuildInfo
+    from ._filter import BuildPlanFilter
+    from ._buildplan import BuildPlan
+    from ._serialize import (
+        build_plan_from_bytes,
+        build_plan_from_json,
+        build_plan_to_bytes,
+        build_plan_to_json,
+    )
+    from ._cache import CacheInfo, clear_caches, get_cache_info
+    from ._delta import BuildPlanDelta, get_build_plan_delta
+    from ._plan_cache import PlanCache, get_project_fingerprint
+    from ._persistent_cache import PersistentPlanCache
+    from ._environment import (
+        BuildEnvironment,
+        group_build_plans_by_build_environment,
+        group_by_build_environment,
+        order_by_build_environment,
+    )
+    from ._scheduler import Assignment, Runner, Schedule, schedule_build_plan
+    from . import charm, rock, snap
+    from ._distro import BaseName, DistroBase, is_ubuntu_like
+    from ._host import HostInfo, get_host_info, use_host_info
+    from ._instrument import (
+        PlanningStage,
+        StageEvent,
+        StageTimings,
+        StageTotals,
+        add_stage_hook,
+        remove_stage_hook,
+        stage_hook,
+    )
+    from ._os_release import RootBaseResult, get_root_bases
+    from ._trace import ChromeTracer
+    from ._metrics import MetricsRegistry
+    from ._errors import (
+        CraftError,
+        CraftPlatformsError,
+        AllOnlyBuildError,
+        AllSinglePlatformError,
+        InvalidBaseError,
+        InvalidPlatformNameError,
+        InvalidPlatformError,
+        NeedBuildBaseError,
+        RequiresBaseError,
+        InvalidMultiBaseError,
+    )
+    from ._platforms import (
+        PlatformDict,
+        Platforms,
+        get_platforms_build_plan,
+        iter_platforms_build_plan,
+        parse_base_and_name,
+    )
 
 try:
     from ._version import (
@@ -55,18 +94,62 @@ __all__ = [
     "__version__",
     "DebianArchitecture",
     "get_build_plan",
+    "iter_build_plan",
+    "get_build_plan_errors",
+    "get_build_plans",
+    "get_build_plan_async",
+    "get_build_plans_async",
+    "BatchResult",
+    "get_build_plan_delta",
+    "BuildPlanDelta",
     "BuildInfo",
+    "FrozenBuildInfo",
+    "BuildPlanFilter",
+    "BuildPlan",
+    "build_plan_from_bytes",
+    "build_plan_from_json",
+    "build_plan_to_bytes",
+    "build_plan_to_json",
+    "CacheInfo",
+    "clear_caches",
+    "get_cache_info",
+    "PlanCache",
+    "get_project_fingerprint",
+    "PersistentPlanCache",
+    "BuildEnvironment",
+    "group_by_build_environment",
+    "group_build_plans_by_build_environment",
+    "order_by_build_environment",
+    "Assignment",
+    "Runner",
+    "Schedule",
+    "schedule_build_plan",
     "parse_base_and_architecture",
     "charm",
     "rock",
     "snap",
     "get_platforms_build_plan",
+    "iter_platforms_build_plan",
     "parse_base_and_name",
     "PlatformDict",
     "Platforms",
     "BaseName",
     "DistroBase",
     "is_ubuntu_like",
+    "HostInfo",
+    "get_host_info",
+    "use_host_info",
+    "PlanningStage",
+    "StageEvent",
+    "StageTimings",
+    "StageTotals",
+    "add_stage_hook",
+    "remove_stage_hook",
+    "stage_hook",
+    "ChromeTracer",
+    "MetricsRegistry",
+    "RootBaseResult",
+    "get_root_bases",
     "CraftError",
     "CraftPlatformsError",
     "AllOnlyBuildError",
@@ -78,3 +161,94 @@ __all__ = [
     "NeedBuildBaseError",
     "InvalidMultiBaseError",
 ]
+
+# Where each public name is defined. These are only imported when first used, so
+# that ``import craft_platforms`` stays cheap for applications that only need a
+# small part of the package.
+_LAZY_ATTRIBUTES: typing.Dict[str, str] = {
+    "DebianArchitecture": "._architectures",
+    "parse_base_and_architecture": "._architectures",
+    "get_build_plan": "._build",
+    "get_build_plan_errors": "._build",
+    "iter_build_plan": "._build",
+    "BatchResult": "._batch",
+    "get_build_plans": "._batch",
+    "get_build_plan_async": "._async",
+    "get_build_plans_async": "._async",
+    "BuildInfo": "._buildinfo",
+    "FrozenBuildInfo": "._buildinfo",
+    "BuildPlanFilter": "._filter",
+    "BuildPlan": "._buildplan",
+    "build_plan_from_bytes": "._serialize",
+    "build_plan_from_json": "._serialize",
+    "build_plan_to_bytes": "._serialize",
+    "build_plan_to_json": "._serialize",
+    "CacheInfo": "._cache",
+    "clear_caches": "._cache",
+    "get_cache_info": "._cache",
+    "BuildPlanDelta": "._delta",
+    "get_build_plan_delta": "._delta",
+    "PlanCache": "._plan_cache",
+    "get_project_fingerprint": "._plan_cache",
+    "PersistentPlanCache": "._persistent_cache",
+    "BuildEnvironment": "._environment",
+    "group_build_plans_by_build_environment": "._environment",
+    "group_by_build_environment": "._environment",
+    "order_by_build_environment": "._environment",
+    "Assignment": "._scheduler",
+    "Runner": "._scheduler",
+    "Schedule": "._scheduler",
+    "schedule_build_plan": "._scheduler",
+    "BaseName": "._distro",
+    "DistroBase": "._distro",
+    "is_ubuntu_like": "._distro",
+    "HostInfo": "._host",
+    "get_host_info": "._host",
+    "use_host_info": "._host",
+    "PlanningStage": "._instrument",
+    "StageEvent": "._instrument",
+    "StageTimings": "._instrument",
+    "StageTotals": "._instrument",
+    "add_stage_hook": "._instrument",
+    "remove_stage_hook": "._instrument",
+    "stage_hook": "._instrument",
+    "ChromeTracer": "._trace",
+    "MetricsRegistry": "._metrics",
+    "RootBaseResult": "._os_release",
+    "get_root_bases": "._os_release",
+    "CraftError": "._errors",
+    "CraftPlatformsError": "._errors",
+    "AllOnlyBuildError": "._errors",
+    "AllSinglePlatformError": "._errors",
+    "InvalidBaseError": "._errors",
+    "InvalidPlatformNameError": "._errors",
+    "InvalidPlatformError": "._errors",
+    "NeedBuildBaseError": "._errors",
+    "RequiresBaseError": "._errors",
+    "InvalidMultiBaseError": "._errors",
+    "PlatformDict": "._platforms",
+    "Platforms": "._platforms",
+    "get_platforms_build_plan": "._platforms",
+    "iter_platforms_build_plan": "._platforms",
+    "parse_base_and_name": "._platforms",
+}
+
+# Subpackages, which are imported as a whole.
+_LAZY_SUBPACKAGES = frozenset({"charm", "rock", "snap"})
+
+
+def __getattr__(name: str) -> typing.Any:  # noqa: ANN401 (any public name)
+    """Import public names from their modules on first access."""
+    if name in _LAZY_SUBPACKAGES:
+        value: typing.Any = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
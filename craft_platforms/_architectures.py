@@ -18,12 +18,16 @@
 from __future__ import annotations
 
 import enum
-import platform
+import typing
 from typing import Literal, Tuple, Union
 
-from typing_extensions import Self
+from craft_platforms import _cache, _distro
 
-from craft_platforms import _distro
+if typing.TYPE_CHECKING:
+    from typing_extensions import Self
+
+TOKEN_CACHE_SIZE = 4096
+"""The maximum number of parsed base-prefixed tokens to keep."""
 
 
 class DebianArchitecture(str, enum.Enum):
@@ -61,6 +65,8 @@ class DebianArchitecture(str, enum.Enum):
     @classmethod
     def from_host(cls) -> Self:
         """Get the DebianArchitecture of the running host."""
+        import platform  # noqa: PLC0415 (only imported when needed)
+
         return cls.from_machine(platform.machine())
 
     def to_platform_arch(self) -> str:
@@ -134,6 +140,13 @@ def parse_base_and_architecture(
 
     :raises ValueError: If the architecture or base is invalid.
     """
+    return _parse_base_and_architecture(arch)
+
+
+@_cache.lru_cache("base_and_architecture", maxsize=TOKEN_CACHE_SIZE)
+def _parse_base_and_architecture(
+    arch: str,
+) -> Tuple[_distro.DistroBase | None, Union[DebianArchitecture, Literal["all"]]]:
     if ":" in arch:
         base_str, _, arch_str = arch.partition(":")
         base = _distro.DistroBase.from_str(base_str)
@@ -0,0 +1,219 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Build planning for asyncio applications."""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import itertools
+import os
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from craft_platforms import _batch, _build, _buildinfo, _filter, _host
+
+_T = TypeVar("_T")
+
+_Projects = Union[
+    Iterable[Tuple[str, Dict[str, Any]]], AsyncIterable[Tuple[str, Dict[str, Any]]]
+]
+
+
+def _run_in_executor(
+    executor: Optional[concurrent.futures.Executor], func: Callable[[], _T]
+) -> "asyncio.Future[_T]":
+    """Run a function in an executor without blocking the event loop.
+
+    Functions run in threads see the caller's context, such as an override from
+    :func:`~craft_platforms.use_host_info`. Functions sent to a process pool must be
+    picklable, so they're sent as they are.
+    """
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+        return loop.run_in_executor(executor, func)
+    return loop.run_in_executor(executor, contextvars.copy_context().run, func)
+
+
+async def get_build_plan_async(
+    app: str,
+    *,
+    project_data: Dict[str, Any],
+    strict_platform_names: bool = False,
+    allow_app_characters: bool = False,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> List[_buildinfo.BuildInfo]:
+    """Get a build plan for a given application without blocking the event loop.
+
+    This takes the same arguments as :func:`~craft_platforms.get_build_plan`, but
+    plans the project in an executor, so neither planning nor reading the host's
+    files for :meth:`DistroBase.from_host()
+    <craft_platforms.DistroBase.from_host>` happen in the event loop's thread.
+
+    If the awaiting task is cancelled before the project is planned, the project
+    isn't planned. Planning that has already started runs to completion in the
+    executor, but its result is discarded.
+
+    :param executor: The executor to plan in. Defaults to the event loop's default
+        executor. With a :class:`~concurrent.futures.ProcessPoolExecutor`, the
+        project data must be picklable and an override from
+        :func:`~craft_platforms.use_host_info` doesn't apply.
+    :returns: The build plan.
+    """
+    return await _run_in_executor(
+        executor,
+        functools.partial(
+            _get_build_plan_list,
+            app,
+            project_data=project_data,
+            strict_platform_names=strict_platform_names,
+            allow_app_characters=allow_app_characters,
+            build_filter=build_filter,
+        ),
+    )
+
+
+def _get_build_plan_list(app: str, **kwargs: Any) -> List[_buildinfo.BuildInfo]:
+    return list(_build.get_build_plan(app, **kwargs))
+
+
+async def _aiter_chunks(
+    projects: _Projects, chunk_size: int
+) -> AsyncGenerator[List[Tuple[str, Dict[str, Any]]], None]:
+    if isinstance(projects, AsyncIterable):
+        chunk: List[Tuple[str, Dict[str, Any]]] = []
+        async for project in projects:
+            chunk.append(project)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+    projects_iter = iter(projects)
+    while chunk := list(itertools.islice(projects_iter, chunk_size)):
+        yield chunk
+
+
+async def get_build_plans_async(
+    projects: _Projects,
+    *,
+    max_concurrency: Optional[int] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+    chunk_size: int = 1,
+    strict_platform_names: bool = False,
+    allow_app_characters: bool = False,
+    host_info: Optional[_host.HostInfo] = None,
+) -> AsyncGenerator[_batch.BatchResult, None]:
+    """Get build plans for many projects in an executor, streaming the results.
+
+    This is the asyncio counterpart of :func:`~craft_platforms.get_build_plans`.
+    Projects are planned in an executor rather than in the event loop's thread, and
+    at most ``max_concurrency`` chunks of projects are planned at a time. The
+    input is only consumed as planning slots become free and results are only
+    produced as fast as they're consumed, so a slow consumer holds back the
+    producer of projects rather than letting results pile up in memory.
+
+    Results arrive as each chunk of projects is planned, so they may arrive out of
+    order. Use :attr:`BatchResult.index <craft_platforms.BatchResult.index>` to
+    match a result with its project. Errors in a project are returned as data in
+    its result.
+
+    Closing the iterator or cancelling the task that's iterating over it cancels
+    every chunk that hasn't started. Chunks that have started run to completion in
+    the executor, but their results are discarded.
+
+    :param projects: An iterable or asynchronous iterable of ``(app, project_data)``
+        pairs, as would be passed to :func:`~craft_platforms.get_build_plan`.
+    :param max_concurrency: The number of chunks planned at a time. Defaults to
+        twice the number of CPUs on the host.
+    :param executor: The executor to plan in. Defaults to the event loop's default
+        executor. A :class:`~concurrent.futures.ProcessPoolExecutor` keeps planning
+        from competing with the event loop for the GIL, at the cost of sending each
+        project to a worker.
+    :param chunk_size: The number of projects planned in a single executor task.
+        With a process pool, a larger chunk reduces the cost of sending projects
+        to the workers.
+    :param strict_platform_names: Whether to strictly validate all platform names.
+    :param allow_app_characters: Whether platform name validation allows characters
+        that are reserved for use by applications.
+    :param host_info: The host to plan for, for projects whose build plan depends on
+        the host.
+    :yields: A :class:`~craft_platforms.BatchResult` for each project.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, not {chunk_size}")
+    if max_concurrency is None:
+        max_concurrency = (os.cpu_count() or 1) * 2
+    if max_concurrency < 1:
+        raise ValueError(
+            f"max_concurrency must be a positive integer, not {max_concurrency}"
+        )
+    planner_kwargs = {
+        "strict_platform_names": strict_platform_names,
+        "allow_app_characters": allow_app_characters,
+    }
+
+    chunks = _aiter_chunks(projects, chunk_size)
+    pending: Set[asyncio.Future[List[_batch.BatchResult]]] = set()
+    start = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max_concurrency:
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(
+                    _run_in_executor(
+                        executor,
+                        functools.partial(
+                            _batch._plan_chunk,  # noqa: SLF001 (shared with batches)
+                            start,
+                            chunk,
+                            planner_kwargs,
+                            host_info,
+                        ),
+                    )
+                )
+                start += len(chunk)
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                for result in future.result():
+                    yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        await chunks.aclose()
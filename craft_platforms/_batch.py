@@ -0,0 +1,154 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Build planning for many projects at once."""
+
+import concurrent.futures
+import dataclasses
+import itertools
+import os
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from craft_platforms import _build, _buildinfo, _errors, _host
+
+DEFAULT_CHUNK_SIZE = 16
+"""The default number of projects sent to a worker in a single task."""
+
+
+@dataclasses.dataclass(frozen=True)
+class BatchResult:
+    """The outcome of planning a single project in a batch."""
+
+    index: int
+    """The position of the project in the input iterable."""
+
+    app: str
+    """The name of the application the project was planned for."""
+
+    build_plan: Optional[Sequence[_buildinfo.BuildInfo]] = None
+    """The build plan for the project, or ``None`` if planning failed."""
+
+    error: Optional[Exception] = None
+    """The error that prevented the project from being planned, if any."""
+
+
+def _plan_chunk(
+    start: int,
+    chunk: Sequence[Tuple[str, Dict[str, Any]]],
+    planner_kwargs: Dict[str, Any],
+    host_info: Optional[_host.HostInfo] = None,
+) -> List[BatchResult]:
+    """Plan a chunk of projects, capturing per-project errors as data."""
+    if host_info is not None:
+        with _host.use_host_info(host_info):
+            return _plan_chunk(start, chunk, planner_kwargs)
+    results: List[BatchResult] = []
+    for index, (app, project_data) in enumerate(chunk, start=start):
+        # Any error in a project, even one from malformed data that the planners
+        # don't check for, is that project's result rather than the chunk's.
+        errors: List[Exception] = []
+        with _errors.collect_errors(errors):
+            build_plan = list(
+                _build.get_build_plan(app, project_data=project_data, **planner_kwargs)
+            )
+            results.append(BatchResult(index=index, app=app, build_plan=build_plan))
+        if errors:
+            results.append(BatchResult(index=index, app=app, error=errors[0]))
+    return results
+
+
+def get_build_plans(
+    projects: Iterable[Tuple[str, Dict[str, Any]]],
+    *,
+    max_workers: Optional[int] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    strict_platform_names: bool = False,
+    allow_app_characters: bool = False,
+    host_info: Optional[_host.HostInfo] = None,
+) -> Generator[BatchResult, None, None]:
+    """Get build plans for many projects concurrently.
+
+    Projects are sent to the workers in chunks and results are streamed back as each
+    chunk completes, so they may arrive out of order. Use :attr:`BatchResult.index`
+    to match a result with its project. The input iterable is consumed lazily and
+    only a bounded number of chunks are in flight at a time.
+
+    :param projects: An iterable of ``(app, project_data)`` pairs, as would be passed
+        to :func:`~craft_platforms.get_build_plan`.
+    :param max_workers: The number of worker processes. Defaults to the number of
+        CPUs on the host. Twice this many chunks are in flight at a time.
+    :param executor: An executor to use instead of a new process pool. The caller
+        remains responsible for shutting it down. Set ``max_workers`` to the
+        executor's number of workers so that it isn't sent more chunks than it needs.
+    :param chunk_size: The number of projects to plan in a single worker task.
+    :param strict_platform_names: Whether to strictly validate all platform names.
+    :param allow_app_characters: Whether platform name validation allows characters
+        that are reserved for use by applications.
+    :param host_info: The host to plan for, for projects whose build plan depends on
+        the host. If set, the workers don't probe the host themselves.
+    :yields: A :class:`BatchResult` for each project, containing either the build
+        plan or the error that prevented planning.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, not {chunk_size}")
+    workers = max_workers or os.cpu_count() or 1
+    max_in_flight = workers * 2
+    planner_kwargs = {
+        "strict_platform_names": strict_platform_names,
+        "allow_app_characters": allow_app_characters,
+    }
+    pool = executor or concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+
+    projects_iter = iter(projects)
+    pending: Set[concurrent.futures.Future[List[BatchResult]]] = set()
+    start = 0
+
+    def submit_chunks() -> None:
+        nonlocal start
+        while len(pending) < max_in_flight:
+            chunk = list(itertools.islice(projects_iter, chunk_size))
+            if not chunk:
+                return
+            pending.add(
+                pool.submit(_plan_chunk, start, chunk, planner_kwargs, host_info)
+            )
+            start += len(chunk)
+
+    try:
+        submit_chunks()
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            pending.difference_update(done)
+            submit_chunks()
+            for future in done:
+                yield from future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=True)
@@ -15,11 +15,30 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """General build planner for any app."""
 
-from typing import Any, Callable, Dict, Iterable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
 
-from craft_platforms import charm, deb, rock, snap, validators
+from craft_platforms import _errors, _instrument, charm, deb, rock, snap, validators
 from craft_platforms._buildinfo import BuildInfo
-from craft_platforms._platforms import get_platforms_build_plan
+from craft_platforms._filter import BuildPlanFilter
+from craft_platforms._platforms import (
+    get_platforms_build_plan,
+    iter_platforms_build_plan,
+)
+
+_PlanT = TypeVar("_PlanT", bound=Iterable[BuildInfo])
+
+# Validates every platform without creating any entries.
+_VALIDATE_ONLY = BuildPlanFilter(platform=())
 
 _APP_SPECIFIC_PLANNERS: Dict[str, Callable[..., Iterable[BuildInfo]]] = {
     "charmcraft": charm.get_charm_build_plan,
@@ -28,6 +47,53 @@ _APP_SPECIFIC_PLANNERS: Dict[str, Callable[..., Iterable[BuildInfo]]] = {
     "snapcraft": snap.get_platforms_snap_build_plan,
 }
 
+_APP_SPECIFIC_ITER_PLANNERS: Dict[str, Callable[..., Iterator[BuildInfo]]] = {
+    "charmcraft": charm.iter_charm_build_plan,
+    "debcraft": deb.iter_deb_build_plan,
+    "rockcraft": rock.iter_rock_build_plan,
+    "snapcraft": snap.iter_platforms_snap_build_plan,
+}
+
+
+def _call_planner(
+    planner: Callable[..., _PlanT],
+    app: str,
+    project_data: Dict[str, Any],
+    build_filter: Optional[BuildPlanFilter] = None,
+    errors: Optional[List[Exception]] = None,
+) -> _PlanT:
+    """Call a build planner with the arguments it needs from the project data."""
+    filter_args: Dict[str, Any] = {}
+    if build_filter is not None:
+        filter_args["build_filter"] = build_filter
+    if errors is not None:
+        filter_args["errors"] = errors
+    if app == "charmcraft":
+        return planner(project_data, **filter_args)
+
+    args = {
+        "base": project_data.get("base"),
+        "platforms": project_data.get("platforms"),
+        "build_base": project_data.get("build-base"),
+    }
+
+    if app == "snapcraft":
+        args["snap_type"] = project_data.get("type")
+
+    return planner(**args, **filter_args)
+
+
+def _validate_strict_platform_names(
+    platforms: Dict[str, Any], *, allow_app_characters: bool
+) -> None:
+    """Strictly validate the platform names, timing it if instrumentation is on."""
+    validate = validators.validate_strict_platform_names
+    if _instrument.HOOKS:
+        validate = _instrument.timed(
+            _instrument.PlanningStage.VALIDATE_NAMES, validate, count=len(platforms)
+        )
+    validate(platforms, allow_app_characters=allow_app_characters)
+
 
 def get_build_plan(
     app: str,
@@ -35,6 +101,7 @@ def get_build_plan(
     project_data: Dict[str, Any],
     strict_platform_names: bool = False,
     allow_app_characters: bool = False,
+    build_filter: Optional[BuildPlanFilter] = None,
 ) -> Iterable[BuildInfo]:
     """Get a build plan for a given application.
 
@@ -44,6 +111,8 @@ def get_build_plan(
     :param strict_platform_names: Whether to strictly validate all platform names.
     :param allow_app_characters: Whether platform name validation allows characters
         that are reserved for use by applications.
+    :param build_filter: If set, the planner only creates the entries that match this
+        filter. The whole project is still validated.
     :returns: An iterable containing each possible BuildInfo for this file.
     :raises: InvalidPlatformNameError if strict validation is turned on and a platform
         name is incorrect.
@@ -54,23 +123,144 @@ def get_build_plan(
     in a forward-compatible manner as it adds more logic around selecting build
     planners or special behaviour for more apps.
     """
+    if _instrument.HOOKS and not _instrument.in_plan():
+        return _instrument.run_plan(
+            app,
+            get_build_plan,
+            app=app,
+            project_data=project_data,
+            strict_platform_names=strict_platform_names,
+            allow_app_characters=allow_app_characters,
+            build_filter=build_filter,
+        )
+    if strict_platform_names:
+        _validate_strict_platform_names(
+            project_data.get("platforms", {}), allow_app_characters=allow_app_characters
+        )
+
+    planner = _APP_SPECIFIC_PLANNERS.get(app, get_platforms_build_plan)
+    return _call_planner(planner, app, project_data, build_filter)
+
+
+def iter_build_plan(
+    app: str,
+    *,
+    project_data: Dict[str, Any],
+    strict_platform_names: bool = False,
+    allow_app_characters: bool = False,
+    build_filter: Optional[BuildPlanFilter] = None,
+) -> Generator[BuildInfo, None, None]:
+    """Lazily generate a build plan for a given application.
+
+    This is the streaming form of :func:`get_build_plan`, yielding each
+    ``BuildInfo`` as the app-specific planner produces it. Consumers that only need
+    part of the plan (for example, the first entry that builds on the host) can stop
+    early without expanding every platform. Errors are raised during iteration, and
+    plan-wide validation only happens once the last item has been yielded.
+
+    :param app: The name of the application (e.g. snapcraft, charmcraft, rockcraft)
+    :param project_data: The raw dictionary of the project's YAML file. Normally this
+        is what's output from ``yaml.safe_load()``.
+    :param strict_platform_names: Whether to strictly validate all platform names.
+    :param allow_app_characters: Whether platform name validation allows characters
+        that are reserved for use by applications.
+    :param build_filter: If set, the planner only creates the entries that match this
+        filter. The whole project is still validated.
+    :yields: Each possible BuildInfo for this file.
+    :raises: InvalidPlatformNameError if strict validation is turned on and a platform
+        name is incorrect.
+    """
+    if _instrument.HOOKS and not _instrument.in_plan():
+        yield from _instrument.iter_plan(
+            app,
+            iter_build_plan(
+                app,
+                project_data=project_data,
+                strict_platform_names=strict_platform_names,
+                allow_app_characters=allow_app_characters,
+                build_filter=build_filter,
+            ),
+            project_data,
+        )
+        return
     if strict_platform_names:
-        for name in project_data.get("platforms", {}):
+        _validate_strict_platform_names(
+            project_data.get("platforms", {}), allow_app_characters=allow_app_characters
+        )
+
+    planner = _APP_SPECIFIC_ITER_PLANNERS.get(app, iter_platforms_build_plan)
+    yield from _call_planner(planner, app, project_data, build_filter)
+
+
+def _without_rejected_platforms(
+    project_data: Dict[str, Any],
+    errors: List[Exception],
+    *,
+    allow_app_characters: bool,
+) -> Dict[str, Any]:
+    """Collect the errors in the platform names and leave out the rejected platforms.
+
+    :returns: The project data without the platforms whose names are rejected, so
+        their names aren't reported again.
+    """
+    rejected = set()
+    for name in project_data.get("platforms", {}):
+        error_count = len(errors)
+        with _errors.collect_errors(errors, (_errors.InvalidPlatformNameError,)):
             validators.validate_strict_platform_name(
                 name, allow_app_characters=allow_app_characters
             )
+        if len(errors) > error_count:
+            rejected.add(name)
+    platforms = project_data.get("platforms")
+    if not rejected or not isinstance(platforms, dict):
+        return project_data
+    return {
+        **project_data,
+        "platforms": {
+            name: platform
+            for name, platform in platforms.items()
+            if name not in rejected
+        },
+    }
 
-    planner = _APP_SPECIFIC_PLANNERS.get(app, get_platforms_build_plan)
-    if app == "charmcraft":
-        return planner(project_data)
 
-    args = {
-        "base": project_data.get("base"),
-        "platforms": project_data.get("platforms"),
-        "build_base": project_data.get("build-base"),
-    }
+def get_build_plan_errors(
+    app: str,
+    *,
+    project_data: Dict[str, Any],
+    strict_platform_names: bool = False,
+    allow_app_characters: bool = False,
+) -> List[Exception]:
+    """Get every problem that prevents a project from being planned.
 
-    if app == "snapcraft":
-        args["snap_type"] = project_data.get("type")
+    :func:`get_build_plan` raises the first error in a project. This instead walks
+    the project once and collects the errors from every platform and every rule, so
+    they can all be reported together. A platform with an error is left out of the
+    rules that apply to the whole plan, so fixing it can reveal further errors.
+    With ``strict_platform_names``, a platform whose name is rejected isn't planned,
+    so each invalid name is reported once.
 
-    return planner(**args)
+    :param app: The name of the application (e.g. snapcraft, charmcraft, rockcraft)
+    :param project_data: The raw dictionary of the project's YAML file.
+    :param strict_platform_names: Whether to strictly validate all platform names.
+    :param allow_app_characters: Whether platform name validation allows characters
+        that are reserved for use by applications.
+    :returns: The errors in the order they were found, or an empty list if the
+        project is valid. Most are :class:`~craft_platforms.CraftPlatformsError`, but
+        malformed project data can also produce built-in errors such as
+        ``ValueError`` for an unknown architecture or ``AttributeError`` for a
+        project without platforms.
+    """
+    errors: List[Exception] = []
+    # Anything the planners raise, even for data they don't check, is an error in
+    # the project, and the errors found before it are kept.
+    with _errors.collect_errors(errors):
+        if strict_platform_names:
+            project_data = _without_rejected_platforms(
+                project_data, errors, allow_app_characters=allow_app_characters
+            )
+        planner = _APP_SPECIFIC_ITER_PLANNERS.get(app, iter_platforms_build_plan)
+        for _ in _call_planner(planner, app, project_data, _VALIDATE_ONLY, errors):
+            pass
+    return errors
@@ -14,9 +14,12 @@
 """Build info."""
 
 import dataclasses
-from typing import Literal, Union
+import sys
+from typing import Any, Dict, Literal, Mapping, SupportsIndex, Tuple, Union
 
-from craft_platforms import _architectures, _distro
+from typing_extensions import Self
+
+from craft_platforms import _architectures, _cache, _distro
 
 
 @dataclasses.dataclass
@@ -34,3 +37,137 @@ class BuildInfo:
 
     build_base: _distro.DistroBase
     """The base to build on."""
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert this BuildInfo to a dictionary of strings that can be serialized.
+
+        :returns: A dictionary with the ``platform``, ``build_on``, ``build_for`` and
+            ``build_base`` as strings, such as ``"ubuntu@24.04"`` for the base.
+        """
+        return {
+            "platform": self.platform,
+            "build_on": str(self.build_on),
+            "build_for": str(self.build_for),
+            "build_base": str(self.build_base),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, str]) -> Self:
+        """Create a BuildInfo from a dictionary made by :meth:`to_dict`.
+
+        :param data: The serialized build info.
+        :returns: A BuildInfo equal to the one that was serialized.
+        :raises ValueError: If the data isn't a valid build info.
+        """
+        try:
+            build_for = data["build_for"]
+            return cls(
+                data["platform"],
+                _ARCHITECTURES_BY_VALUE[data["build_on"]],
+                "all" if build_for == "all" else _ARCHITECTURES_BY_VALUE[build_for],
+                _distro.DistroBase.from_str(data["build_base"]),
+            )
+        except (KeyError, TypeError, AttributeError) as exc:
+            raise ValueError(f"Invalid build info: {data!r}") from exc
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Union[str, Tuple[Any, ...]]:
+        if type(self) is not BuildInfo:
+            # Subclasses may have fields of their own.
+            return super().__reduce_ex__(protocol)
+        return (
+            BuildInfo,
+            (self.platform, self.build_on, self.build_for, self.build_base),
+        )
+
+
+_ARCHITECTURES_BY_VALUE: Dict[str, _architectures.DebianArchitecture] = {
+    arch.value: arch for arch in _architectures.DebianArchitecture
+}
+
+
+@_cache.lru_cache("interned_base", maxsize=_distro.BASE_CACHE_SIZE)
+def _interned_base(distribution: str, series: str) -> _distro.DistroBase:
+    return _distro.DistroBase(distribution, series)
+
+
+def intern_base(base: _distro.DistroBase) -> _distro.DistroBase:
+    """Get a shared DistroBase equivalent to the given base.
+
+    Bases are keyed on their exact fields because ``DistroBase`` equality allows one
+    series to be more specific than the other.
+    """
+    return _interned_base(base.distribution, base.series)
+
+
+class FrozenBuildInfo:
+    """An immutable, hashable and compact form of :class:`BuildInfo`.
+
+    Instances use ``__slots__`` and share the storage for identical platform names
+    and bases, which keeps large plans small in memory. They can be used as set
+    members and dictionary keys, and compare equal to a ``BuildInfo`` with the same
+    values.
+    """
+
+    __slots__ = ("build_base", "build_for", "build_on", "platform")
+
+    platform: str
+    build_on: _architectures.DebianArchitecture
+    build_for: Union[_architectures.DebianArchitecture, Literal["all"]]
+    build_base: _distro.DistroBase
+
+    def __init__(
+        self,
+        platform: str,
+        build_on: _architectures.DebianArchitecture,
+        build_for: Union[_architectures.DebianArchitecture, Literal["all"]],
+        build_base: _distro.DistroBase,
+    ) -> None:
+        # Default platforms may be named by a DebianArchitecture, which can't be
+        # interned and is already a shared singleton.
+        if type(platform) is str:
+            platform = sys.intern(platform)
+        object.__setattr__(self, "platform", platform)
+        object.__setattr__(self, "build_on", build_on)
+        object.__setattr__(self, "build_for", build_for)
+        object.__setattr__(self, "build_base", intern_base(build_base))
+
+    @classmethod
+    def from_build_info(cls, info: BuildInfo) -> Self:
+        """Convert a BuildInfo to a FrozenBuildInfo."""
+        return cls(info.platform, info.build_on, info.build_for, info.build_base)
+
+    def to_build_info(self) -> BuildInfo:
+        """Convert this FrozenBuildInfo to a mutable BuildInfo."""
+        return BuildInfo(self.platform, self.build_on, self.build_for, self.build_base)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (FrozenBuildInfo, BuildInfo)):
+            return NotImplemented
+        return (
+            self.platform == other.platform
+            and self.build_on == other.build_on
+            and self.build_for == other.build_for
+            and self.build_base == other.build_base
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.platform, self.build_on, self.build_for, self.build_base))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(platform={self.platform!r}, "
+            f"build_on={self.build_on!r}, build_for={self.build_for!r}, "
+            f"build_base={self.build_base!r})"
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (
+            type(self),
+            (self.platform, self.build_on, self.build_for, self.build_base),
+        )
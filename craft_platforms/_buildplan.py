@@ -0,0 +1,234 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""An indexed build plan."""
+
+import collections
+import functools
+import types
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
+
+from typing_extensions import Self
+
+from craft_platforms import (
+    _architectures,
+    _build,
+    _buildinfo,
+    _distro,
+    _filter,
+    _serialize,
+)
+
+_FIELDS = ("platform", "build_on", "build_for", "build_base")
+
+_BuildFor = Union[_architectures.DebianArchitecture, Literal["all"]]
+
+
+class BuildPlan(Sequence[_buildinfo.BuildInfo]):
+    """An immutable sequence of build plan entries with lazily built indexes.
+
+    Each index is built the first time it's used and is kept for later lookups, so
+    repeated queries such as "all entries that build on arm64 for ubuntu@24.04" are
+    dictionary lookups rather than scans of the plan. The entries must not be
+    modified once they're in a build plan.
+
+    A build plan compares equal to any sequence with the same entries in the same
+    order.
+
+    :param entries: The entries of the build plan.
+    """
+
+    def __init__(self, entries: Iterable[_buildinfo.BuildInfo] = ()) -> None:
+        self._entries = tuple(entries)
+
+    @classmethod
+    def from_project(
+        cls,
+        app: str,
+        *,
+        project_data: Dict[str, Any],
+        strict_platform_names: bool = False,
+        allow_app_characters: bool = False,
+        build_filter: Optional[_filter.BuildPlanFilter] = None,
+    ) -> Self:
+        """Get an indexed build plan for a project.
+
+        This takes the same arguments as :func:`~craft_platforms.get_build_plan`.
+        """
+        return cls(
+            _build.iter_build_plan(
+                app,
+                project_data=project_data,
+                strict_platform_names=strict_platform_names,
+                allow_app_characters=allow_app_characters,
+                build_filter=build_filter,
+            )
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> _buildinfo.BuildInfo: ...
+    @overload
+    def __getitem__(self, index: slice) -> "BuildPlan": ...
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[_buildinfo.BuildInfo, "BuildPlan"]:
+        if isinstance(index, slice):
+            return type(self)(self._entries[index])
+        return self._entries[index]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[_buildinfo.BuildInfo]:
+        return iter(self._entries)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BuildPlan):
+            return self._entries == other._entries
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self._entries) == len(other) and all(
+                mine == theirs for mine, theirs in zip(self._entries, other)
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._entries)!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickle the binary encoding rather than the entries and indexes.
+        return (_from_bytes, (type(self), _serialize.build_plan_to_bytes(self)))
+
+    def _index_by(self, field: str) -> Mapping[Any, Tuple[_buildinfo.BuildInfo, ...]]:
+        index: Dict[Any, List[_buildinfo.BuildInfo]] = collections.defaultdict(list)
+        for info in self._entries:
+            index[getattr(info, field)].append(info)
+        return types.MappingProxyType(
+            {key: tuple(entries) for key, entries in index.items()}
+        )
+
+    @functools.cached_property
+    def by_platform(self) -> Mapping[str, Tuple[_buildinfo.BuildInfo, ...]]:
+        """The entries for each platform name."""
+        return self._index_by("platform")
+
+    @functools.cached_property
+    def by_build_on(
+        self,
+    ) -> Mapping[_architectures.DebianArchitecture, Tuple[_buildinfo.BuildInfo, ...]]:
+        """The entries that build on each architecture."""
+        return self._index_by("build_on")
+
+    @functools.cached_property
+    def by_build_for(self) -> Mapping[_BuildFor, Tuple[_buildinfo.BuildInfo, ...]]:
+        """The entries that build for each architecture, including ``all``."""
+        return self._index_by("build_for")
+
+    @functools.cached_property
+    def by_build_base(
+        self,
+    ) -> Mapping[_distro.DistroBase, Tuple[_buildinfo.BuildInfo, ...]]:
+        """The entries that build on each base."""
+        return self._index_by("build_base")
+
+    @property
+    def platforms(self) -> FrozenSet[str]:
+        """The distinct platform names in the plan."""
+        return frozenset(self.by_platform)
+
+    @property
+    def build_on_architectures(self) -> FrozenSet[_architectures.DebianArchitecture]:
+        """The distinct architectures that the plan builds on."""
+        return frozenset(self.by_build_on)
+
+    @property
+    def build_for_architectures(self) -> FrozenSet[_BuildFor]:
+        """The distinct architectures that the plan builds for."""
+        return frozenset(self.by_build_for)
+
+    @property
+    def build_bases(self) -> FrozenSet[_distro.DistroBase]:
+        """The distinct bases that the plan builds on."""
+        return frozenset(self.by_build_base)
+
+    @functools.cached_property
+    def _composite_indexes(
+        self,
+    ) -> Dict[Tuple[str, ...], Dict[Tuple[Any, ...], Tuple[_buildinfo.BuildInfo, ...]]]:
+        return {}
+
+    def get(
+        self,
+        *,
+        platform: Optional[str] = None,
+        build_on: Optional[Union[_architectures.DebianArchitecture, str]] = None,
+        build_for: Optional[Union[_BuildFor, str]] = None,
+        build_base: Optional[_distro.DistroBase] = None,
+    ) -> Tuple[_buildinfo.BuildInfo, ...]:
+        """Get the entries that match every given criterion.
+
+        The first query for a combination of criteria builds an index for that
+        combination, so later queries for it take constant time.
+
+        :param platform: The platform name to match.
+        :param build_on: The architecture to build on.
+        :param build_for: The architecture to build for, which may be ``all``.
+        :param build_base: The base to build on.
+        :returns: The matching entries, in plan order.
+        """
+        criteria = {
+            "platform": platform,
+            "build_on": build_on,
+            "build_for": build_for,
+            "build_base": build_base,
+        }
+        fields = tuple(field for field in _FIELDS if criteria[field] is not None)
+        if not fields:
+            return self._entries
+        if len(fields) == 1:
+            (field,) = fields
+            return getattr(self, f"by_{field}").get(criteria[field], ())
+
+        index = self._composite_indexes.get(fields)
+        if index is None:
+            entries: Dict[Tuple[Any, ...], List[_buildinfo.BuildInfo]] = (
+                collections.defaultdict(list)
+            )
+            for info in self._entries:
+                entries[tuple(getattr(info, field) for field in fields)].append(info)
+            index = {key: tuple(value) for key, value in entries.items()}
+            self._composite_indexes[fields] = index
+        return index.get(tuple(criteria[field] for field in fields), ())
+
+
+def _from_bytes(cls: Type[BuildPlan], data: bytes) -> BuildPlan:
+    """Unpickle a build plan."""
+    return cls(_serialize.build_plan_from_bytes(data))
@@ -0,0 +1,79 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Internal caches and their statistics."""
+
+import functools
+from typing import Any, Callable, Dict, NamedTuple, Optional, TypeVar, cast
+
+_CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a cache."""
+
+    hits: int
+    """The number of lookups that were answered from the cache."""
+
+    misses: int
+    """The number of lookups that had to compute a new value."""
+
+    maxsize: Optional[int]
+    """The maximum number of entries in the cache, or ``None`` if unbounded."""
+
+    currsize: int
+    """The number of entries currently in the cache."""
+
+
+_CACHES: Dict[str, Any] = {}
+
+
+def lru_cache(name: str, maxsize: int) -> Callable[[_CallableT], _CallableT]:
+    """Wrap a function in a bounded LRU cache that is registered by name.
+
+    :param name: The name under which the cache's statistics are reported.
+    :param maxsize: The maximum number of entries to keep.
+    """
+
+    def decorator(func: _CallableT) -> _CallableT:
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+        _CACHES[name] = cached
+        return cast(_CallableT, cached)
+
+    return decorator
+
+
+def register(name: str, cache: Any) -> None:  # noqa: ANN401 (any cache-like object)
+    """Register a cache that isn't a function cache.
+
+    :param name: The name under which the cache's statistics are reported.
+    :param cache: An object with the ``cache_info()`` and ``cache_clear()`` methods of
+        a :func:`functools.lru_cache` wrapper.
+    """
+    _CACHES[name] = cache
+
+
+def get_cache_info() -> Dict[str, CacheInfo]:
+    """Get the statistics of each of craft-platforms' internal caches.
+
+    :returns: A dictionary mapping each cache's name to its statistics.
+    """
+    return {name: CacheInfo(*cache.cache_info()) for name, cache in _CACHES.items()}
+
+
+def clear_caches() -> None:
+    """Clear all of craft-platforms' internal caches and their statistics."""
+    for cache in _CACHES.values():
+        cache.cache_clear()
@@ -0,0 +1,221 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""The ``craft-platforms`` command-line tool."""
+
+import argparse
+import concurrent.futures
+import itertools
+import json
+import os
+import pathlib
+import sys
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from craft_platforms import _batch
+
+_YAML_SUFFIXES = (".yaml", ".yml")
+_APP_SUFFIX = "craft"
+
+Project = Tuple[str, Dict[str, Any]]
+
+
+def _infer_app(path: pathlib.Path) -> Optional[str]:
+    """Get the app from a project file's name, such as ``snapcraft.yaml``."""
+    if path.suffix not in _YAML_SUFFIXES:
+        return None
+    stem = path.stem.lstrip(".")
+    return stem if stem.endswith(_APP_SUFFIX) else None
+
+
+def _error_record(exc: BaseException) -> Dict[str, Any]:
+    record: Dict[str, Any] = {"error": type(exc).__name__, "message": str(exc)}
+    resolution = getattr(exc, "resolution", None)
+    if resolution:
+        record["resolution"] = resolution
+    return record
+
+
+class _Planner:
+    """Read projects, plan them and write each result as a line of JSON."""
+
+    def __init__(self, out: IO[str], app: Optional[str]) -> None:
+        self._out = out
+        self._app = app
+        # Keyed by the index that get_build_plans gives each project, which counts
+        # up in the order the projects are consumed.
+        self._sources: Dict[int, str] = {}
+        self._indexes = itertools.count()
+        self.failed = False
+
+    def write(self, source: str, app: Optional[str], record: Dict[str, Any]) -> None:
+        if "error" in record:
+            self.failed = True
+        self._out.write(json.dumps({"source": source, "app": app, **record}) + "\n")
+
+    def _add(
+        self,
+        source: str,
+        app: Optional[str],
+        project: Any,  # noqa: ANN401 (any parsed document)
+    ) -> Iterator[Project]:
+        if app is None:
+            self.write(
+                source,
+                app,
+                {
+                    "error": "UsageError",
+                    "message": "Could not determine the app for the project.",
+                    "resolution": "Name the file after the app or use '--app'.",
+                },
+            )
+        elif not isinstance(project, dict):
+            self.write(
+                source,
+                app,
+                {"error": "UsageError", "message": "The project isn't a mapping."},
+            )
+        else:
+            self._sources[next(self._indexes)] = source
+            yield app, project
+
+    def iter_files(self, paths: Sequence[str]) -> Iterator[Project]:
+        for name in paths:
+            path = pathlib.Path(name)
+            app = self._app or _infer_app(path)
+            try:
+                with path.open(encoding="utf-8") as file:
+                    project = _load_yaml(file)
+            except Exception as exc:  # noqa: BLE001 (reported as data)
+                self.write(name, app, _error_record(exc))
+                continue
+            yield from self._add(name, app, project)
+
+    def iter_records(self, stream: IO[str]) -> Iterator[Project]:
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            source = f"<stdin>:{line_number}"
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                self.write(source, self._app, _error_record(exc))
+                continue
+            if not isinstance(record, dict) or "project" not in record:
+                self.write(
+                    source,
+                    self._app,
+                    {
+                        "error": "UsageError",
+                        "message": "The record has no 'project'.",
+                    },
+                )
+                continue
+            source = str(record.get("id", source))
+            app = record.get("app", self._app)
+            yield from self._add(source, app, record["project"])
+
+    def plan(self, projects: Iterator[Project], **kwargs: Any) -> None:
+        for result in _batch.get_build_plans(projects, **kwargs):
+            source = self._sources.pop(result.index)
+            if result.error is not None:
+                self.write(source, result.app, _error_record(result.error))
+            else:
+                for info in result.build_plan or ():
+                    self.write(source, result.app, info.to_dict())
+            self._out.flush()
+
+
+def _load_yaml(file: IO[str]) -> Any:  # noqa: ANN401 (any YAML document)
+    import yaml  # noqa: PLC0415 (only needed for project files)
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(file, Loader=loader)  # noqa: S506 (a safe loader)
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="craft-platforms",
+        description="Plan builds of craft projects.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    plan = subparsers.add_parser(
+        "plan",
+        help="Get the build plans of projects.",
+        description=(
+            "Get the build plans of project files, or of NDJSON records on stdin with "
+            "a 'project' and optionally an 'app' and an 'id'. Each build plan entry "
+            "and each error is written to stdout as a line of JSON as soon as its "
+            "project is planned, so lines may be out of order."
+        ),
+    )
+    plan.add_argument(
+        "paths",
+        nargs="*",
+        metavar="PATH",
+        help="Project files to plan. Reads NDJSON from stdin if none are given.",
+    )
+    plan.add_argument(
+        "--app",
+        help="The app to plan for. Defaults to the name of each file, such as "
+        "'snapcraft' for 'snapcraft.yaml'.",
+    )
+    plan.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="The number of projects to plan in parallel. Defaults to the number "
+        "of CPUs.",
+    )
+    plan.add_argument(
+        "--strict-platform-names",
+        action="store_true",
+        help="Strictly validate platform names.",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the ``craft-platforms`` command.
+
+    :param argv: The command-line arguments, excluding the program name. Defaults
+        to :data:`sys.argv`.
+    :returns: The exit code: ``0`` if every project was planned, ``1`` if any
+        project failed.
+    """
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    planner = _Planner(sys.stdout, args.app)
+    if args.paths:
+        try:
+            import yaml  # noqa: F401, PLC0415 (checking it's installed)
+        except ImportError:
+            parser.error("Planning project files requires craft-platforms[yaml].")
+        projects = planner.iter_files(args.paths)
+    else:
+        projects = planner.iter_records(sys.stdin)
+
+    kwargs: Dict[str, Any] = {"strict_platform_names": args.strict_platform_names}
+    if args.jobs == 1:
+        # Skip the cost of starting a worker process.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            planner.plan(projects, executor=executor, max_workers=1, **kwargs)
+    else:
+        planner.plan(projects, max_workers=args.jobs, **kwargs)
+    return 1 if planner.failed else 0
@@ -0,0 +1,187 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Incremental build planning."""
+
+import collections
+import dataclasses
+from typing import Any, Counter, Dict, Iterable, List, Optional, Sequence
+
+from craft_platforms import _build, _buildinfo, _platforms, validators
+
+PLAN_WIDE_KEYS = ("base", "build-base", "type", "bases")
+"""Project keys that affect every platform, so changing any of them replans all."""
+
+_ALLOW_ALL_AND_ARCHITECTURE_DEPENDENT: Dict[str, Optional[bool]] = {
+    "charmcraft": None,
+    "debcraft": True,
+}
+"""How each app validates ``build-for: all`` across its plan.
+
+``None`` means the app doesn't validate it. Apps that aren't listed use the generic
+rules, which don't allow architecture-dependent builds alongside ``build-for: all``.
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class BuildPlanDelta:
+    """The difference between a project's previous and current build plans."""
+
+    build_plan: Sequence[_buildinfo.BuildInfo]
+    """The complete current build plan."""
+
+    added: Sequence[_buildinfo.BuildInfo]
+    """Entries in the current build plan that weren't in the previous plan."""
+
+    removed: Sequence[_buildinfo.BuildInfo]
+    """Entries in the previous build plan that are no longer in the current plan."""
+
+    unchanged: Sequence[_buildinfo.BuildInfo]
+    """Entries that are in both build plans."""
+
+    @property
+    def changed(self) -> bool:
+        """Whether the build plan has changed."""
+        return bool(self.added or self.removed)
+
+
+def _diff(
+    previous: Iterable[_buildinfo.BuildInfo], current: Sequence[_buildinfo.BuildInfo]
+) -> BuildPlanDelta:
+    """Compare two build plans, treating each as a multiset of entries."""
+    remaining: Counter[_buildinfo.FrozenBuildInfo] = collections.Counter(
+        _buildinfo.FrozenBuildInfo.from_build_info(info) for info in previous
+    )
+    added: List[_buildinfo.BuildInfo] = []
+    unchanged: List[_buildinfo.BuildInfo] = []
+    for info in current:
+        key = _buildinfo.FrozenBuildInfo.from_build_info(info)
+        if remaining[key] > 0:
+            remaining[key] -= 1
+            unchanged.append(info)
+        else:
+            added.append(info)
+    removed = [key.to_build_info() for key in remaining.elements()]
+    return BuildPlanDelta(
+        build_plan=current, added=added, removed=removed, unchanged=unchanged
+    )
+
+
+def _needs_full_plan(
+    previous_project_data: Dict[str, Any], project_data: Dict[str, Any]
+) -> bool:
+    """Determine whether a change affects more than the changed platforms."""
+    if any(
+        previous_project_data.get(key) != project_data.get(key)
+        for key in PLAN_WIDE_KEYS
+    ):
+        return True
+    previous_platforms = previous_project_data.get("platforms")
+    platforms = project_data.get("platforms")
+    # Without a platforms mapping, the planners fall back to per-app defaults.
+    return not (
+        isinstance(previous_platforms, dict)
+        and previous_platforms
+        and isinstance(platforms, dict)
+        and platforms
+    )
+
+
+def get_build_plan_delta(
+    app: str,
+    *,
+    previous_project_data: Dict[str, Any],
+    previous_build_plan: Iterable[_buildinfo.BuildInfo],
+    project_data: Dict[str, Any],
+    strict_platform_names: bool = False,
+    allow_app_characters: bool = False,
+) -> BuildPlanDelta:
+    """Get a project's build plan and how it differs from its previous build plan.
+
+    Only the platforms whose entries were added or changed are expanded again. The
+    entries for the remaining platforms are reused from the previous build plan.
+    If a key that affects every platform (``base``, ``build-base``, ``type`` or
+    ``bases``) changed, or either project doesn't declare platforms, the whole
+    project is planned again. In every case, the rules that span the whole plan
+    (such as ``build-for: all``) are checked against the new plan.
+
+    :param app: The name of the application (e.g. snapcraft, charmcraft, rockcraft)
+    :param previous_project_data: The project data that the previous plan was made
+        from.
+    :param previous_build_plan: The build plan for the previous project data, made
+        with the same app and options.
+    :param project_data: The current project data.
+    :param strict_platform_names: Whether to strictly validate all platform names.
+    :param allow_app_characters: Whether platform name validation allows characters
+        that are reserved for use by applications.
+    :returns: The current build plan and its differences from the previous plan.
+    :raises: The same errors as :func:`~craft_platforms.get_build_plan`.
+    """
+    previous_build_plan = list(previous_build_plan)
+    if _needs_full_plan(previous_project_data, project_data):
+        build_plan = _build.get_build_plan(
+            app,
+            project_data=project_data,
+            strict_platform_names=strict_platform_names,
+            allow_app_characters=allow_app_characters,
+        )
+        return _diff(previous_build_plan, list(build_plan))
+
+    previous_platforms: Dict[str, Any] = previous_project_data["platforms"]
+    platforms: Dict[str, Any] = project_data["platforms"]
+    if strict_platform_names:
+        validators.validate_strict_platform_names(
+            platforms, allow_app_characters=allow_app_characters
+        )
+
+    changed_platforms = {
+        name: platform
+        for name, platform in platforms.items()
+        if name not in previous_platforms or previous_platforms[name] != platform
+    }
+    changed_entries: Dict[str, List[_buildinfo.BuildInfo]] = collections.defaultdict(
+        list
+    )
+    if changed_platforms:
+        # Plan the changed platforms on their own. Validation of a subset of the
+        # platforms only fails where validating all of them would.
+        for info in _build.get_build_plan(
+            app, project_data={**project_data, "platforms": changed_platforms}
+        ):
+            changed_entries[info.platform].append(info)
+
+    previous_entries: Dict[str, List[_buildinfo.BuildInfo]] = collections.defaultdict(
+        list
+    )
+    for info in previous_build_plan:
+        previous_entries[info.platform].append(info)
+
+    build_plan: List[_buildinfo.BuildInfo] = []
+    for name in platforms:
+        if name in changed_platforms:
+            build_plan.extend(changed_entries[name])
+        else:
+            build_plan.extend(previous_entries[name])
+
+    allow_all = _ALLOW_ALL_AND_ARCHITECTURE_DEPENDENT.get(app, False)
+    if allow_all is not None:
+        validator = _platforms.BuildForAllValidator(
+            allow_all_and_architecture_dependent=allow_all
+        )
+        for info in build_plan:
+            validator.add(info.platform, info.build_for)
+        validator.validate()
+
+    return _diff(previous_build_plan, build_plan)
@@ -17,13 +17,20 @@
 
 from __future__ import annotations
 
-import contextlib
 import dataclasses
+import functools
+import os
 import typing
-from typing import List, Union, cast
+from typing import Any, List, SupportsIndex, Union, cast
 
-import distro
-from typing_extensions import Self
+from craft_platforms import _cache
+
+if typing.TYPE_CHECKING:
+    import distro
+    from typing_extensions import Self
+
+BASE_CACHE_SIZE = 1024
+"""The maximum number of parsed base strings to keep."""
 
 
 @typing.runtime_checkable
@@ -41,14 +48,35 @@ class BaseName(typing.Protocol):
     def version(self) -> str: ...
 
 
-def _get_series_tuple(version_str: str) -> tuple[Union[int, str], ...]:
-    """Convert a version string into a version tuple."""
-    parts = typing.cast(List[Union[str, int]], version_str.split("."))
+SeriesKey = typing.Tuple[typing.Tuple[int, Union[int, str]], ...]
+"""A sortable key for a distribution series.
+
+Each dot-separated part of the series is a ``(kind, value)`` pair, where numeric
+parts have kind ``0`` and are compared as integers. Other parts have kind ``1`` and
+are compared as strings.
+"""
+
+_DEVEL_SERIES_KEY: SeriesKey = ((2, ""),)
+"""The key for the ``devel`` series, which sorts after every other series."""
+
+
+def _get_series_key(version_str: str) -> SeriesKey:
+    """Convert a version string into a sortable series key."""
+    if version_str == "devel":
+        return _DEVEL_SERIES_KEY
+    key: List[tuple[int, Union[int, str]]] = []
     # Try converting each part to an integer, leaving as a string if not doable.
-    for idx, part in enumerate(parts):
-        with contextlib.suppress(ValueError):
-            parts[idx] = int(part)
-    return tuple(parts)
+    for part in version_str.split("."):
+        try:
+            key.append((0, int(part)))
+        except ValueError:  # noqa: PERF203 (not a hot path; the result is cached)
+            key.append((1, part))
+    return tuple(key)
+
+
+def _is_numeric_series_key(key: SeriesKey) -> bool:
+    """Determine whether every part of a series key is numeric."""
+    return all(kind == 0 for kind, _ in key)
 
 
 def _get_distro(base: Union[DistroBase, BaseName] | tuple[str, str]) -> str:
@@ -121,90 +149,100 @@ class DistroBase:  # noqa: PLW1641 (https://github.com/astral-sh/ruff/issues/189
             )
         )
 
+    @functools.cached_property
+    def _series_key(self) -> SeriesKey:
+        return _get_series_key(self.series)
+
+    @functools.cached_property
+    def _series_is_numeric(self) -> bool:
+        return _is_numeric_series_key(self._series_key)
+
+    @functools.cached_property
+    def sort_key(self) -> tuple[str, SeriesKey]:
+        """A precomputed key that gives a total ordering of distribution bases.
+
+        Bases are ordered by distribution name and then by series, with ``devel``
+        after every other series. Within a distribution this matches the comparison
+        operators wherever they're defined, but the key never raises, so it can be
+        used to sort a mixture of distributions::
+
+            sorted(bases, key=operator.attrgetter("sort_key"))
+        """
+        return (self.distribution, self._series_key)
+
+    def _get_comparison_keys(
+        self, other: DistroBase | BaseName | tuple[str, str]
+    ) -> tuple[SeriesKey, SeriesKey]:
+        """Get the series keys to compare with another base.
+
+        :raises: ValueError if the bases are not comparable.
+        """
+        self._ensure_bases_comparable(other)
+        self_key = self._series_key
+        if isinstance(other, DistroBase):
+            # Accessing another instance of the same class.
+            other_key = other._series_key  # noqa: SLF001
+            both_numeric = (
+                self._series_is_numeric and other._series_is_numeric  # noqa: SLF001
+            )
+        else:
+            other_key = _get_series_key(_get_series(other))
+            both_numeric = self._series_is_numeric and _is_numeric_series_key(other_key)
+        if (
+            not both_numeric
+            and self_key is not _DEVEL_SERIES_KEY
+            and other_key is not _DEVEL_SERIES_KEY
+            and any(left[0] != right[0] for left, right in zip(self_key, other_key))
+        ):
+            raise ValueError(f"{self} and {other} are incompatible for comparison.")
+        return self_key, other_key
+
     def __lt__(self, other: object) -> bool:
         if not _is_distrobase_compatible(other):
             return NotImplemented
-        other = cast("DistroBase | BaseName | tuple[str, str]", other)
-        self._ensure_bases_comparable(other)
-        other_version = _get_series(other)
-        if self.series == "devel" or other_version == "devel":
-            return self.series != "devel" and other_version == "devel"
-        self_version_tuple = _get_series_tuple(self.series)
-        other_version_tuple = _get_series_tuple(other_version)
-
-        if not self._compare_precheck(self_version_tuple, other_version_tuple):
-            raise ValueError(f"{self} and {other} are incompatible for comparison.")
-        return self_version_tuple < other_version_tuple  # ty: ignore[unsupported-operator], checked above
+        self_key, other_key = self._get_comparison_keys(
+            cast("DistroBase | BaseName | tuple[str, str]", other)
+        )
+        return self_key < other_key  # ty: ignore[unsupported-operator], checked above
 
     def __le__(self, other: object) -> bool:
         if not _is_distrobase_compatible(other):
             return NotImplemented
-        other = cast("DistroBase | BaseName | tuple[str, str]", other)
-        self._ensure_bases_comparable(other)
-        other_version = _get_series(other)
-        if self.series == "devel" or other_version == "devel":
-            return other_version == "devel"
-        self_version_tuple = _get_series_tuple(self.series)
-        other_version_tuple = _get_series_tuple(other_version)
-
-        if not self._compare_precheck(self_version_tuple, other_version_tuple):
-            raise ValueError(f"{self} and {other} are incompatible for comparison.")
-        return self_version_tuple <= other_version_tuple  # ty: ignore[unsupported-operator], checked above
+        self_key, other_key = self._get_comparison_keys(
+            cast("DistroBase | BaseName | tuple[str, str]", other)
+        )
+        return self_key <= other_key  # ty: ignore[unsupported-operator], checked above
 
     def __gt__(self, other: object) -> bool:
         if not _is_distrobase_compatible(other):
             return NotImplemented
-        other = cast("DistroBase | BaseName | tuple[str, str]", other)
-        self._ensure_bases_comparable(other)
-        other_version = _get_series(other)
-        if self.series == "devel" or other_version == "devel":
-            return other_version != "devel"
-        self_version_tuple = _get_series_tuple(self.series)
-        other_version_tuple = _get_series_tuple(other_version)
-
-        if not self._compare_precheck(self_version_tuple, other_version_tuple):
-            raise ValueError(f"{self} and {other} are incompatible for comparison.")
-        return self_version_tuple > other_version_tuple  # ty: ignore[unsupported-operator], checked above
+        self_key, other_key = self._get_comparison_keys(
+            cast("DistroBase | BaseName | tuple[str, str]", other)
+        )
+        return self_key > other_key  # ty: ignore[unsupported-operator], checked above
 
     def __ge__(self, other: object) -> bool:
         if not _is_distrobase_compatible(other):
             return NotImplemented
-        other = cast("DistroBase | BaseName | tuple[str, str]", other)
-        self._ensure_bases_comparable(other)
-        other_version = _get_series(other)
-        if self.series == "devel" or other_version == "devel":
-            return self.series == "devel"
-        self_version_tuple = _get_series_tuple(self.series)
-        other_version_tuple = _get_series_tuple(_get_series(other))
-
-        if not self._compare_precheck(self_version_tuple, other_version_tuple):
-            raise ValueError(f"{self} and {other} are incompatible for comparison.")
-        return self_version_tuple >= other_version_tuple  # ty: ignore[unsupported-operator], checked above
-
-    @classmethod
-    def _compare_precheck(
-        cls, lhs: tuple[int | str, ...], rhs: tuple[int | str, ...]
-    ) -> bool:
-        return all(type(left) is type(right) for left, right in zip(lhs, rhs))
+        self_key, other_key = self._get_comparison_keys(
+            cast("DistroBase | BaseName | tuple[str, str]", other)
+        )
+        return self_key >= other_key  # ty: ignore[unsupported-operator], checked above
 
     @classmethod
     def from_str(cls, base_str: str) -> Self:
         """Parse a distribution string to a DistroBase.
 
+        Parsed bases are cached, so parsing the same string again returns the same
+        (immutable) instance.
+
         :param base_str: A distribution string (e.g. "ubuntu@24.04")
         :returns: A DistroBase of this string.
         :raises: ValueError if the string isn't of the appropriate format.
         """
-        # "devel" is an exception and corresponds to `ubuntu@devel`
-        if base_str == "devel":
-            return cls("ubuntu", "devel")
-
-        if base_str.count("@") != 1:
-            raise ValueError(
-                f"Invalid base string {base_str!r}. Format should be '<distribution>@<series>'",
-            )
-        distribution, _, series = base_str.partition("@")
-        return cls(distribution, series)
+        if cls is DistroBase:
+            return cast("Self", _base_from_str(base_str))
+        return cls(*_split_base_str(base_str))
 
     @classmethod
     def from_linux_distribution(cls, distribution: distro.LinuxDistribution) -> Self:
@@ -218,10 +256,67 @@ class DistroBase:  # noqa: PLW1641 (https://github.com/astral-sh/ruff/issues/189
     def __str__(self) -> str:
         return f"{self.distribution}@{self.series}"
 
+    def __reduce_ex__(self, protocol: SupportsIndex) -> str | tuple[Any, ...]:
+        if type(self) is not DistroBase:
+            # Subclasses may have fields of their own.
+            return super().__reduce_ex__(protocol)
+        # Leave out the cached properties, which are cheaper to recompute than to
+        # pickle.
+        return (DistroBase, (self.distribution, self.series))
+
     @classmethod
     def from_host(cls) -> Self:
-        """Get the Linux distribution where this process is running."""
-        return cls.from_linux_distribution(distro.LinuxDistribution())
+        """Get the Linux distribution where this process is running.
+
+        The host is probed once and the result cached until its os-release file
+        changes. See :func:`~craft_platforms.get_host_info`.
+        """
+        from craft_platforms import _host  # noqa: PLC0415 (circular import)
+
+        base = _host.get_host_info().base
+        if cls is DistroBase:
+            return cast("Self", base)
+        return cls(base.distribution, base.series)
+
+    @classmethod
+    def from_root(cls, root: Union[str, os.PathLike[str]]) -> Self:
+        """Get the Linux distribution installed in a root filesystem.
+
+        Only the root's ``etc/os-release`` or ``usr/lib/os-release`` file is read,
+        with symbolic links followed inside the root. Use
+        :func:`~craft_platforms.get_root_bases` to scan many roots at once.
+
+        :param root: The root directory of the filesystem, such as a chroot or an
+            extracted image.
+        :returns: The DistroBase of the root filesystem.
+        :raises: ValueError if the root has no os-release file or the file doesn't
+            set both ``ID`` and ``VERSION_ID``.
+        """
+        from craft_platforms import _os_release  # noqa: PLC0415 (circular import)
+
+        base = _os_release.base_from_root(root)
+        if cls is DistroBase:
+            return cast("Self", base)
+        return cls(base.distribution, base.series)
+
+
+def _split_base_str(base_str: str) -> tuple[str, str]:
+    """Split a distribution string into its distribution and series."""
+    # "devel" is an exception and corresponds to `ubuntu@devel`
+    if base_str == "devel":
+        return "ubuntu", "devel"
+
+    if base_str.count("@") != 1:
+        raise ValueError(
+            f"Invalid base string {base_str!r}. Format should be '<distribution>@<series>'",
+        )
+    distribution, _, series = base_str.partition("@")
+    return distribution, series
+
+
+@_cache.lru_cache("distro_base", maxsize=BASE_CACHE_SIZE)
+def _base_from_str(base_str: str) -> DistroBase:
+    return DistroBase(*_split_base_str(base_str))
 
 
 def is_ubuntu_like(distribution: Union[distro.LinuxDistribution, None] = None) -> bool:
@@ -231,7 +326,9 @@ def is_ubuntu_like(distribution: Union[distro.LinuxDistribution, None] = None) -
     :returns: A boolean noting whether the given distribution is Ubuntu or Ubuntu-like.
     """
     if distribution is None:
-        distribution = distro.LinuxDistribution()
+        from craft_platforms import _host  # noqa: PLC0415 (circular import)
+
+        return _host.get_host_info().is_ubuntu_like
     if distribution.id() == "ubuntu":
         return True
     distros_like = distribution.like().split()
@@ -0,0 +1,108 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Grouping of build plan entries by the environment they build in."""
+
+from typing import Dict, Hashable, Iterable, List, Mapping, NamedTuple, Tuple, TypeVar
+
+from craft_platforms import _architectures, _buildinfo, _distro
+
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+
+
+class BuildEnvironment(NamedTuple):
+    """The environment that a build plan entry builds in.
+
+    Entries with the same build environment can share a build instance.
+    """
+
+    build_base: _distro.DistroBase
+    """The base of the build instance."""
+
+    build_on: _architectures.DebianArchitecture
+    """The architecture of the build instance."""
+
+    @classmethod
+    def from_build_info(cls, info: _buildinfo.BuildInfo) -> "BuildEnvironment":
+        """Get the build environment of a build plan entry."""
+        return cls(info.build_base, info.build_on)
+
+
+def group_by_build_environment(
+    build_plan: Iterable[_buildinfo.BuildInfo],
+) -> Dict[BuildEnvironment, List[_buildinfo.BuildInfo]]:
+    """Group the entries of a build plan by their build environment.
+
+    Groups are in the order their environments first appear in the build plan, and
+    each group keeps the plan order of its entries. Bases are grouped by their exact
+    series, so ``ubuntu@22.04`` and ``ubuntu@22.04.1`` are separate environments.
+
+    This works with any build plan, including legacy ``bases`` charm build plans.
+
+    :param build_plan: The entries to group.
+    :returns: A dictionary of the entries that build in each environment.
+    """
+    groups: Dict[BuildEnvironment, List[_buildinfo.BuildInfo]] = {}
+    for info in build_plan:
+        environment = BuildEnvironment.from_build_info(info)
+        group = groups.get(environment)
+        if group is None:
+            groups[environment] = [info]
+        else:
+            group.append(info)
+    return groups
+
+
+def order_by_build_environment(
+    build_plan: Iterable[_buildinfo.BuildInfo],
+) -> List[_buildinfo.BuildInfo]:
+    """Reorder a build plan so that entries with the same environment are adjacent.
+
+    Building the entries in this order needs only one build instance per
+    environment, each used for a single run of builds.
+
+    :param build_plan: The entries to order.
+    :returns: The entries, grouped as in :func:`group_by_build_environment`.
+    """
+    return [
+        info
+        for group in group_by_build_environment(build_plan).values()
+        for info in group
+    ]
+
+
+def group_build_plans_by_build_environment(
+    build_plans: Mapping[_KeyT, Iterable[_buildinfo.BuildInfo]],
+) -> Dict[BuildEnvironment, List[Tuple[_KeyT, _buildinfo.BuildInfo]]]:
+    """Group the entries of several build plans by their build environment.
+
+    This allows a build instance to be shared between projects. Groups are in the
+    order their environments first appear, taking the build plans in order, and each
+    group keeps the order of its entries.
+
+    :param build_plans: The build plans to group, keyed by an identifier such as a
+        project name.
+    :returns: A dictionary of ``(key, entry)`` pairs that build in each environment.
+    """
+    groups: Dict[BuildEnvironment, List[Tuple[_KeyT, _buildinfo.BuildInfo]]] = {}
+    for key, build_plan in build_plans.items():
+        for info in build_plan:
+            environment = BuildEnvironment.from_build_info(info)
+            group = groups.get(environment)
+            if group is None:
+                groups[environment] = [(key, info)]
+            else:
+                group.append((key, info))
+    return groups
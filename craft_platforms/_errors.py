@@ -15,10 +15,22 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Error classes for craft-platforms."""
 
+import contextlib
 import dataclasses
 import os
 import typing
-from typing import Collection, Iterable, Literal, Optional
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+)
 
 # Workaround for Windows...
 EX_DATAERR = getattr(os, "EX_DATAERR", 65)
@@ -101,6 +113,20 @@ class CraftPlatformsError(Exception):  # noqa: PLW1641 (https://github.com/astra
             return True
         return NotImplemented
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Subclasses have their own __init__ signatures, so rebuild from the
+        # instance state rather than calling __init__ again with ``self.args``.
+        return (_restore_error, (type(self), self.args, self.__dict__))
+
+
+def _restore_error(
+    cls: Type[CraftPlatformsError], args: Tuple[Any, ...], state: Dict[str, Any]
+) -> CraftPlatformsError:
+    """Restore a pickled CraftPlatformsError without calling its __init__."""
+    error = cls.__new__(cls, *args)
+    error.__dict__.update(state)
+    return error
+
 
 class EmptyBuildError(CraftPlatformsError, ValueError):
     """Errors where either build-on or build-for is empty."""
@@ -279,3 +305,35 @@ class RequiresBaseError(CraftPlatformsError, ValueError):
 
 class InvalidMultiBaseError(CraftPlatformsError, ValueError):
     """Error when a multi-base configuration is invalid."""
+
+
+PROJECT_ERRORS = (
+    CraftPlatformsError,
+    ValueError,
+    LookupError,
+    TypeError,
+    NotImplementedError,
+)
+"""Exceptions that the planners raise for an invalid project.
+
+Besides :class:`~craft_platforms.CraftPlatformsError`, the planners raise built-in
+exceptions for malformed project data (for example, an unknown architecture string or
+a platform missing its ``build-on`` key). When collecting errors, the planners record
+these as problems with a platform and carry on with the others.
+"""
+
+
+@contextlib.contextmanager
+def collect_errors(
+    errors: List[Exception],
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+) -> Generator[None, None, None]:
+    """Append an error raised in the block to a list rather than raising it.
+
+    :param errors: The list to append the error to.
+    :param exceptions: The exceptions to collect. Others are raised.
+    """
+    try:
+        yield
+    except exceptions as exc:
+        errors.append(exc)
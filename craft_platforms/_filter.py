@@ -0,0 +1,154 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Filters applied while a build plan is generated."""
+
+import dataclasses
+from typing import (
+    Callable,
+    FrozenSet,
+    Iterable,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from craft_platforms import _architectures, _buildinfo, _distro
+
+_T = TypeVar("_T")
+
+ArchitectureCriteria = Union[
+    _architectures.DebianArchitecture,
+    str,
+    Iterable[Union[_architectures.DebianArchitecture, str]],
+]
+"""One architecture or a collection of architectures, as enum members or strings."""
+
+
+def _as_tuple(value: Union[_T, Iterable[_T]]) -> Tuple[_T, ...]:
+    if isinstance(value, (str, _distro.DistroBase)):
+        return cast(Tuple[_T, ...], (value,))
+    return tuple(cast(Iterable[_T], value))
+
+
+def _to_architectures(
+    value: ArchitectureCriteria,
+) -> FrozenSet[Union[_architectures.DebianArchitecture, Literal["all"]]]:
+    return frozenset(
+        "all" if arch == "all" else _architectures.DebianArchitecture(arch)
+        for arch in _as_tuple(value)
+    )
+
+
+@dataclasses.dataclass(frozen=True, init=False)
+class BuildPlanFilter:
+    """Criteria that select entries of a build plan as it's generated.
+
+    The planners check the criteria while they expand each platform, so entries that
+    don't match are never created and platforms that can't match aren't expanded.
+    Each criterion that is set must match. Filtering never changes how the project
+    is validated: an invalid project raises the same error with or without a filter.
+
+    :param build_on: The architectures to build on.
+    :param build_for: The architectures to build for, which may include ``"all"``.
+    :param platform: The names of the platforms to build.
+    :param build_base: The bases to build on.
+    :param predicate: A function called with each remaining entry, which is kept
+        only if the function returns ``True``.
+    :raises ValueError: If an architecture isn't a valid Debian architecture.
+    """
+
+    build_on: Optional[FrozenSet[_architectures.DebianArchitecture]]
+    """The architectures to build on, or ``None`` to build on any."""
+
+    build_for: Optional[
+        FrozenSet[Union[_architectures.DebianArchitecture, Literal["all"]]]
+    ]
+    """The architectures to build for, or ``None`` to build for any."""
+
+    platform: Optional[FrozenSet[str]]
+    """The names of the platforms to build, or ``None`` to build any."""
+
+    build_base: Optional[Tuple[_distro.DistroBase, ...]]
+    """The bases to build on, or ``None`` to build on any."""
+
+    predicate: Optional[Callable[[_buildinfo.BuildInfo], bool]]
+    """An arbitrary check for each entry, or ``None`` to keep every entry."""
+
+    def __init__(
+        self,
+        *,
+        build_on: Optional[ArchitectureCriteria] = None,
+        build_for: Optional[ArchitectureCriteria] = None,
+        platform: Union[str, Iterable[str], None] = None,
+        build_base: Union[
+            _distro.DistroBase, Iterable[_distro.DistroBase], None
+        ] = None,
+        predicate: Optional[Callable[[_buildinfo.BuildInfo], bool]] = None,
+    ) -> None:
+        if build_on is not None:
+            on_archs = _to_architectures(build_on)
+            if "all" in on_archs:
+                raise ValueError("Cannot build on 'all'.")
+            object.__setattr__(self, "build_on", on_archs)
+        else:
+            object.__setattr__(self, "build_on", None)
+        object.__setattr__(
+            self,
+            "build_for",
+            None if build_for is None else _to_architectures(build_for),
+        )
+        object.__setattr__(
+            self,
+            "platform",
+            None if platform is None else frozenset(_as_tuple(platform)),
+        )
+        object.__setattr__(
+            self,
+            "build_base",
+            None if build_base is None else _as_tuple(build_base),
+        )
+        object.__setattr__(self, "predicate", predicate)
+
+    def matches_platform(self, name: str) -> bool:
+        """Determine whether any entry of a platform can match."""
+        return self.platform is None or name in self.platform
+
+    def matches_build_base(self, base: _distro.DistroBase) -> bool:
+        """Determine whether entries that build on a base can match."""
+        return self.build_base is None or base in self.build_base
+
+    def matches_build_on(self, arch: _architectures.DebianArchitecture) -> bool:
+        """Determine whether entries that build on an architecture can match."""
+        return self.build_on is None or arch in self.build_on
+
+    def matches_build_for(
+        self, arch: Union[_architectures.DebianArchitecture, str]
+    ) -> bool:
+        """Determine whether entries that build for an architecture can match."""
+        return self.build_for is None or arch in self.build_for
+
+    def __call__(self, info: _buildinfo.BuildInfo) -> bool:
+        """Determine whether a build plan entry matches every criterion."""
+        return (
+            self.matches_platform(info.platform)
+            and self.matches_build_base(info.build_base)
+            and self.matches_build_on(info.build_on)
+            and self.matches_build_for(info.build_for)
+            and (self.predicate is None or self.predicate(info))
+        )
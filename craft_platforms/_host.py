@@ -0,0 +1,218 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Information about the host that craft-platforms is running on."""
+
+import contextlib
+import contextvars
+import dataclasses
+import pathlib
+import stat
+import threading
+from typing import Generator, Mapping, Optional, Tuple
+
+from craft_platforms import _architectures, _cache, _distro, _os_release
+
+OS_RELEASE_PATHS = (
+    pathlib.Path("/etc/os-release"),
+    pathlib.Path("/usr/lib/os-release"),
+)
+"""The locations of the os-release file, in order of precedence."""
+
+_OVERRIDE: "contextvars.ContextVar[Optional[HostInfo]]" = contextvars.ContextVar(
+    "craft_platforms_host_info", default=None
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class HostInfo:
+    """A snapshot of the host's distribution and architecture."""
+
+    base: _distro.DistroBase
+    """The base of the host."""
+
+    id_like: Tuple[str, ...] = ()
+    """The distributions that the host's distribution is derived from."""
+
+    architecture: Optional[_architectures.DebianArchitecture] = None
+    """The architecture of the host, or ``None`` if it isn't a Debian architecture."""
+
+    @property
+    def is_ubuntu_like(self) -> bool:
+        """Whether the host is Ubuntu or an Ubuntu derivative."""
+        return self.base.distribution == "ubuntu" or "ubuntu" in self.id_like
+
+    @classmethod
+    def from_os_release(
+        cls,
+        os_release: Mapping[str, str],
+        *,
+        architecture: Optional[_architectures.DebianArchitecture] = None,
+    ) -> Optional["HostInfo"]:
+        """Get the host information from the fields of an os-release file.
+
+        :param os_release: The fields of an os-release file, as returned by
+            :func:`~craft_platforms._os_release.parse_os_release`.
+        :param architecture: The architecture of the host.
+        :returns: The host information, or ``None`` if the fields don't include both
+            an ``ID`` and a ``VERSION_ID``.
+        """
+        base = _os_release.base_from_os_release(os_release)
+        if base is None:
+            return None
+        return cls(
+            base=base,
+            id_like=tuple(os_release.get("ID_LIKE", "").split()),
+            architecture=architecture,
+        )
+
+    @classmethod
+    def probe(cls, os_release_path: Optional[pathlib.Path] = None) -> "HostInfo":
+        """Get the host information from the running system.
+
+        The os-release file is parsed natively. If it is missing or lacks a version,
+        as on some rolling releases, the other release files are checked with the
+        distro package. No subprocesses are run.
+
+        :param os_release_path: The os-release file to read. Defaults to the first of
+            :data:`OS_RELEASE_PATHS` that exists.
+        :returns: The host information.
+        """
+        try:
+            architecture = _architectures.DebianArchitecture.from_host()
+        except ValueError:
+            architecture = None
+
+        if os_release_path is None:
+            os_release_path = _find_os_release()[0]
+        if os_release_path is not None:
+            os_release = _os_release.parse_os_release(
+                os_release_path.read_text(encoding="utf-8")
+            )
+            info = cls.from_os_release(os_release, architecture=architecture)
+            if info is not None:
+                return info
+
+        import distro  # noqa: PLC0415 (only imported when needed)
+
+        distribution = distro.LinuxDistribution(include_lsb=False, include_uname=False)
+        return cls(
+            base=_distro.DistroBase.from_linux_distribution(distribution),
+            id_like=tuple(distribution.like().split()),
+            architecture=architecture,
+        )
+
+
+_StatKey = Tuple[pathlib.Path, int, int, int, int]
+
+
+def _find_os_release() -> Tuple[Optional[pathlib.Path], Optional[_StatKey]]:
+    """Find the host's os-release file.
+
+    :returns: The path to the file and a key that changes when the file does, or
+        ``(None, None)`` if there is no os-release file.
+    """
+    for path in OS_RELEASE_PATHS:
+        try:
+            file_stat = path.stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(file_stat.st_mode):
+            return path, (
+                path,
+                file_stat.st_dev,
+                file_stat.st_ino,
+                file_stat.st_size,
+                file_stat.st_mtime_ns,
+            )
+    return None, None
+
+
+class _HostInfoCache:
+    """A cache of the host information, invalidated when os-release changes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._key: Optional[_StatKey] = None
+        self._info: Optional[HostInfo] = None
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, *, refresh: bool) -> HostInfo:
+        path, key = _find_os_release()
+        with self._lock:
+            info = self._info
+            if info is not None and not refresh and key == self._key:
+                self._hits += 1
+                return info
+        info = HostInfo.probe(path)
+        with self._lock:
+            self._key = key
+            self._info = info
+            self._misses += 1
+        return info
+
+    def cache_info(self) -> _cache.CacheInfo:
+        with self._lock:
+            return _cache.CacheInfo(
+                self._hits, self._misses, 1, int(self._info is not None)
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._key = None
+            self._info = None
+            self._hits = 0
+            self._misses = 0
+
+
+_HOST_INFO_CACHE = _HostInfoCache()
+_cache.register("host_info", _HOST_INFO_CACHE)
+
+
+def get_host_info(*, refresh: bool = False) -> HostInfo:
+    """Get information about the host.
+
+    The information is cached. The cache is checked against the os-release file on
+    each call, so an upgrade of the host is noticed without a restart.
+
+    :param refresh: Whether to probe the host even if the cached information is
+        still current.
+    :returns: The host information set with :func:`use_host_info` if there is any,
+        otherwise the information of the running system.
+    """
+    override = _OVERRIDE.get()
+    if override is not None:
+        return override
+    return _HOST_INFO_CACHE.get(refresh=refresh)
+
+
+@contextlib.contextmanager
+def use_host_info(host_info: HostInfo) -> Generator[HostInfo, None, None]:
+    """Use the given host information rather than probing the running system.
+
+    This affects :func:`get_host_info` and the functions that use it, such as
+    :meth:`DistroBase.from_host() <craft_platforms.DistroBase.from_host>`, in the
+    current thread or task. It allows planning for another host and keeps tests from
+    reading the host's files.
+
+    :param host_info: The host information to use.
+    :yields: The host information.
+    """
+    token = _OVERRIDE.set(host_info)
+    try:
+        yield host_info
+    finally:
+        _OVERRIDE.reset(token)
@@ -0,0 +1,413 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Opt-in timing of each stage of build planning.
+
+When no hook is installed, the planners do no more than check :data:`HOOKS`.
+"""
+
+import contextlib
+import contextvars
+import dataclasses
+import enum
+import functools
+import threading
+import time
+import types
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sized,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+_T = TypeVar("_T")
+
+
+class PlanningStage(str, enum.Enum):
+    """A stage of build planning."""
+
+    VALIDATE_NAMES = "validate_names"
+    """Strict validation of the platform names."""
+
+    RESOLVE_BASE = "resolve_base"
+    """Determining the build base from the project's base, build base or platform."""
+
+    EXPAND = "expand"
+    """Expanding each platform into build plan entries.
+
+    This is the planning time that isn't spent in any other stage.
+    """
+
+    VALIDATE_BUILD_FOR_ALL = "validate_build_for_all"
+    """Validating the ``build-for: all`` rules for the whole plan."""
+
+    PLANNER = "planner"
+    """A call to an eager app-specific planner, such as
+    :func:`~craft_platforms.charm.get_charm_build_plan`.
+
+    This contains every other stage except name validation.
+    """
+
+    PLAN = "plan"
+    """The whole of planning a project, including every other stage."""
+
+
+@dataclasses.dataclass(frozen=True)
+class StageEvent:
+    """The timing of a single stage of build planning."""
+
+    stage: PlanningStage
+    """The stage that ran."""
+
+    app: Optional[str]
+    """The app whose project was planned, or ``None`` if the stage ran outside of
+    :func:`~craft_platforms.get_build_plan` and
+    :func:`~craft_platforms.iter_build_plan`."""
+
+    duration: float
+    """The time the stage took, in seconds."""
+
+    count: int
+    """The number of items the stage handled.
+
+    This is the number of names validated for
+    :attr:`~PlanningStage.VALIDATE_NAMES`, the number of build plan entries for
+    :attr:`~PlanningStage.EXPAND`, :attr:`~PlanningStage.PLANNER` and
+    :attr:`~PlanningStage.PLAN` and ``1`` for the other stages.
+    """
+
+    start: float
+    """The value of :func:`time.perf_counter` when the stage started."""
+
+    details: Mapping[str, Any] = dataclasses.field(default_factory=dict)
+    """More information about the stage.
+
+    For :attr:`~PlanningStage.PLAN`, this has the project's ``name``, if it has one,
+    and its number of ``platforms``. For :attr:`~PlanningStage.PLANNER`, this has the
+    ``planner`` function's name and the number of ``platforms``.
+    """
+
+    error: Optional[Exception] = None
+    """The error raised by the planner, or ``None`` if it succeeded.
+
+    This is only set for :attr:`~PlanningStage.PLAN`.
+    """
+
+
+StageHook = Callable[[StageEvent], None]
+"""A function called with each :class:`StageEvent`."""
+
+HOOKS: Tuple[StageHook, ...] = ()
+"""The installed hooks. This is replaced rather than changed so it can be read
+without a lock."""
+
+_HOOKS_LOCK = threading.Lock()
+
+
+_NO_DETAILS: Mapping[str, Any] = types.MappingProxyType({})
+
+
+class _Planning:
+    """The running totals for a single call to a top-level planner."""
+
+    __slots__ = ("app", "nested")
+
+    def __init__(self, app: str) -> None:
+        self.app = app
+        self.nested = 0.0
+
+
+_CURRENT: "contextvars.ContextVar[Optional[_Planning]]" = contextvars.ContextVar(
+    "craft_platforms_planning", default=None
+)
+
+
+def add_stage_hook(hook: StageHook) -> None:
+    """Install a hook that's called with the timing of each stage of build planning.
+
+    Hooks are installed for the whole process and are called in the thread that's
+    planning, in the order they were installed. An error raised by a hook is raised
+    from the planner. Projects planned in other processes, such as by
+    :func:`~craft_platforms.get_build_plans`, don't call the hooks.
+
+    :param hook: A function called with a :class:`StageEvent` as each stage ends.
+    """
+    global HOOKS  # noqa: PLW0603 (replaced atomically for lock-free reads)
+    with _HOOKS_LOCK:
+        HOOKS = (*HOOKS, hook)
+
+
+def remove_stage_hook(hook: StageHook) -> None:
+    """Remove a hook installed with :func:`add_stage_hook`.
+
+    :param hook: The hook to remove.
+    :raises ValueError: If the hook isn't installed.
+    """
+    global HOOKS  # noqa: PLW0603 (replaced atomically for lock-free reads)
+    with _HOOKS_LOCK:
+        hooks = list(HOOKS)
+        hooks.remove(hook)
+        HOOKS = tuple(hooks)
+
+
+@contextlib.contextmanager
+def stage_hook(hook: StageHook) -> Generator[StageHook, None, None]:
+    """Install a stage hook for the duration of a ``with`` block.
+
+    :param hook: A function called with a :class:`StageEvent` as each stage ends.
+    :yields: The hook.
+    """
+    add_stage_hook(hook)
+    try:
+        yield hook
+    finally:
+        remove_stage_hook(hook)
+
+
+def _emit(
+    stage: PlanningStage,
+    app: Optional[str],
+    start: float,
+    duration: float,
+    count: int,
+    details: Mapping[str, Any] = _NO_DETAILS,
+    error: Optional[Exception] = None,
+) -> None:
+    event = StageEvent(
+        stage=stage,
+        app=app,
+        duration=duration,
+        count=count,
+        start=start,
+        details=details,
+        error=error,
+    )
+    for hook in HOOKS:
+        hook(event)
+
+
+def in_plan() -> bool:
+    """Determine whether a top-level planner is already being timed."""
+    return _CURRENT.get() is not None
+
+
+def timed(
+    stage: PlanningStage, func: Callable[..., _T], *, count: int = 1
+) -> Callable[..., _T]:
+    """Wrap a function to report each call to it as a stage.
+
+    :param stage: The stage that the function performs.
+    :param func: The function to wrap.
+    :param count: The number of items that each call handles.
+    :returns: A function that calls ``func`` and reports how long it took.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> _T:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            planning = _CURRENT.get()
+            if planning is None:
+                _emit(stage, None, start, duration, count)
+            else:
+                planning.nested += duration
+                _emit(stage, planning.app, start, duration, count)
+
+    return wrapper
+
+
+def collect_plan(
+    planner: str, plan: Iterable[_T], platforms: Optional[Sized]
+) -> List[_T]:
+    """Collect the entries of an app-specific planner, reporting it as a stage.
+
+    :param planner: The name of the planner.
+    :param plan: The lazy form of the planner's build plan.
+    :param platforms: The platforms being planned, if any.
+    :returns: The build plan.
+    """
+    entries: List[_T] = []
+    start = time.perf_counter()
+    try:
+        entries.extend(plan)
+    finally:
+        duration = time.perf_counter() - start
+        planning = _CURRENT.get()
+        _emit(
+            PlanningStage.PLANNER,
+            None if planning is None else planning.app,
+            start,
+            duration,
+            len(entries),
+            {"planner": planner, "platforms": len(platforms or ())},
+        )
+    return entries
+
+
+def _plan_details(project_data: Mapping[str, Any]) -> Dict[str, Any]:
+    details = {"platforms": len(project_data.get("platforms") or ())}
+    if "name" in project_data:
+        details["name"] = project_data["name"]
+    return details
+
+
+def run_plan(app: str, planner: Callable[..., _T], /, **kwargs: Any) -> _T:
+    """Call an eager top-level planner, reporting its expansion and total time.
+
+    :param app: The app whose project is planned.
+    :param planner: The planner, which returns a sized build plan.
+    :param kwargs: The arguments to the planner, including the ``project_data``.
+    :returns: The build plan.
+    """
+    planning = _Planning(app)
+    count = 0
+    error = None
+    token = _CURRENT.set(planning)
+    start = time.perf_counter()
+    try:
+        plan = planner(**kwargs)
+        # The app planners return lists, though they're annotated as iterables.
+        count = len(cast(Sized, plan))
+    except Exception as exc:
+        error = exc
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        _CURRENT.reset(token)
+        _emit(PlanningStage.EXPAND, app, start, duration - planning.nested, count)
+        _emit(
+            PlanningStage.PLAN,
+            app,
+            start,
+            duration,
+            count,
+            _plan_details(kwargs["project_data"]),
+            error,
+        )
+    return plan
+
+
+def iter_plan(
+    app: str, plan: Iterator[_T], project_data: Mapping[str, Any]
+) -> Iterator[_T]:
+    """Iterate over a lazy top-level planner, reporting its expansion and total time.
+
+    Only the time spent generating entries counts, not the time the consumer spends
+    between entries, and the stages are reported as starting when the first entry
+    was requested. They're reported once the plan is exhausted or closed.
+
+    :param app: The app whose project is planned.
+    :param plan: The planner's iterator.
+    :param project_data: The project being planned.
+    :yields: Each entry of the build plan.
+    """
+    planning = _Planning(app)
+    # The body of a generator starts running when the first entry is requested.
+    first_start = time.perf_counter()
+    duration = 0.0
+    count = 0
+    error = None
+    try:
+        while True:
+            token = _CURRENT.set(planning)
+            start = time.perf_counter()
+            try:
+                entry = next(plan)
+            except StopIteration:
+                return
+            except Exception as exc:
+                error = exc
+                raise
+            finally:
+                duration += time.perf_counter() - start
+                _CURRENT.reset(token)
+            count += 1
+            yield entry
+    finally:
+        _emit(PlanningStage.EXPAND, app, first_start, duration - planning.nested, count)
+        _emit(
+            PlanningStage.PLAN,
+            app,
+            first_start,
+            duration,
+            count,
+            _plan_details(project_data),
+            error,
+        )
+
+
+class StageTotals(NamedTuple):
+    """The accumulated timing of a stage."""
+
+    calls: int
+    """The number of times the stage ran."""
+
+    count: int
+    """The total number of items the stage handled."""
+
+    duration: float
+    """The total time the stage took, in seconds."""
+
+
+class StageTimings:
+    """A stage hook that totals the timing of each stage for each app.
+
+    Install it with :func:`stage_hook`, plan some projects and read :attr:`totals`:
+
+    .. code-block:: python
+
+        timings = StageTimings()
+        with stage_hook(timings):
+            get_build_plan("snapcraft", project_data=project_data)
+        print(timings.totals[("snapcraft", PlanningStage.EXPAND)].duration)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals: Dict[Tuple[Optional[str], PlanningStage], StageTotals] = {}
+
+    def __call__(self, event: StageEvent) -> None:
+        """Add a stage's timing to the totals."""
+        key = (event.app, event.stage)
+        with self._lock:
+            calls, count, duration = self._totals.get(key, (0, 0, 0.0))
+            self._totals[key] = StageTotals(
+                calls + 1, count + event.count, duration + event.duration
+            )
+
+    @property
+    def totals(self) -> Dict[Tuple[Optional[str], PlanningStage], StageTotals]:
+        """The totals of each stage, keyed by the app and the stage."""
+        with self._lock:
+            return dict(self._totals)
+
+    def clear(self) -> None:
+        """Reset every total."""
+        with self._lock:
+            self._totals.clear()
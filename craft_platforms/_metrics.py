@@ -0,0 +1,248 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Counters and histograms of build planning."""
+
+import bisect
+import collections
+import threading
+from typing import Any, Dict, List, Sequence, Tuple
+
+from craft_platforms import _cache, _instrument
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+"""The default upper bounds of the planning latency histogram, in seconds."""
+
+_PREFIX = "craft_platforms"
+
+
+class _Histogram:
+    """A latency histogram for a single app."""
+
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int) -> None:
+        # One count per bucket, plus one for the values above the largest bucket.
+        self.counts = [0] * (size + 1)
+        self.sum = 0.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+class MetricsRegistry:
+    """A stage hook that counts the plans, entries and errors of each app.
+
+    The registry keeps, for each app:
+
+    - the number of build plans produced;
+    - the number of build plan entries produced;
+    - a histogram of the time taken to plan a project, including failures; and
+    - the number of errors raised, by error class.
+
+    Snapshots also include the statistics of the internal caches reported by
+    :func:`~craft_platforms.get_cache_info`. Install the registry for the life of
+    a service and export it with :meth:`snapshot` or :meth:`to_prometheus`:
+
+    .. code-block:: python
+
+        metrics = MetricsRegistry()
+        add_stage_hook(metrics)
+        ...
+        print(metrics.to_prometheus())
+
+    Only calls to :func:`~craft_platforms.get_build_plan` and
+    :func:`~craft_platforms.iter_build_plan` are counted. Projects planned in
+    other processes, such as the workers of :func:`~craft_platforms.get_build_plans`
+    with its default process pool, aren't counted.
+
+    :param buckets: The upper bounds of the latency histogram buckets, in seconds.
+    """
+
+    def __init__(self, *, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        if not buckets:
+            raise ValueError("At least one latency bucket is required.")
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("Latency buckets must be unique and in increasing order.")
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._plans: Dict[str, int] = collections.Counter()
+        self._entries: Dict[str, int] = collections.Counter()
+        self._errors: Dict[Tuple[str, str], int] = collections.Counter()
+        self._latency: Dict[str, _Histogram] = {}
+
+    def __call__(self, event: _instrument.StageEvent) -> None:
+        """Count a planned project."""
+        if event.stage != _instrument.PlanningStage.PLAN or event.app is None:
+            return
+        bucket = bisect.bisect_left(self.buckets, event.duration)
+        with self._lock:
+            if event.error is None:
+                self._plans[event.app] += 1
+                self._entries[event.app] += event.count
+            else:
+                self._errors[event.app, type(event.error).__name__] += 1
+            histogram = self._latency.get(event.app)
+            if histogram is None:
+                histogram = self._latency[event.app] = _Histogram(len(self.buckets))
+            histogram.counts[bucket] += 1
+            histogram.sum += event.duration
+
+    def clear(self) -> None:
+        """Reset every counter and histogram.
+
+        The statistics of the internal caches are reset by
+        :func:`~craft_platforms.clear_caches` instead.
+        """
+        with self._lock:
+            self._plans.clear()
+            self._entries.clear()
+            self._errors.clear()
+            self._latency.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the current value of every metric.
+
+        :returns: A dictionary with these keys:
+
+            ``plans``
+                The number of build plans produced, by app.
+            ``entries``
+                The number of build plan entries produced, by app.
+            ``errors``
+                The number of errors, by app and then by error class name.
+            ``latency``
+                The planning latency histogram of each app, as a dictionary with
+                the cumulative ``buckets`` as a list of ``(upper_bound, count)``
+                pairs ending with infinity, the ``count`` of observations and
+                their ``sum`` in seconds.
+            ``caches``
+                The ``hits``, ``misses``, ``size`` and ``hit_rate`` of each internal
+                cache. The hit rate is ``None`` if the cache hasn't been used.
+        """
+        with self._lock:
+            errors: Dict[str, Dict[str, int]] = {}
+            for (app, error), count in sorted(self._errors.items()):
+                errors.setdefault(app, {})[error] = count
+            latency = {
+                app: self._histogram_snapshot(histogram)
+                for app, histogram in sorted(self._latency.items())
+            }
+            snapshot: Dict[str, Any] = {
+                "plans": dict(sorted(self._plans.items())),
+                "entries": dict(sorted(self._entries.items())),
+                "errors": errors,
+                "latency": latency,
+            }
+        snapshot["caches"] = {
+            name: {
+                "hits": info.hits,
+                "misses": info.misses,
+                "size": info.currsize,
+                "hit_rate": (
+                    info.hits / (info.hits + info.misses)
+                    if info.hits + info.misses
+                    else None
+                ),
+            }
+            for name, info in sorted(_cache.get_cache_info().items())
+        }
+        return snapshot
+
+    def _histogram_snapshot(self, histogram: _Histogram) -> Dict[str, Any]:
+        buckets: List[Tuple[float, int]] = []
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), histogram.counts):
+            total += count
+            buckets.append((bound, total))
+        return {"buckets": buckets, "count": total, "sum": histogram.sum}
+
+    def to_prometheus(self) -> str:
+        """Get the current value of every metric in the Prometheus text format.
+
+        :returns: The metrics, ready to be served to a Prometheus scraper.
+        """
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def header(name: str, kind: str, description: str) -> str:
+            lines.append(f"# HELP {_PREFIX}_{name} {description}")
+            lines.append(f"# TYPE {_PREFIX}_{name} {kind}")
+            return f"{_PREFIX}_{name}"
+
+        metric = header("plans_total", "counter", "Build plans produced.")
+        for app, count in snapshot["plans"].items():
+            lines.append(f"{metric}{{{_labels(app=app)}}} {count}")
+
+        metric = header("build_infos_total", "counter", "Build plan entries produced.")
+        for app, count in snapshot["entries"].items():
+            lines.append(f"{metric}{{{_labels(app=app)}}} {count}")
+
+        metric = header("plan_errors_total", "counter", "Errors raised by planning.")
+        for app, errors in snapshot["errors"].items():
+            for error, count in errors.items():
+                lines.append(f"{metric}{{{_labels(app=app, error=error)}}} {count}")
+
+        metric = header(
+            "plan_duration_seconds", "histogram", "Time taken to plan a project."
+        )
+        for app, histogram in snapshot["latency"].items():
+            for bound, count in histogram["buckets"]:
+                labels = _labels(app=app, le=_format_bound(bound))
+                lines.append(f"{metric}_bucket{{{labels}}} {count}")
+            lines.append(f"{metric}_sum{{{_labels(app=app)}}} {histogram['sum']!r}")
+            lines.append(f"{metric}_count{{{_labels(app=app)}}} {histogram['count']}")
+
+        caches = snapshot["caches"]
+        for name, kind, key, description in (
+            ("cache_hits_total", "counter", "hits", "Lookups answered from a cache."),
+            ("cache_misses_total", "counter", "misses", "Lookups missing a cache."),
+            ("cache_size", "gauge", "size", "Entries currently in a cache."),
+        ):
+            metric = header(name, kind, description)
+            for cache, info in caches.items():
+                lines.append(f"{metric}{{{_labels(cache=cache)}}} {info[key]}")
+
+        metric = header(
+            "cache_hit_ratio", "gauge", "Share of lookups answered from a cache."
+        )
+        for cache, info in caches.items():
+            if info["hit_rate"] is not None:
+                lines.append(f"{metric}{{{_labels(cache=cache)}}} {info['hit_rate']!r}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,264 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Reading os-release files, on the host or in other root filesystems."""
+
+import concurrent.futures
+import dataclasses
+import itertools
+import os
+import pathlib
+import shlex
+from typing import Dict, Generator, Iterable, Mapping, Optional, Set, Union
+
+from craft_platforms import _distro
+
+ROOT_OS_RELEASE_PATHS = ("etc/os-release", "usr/lib/os-release")
+"""The locations of the os-release file in a root filesystem, in order of precedence."""
+
+MAX_SYMLINKS = 40
+"""The most symbolic links followed when finding a root's os-release file."""
+
+# The same normalization of the ID field that the distro package applies.
+_NORMALIZED_OS_ID = {
+    "ol": "oracle",
+    "opensuse-leap": "opensuse",
+}
+
+# Characters that mean an os-release value needs shell-like parsing.
+_SHELL_CHARACTERS = frozenset("\"'\\$` \t#")
+
+
+def _parse_os_release_value(value: str) -> str:
+    """Parse the value of a single os-release assignment."""
+    if not _SHELL_CHARACTERS.intersection(value):
+        return value
+    quote = value[:1]
+    inner = value[1:-1]
+    if (
+        len(value) > 1
+        and quote in "\"'"
+        and value[-1] == quote
+        and not _SHELL_CHARACTERS.intersection(inner.replace(" ", ""))
+    ):
+        return inner
+    tokens = shlex.split(value, comments=True)
+    return tokens[0] if tokens else ""
+
+
+def parse_os_release(content: str) -> Dict[str, str]:
+    """Parse the content of an os-release file.
+
+    Simple assignments, which is to say almost all of them, are parsed without
+    shell-like lexing. Values that need it are parsed with the same rules as the
+    distro package.
+
+    :param content: The content of an os-release file.
+    :returns: A dictionary of the file's fields, with keys as they appear in the file.
+    """
+    fields: Dict[str, str] = {}
+    for line in content.splitlines():
+        line = line.strip()  # noqa: PLW2901 (only the stripped line is used)
+        if not line or line.startswith("#"):
+            continue
+        key, equals, value = line.partition("=")
+        if not equals or not key.isidentifier():
+            continue
+        try:
+            fields[key] = _parse_os_release_value(value)
+        except ValueError:
+            # A quoted value spans several lines, so parse the whole file.
+            return _parse_os_release_tokens(content)
+    return fields
+
+
+def _parse_os_release_tokens(content: str) -> Dict[str, str]:
+    """Parse an os-release file with shell-like lexing, as the distro package does."""
+    lexer = shlex.shlex(content, posix=True)
+    lexer.whitespace_split = True
+    fields: Dict[str, str] = {}
+    for token in lexer:
+        key, equals, value = token.partition("=")
+        if equals:
+            fields[key] = value
+    return fields
+
+
+def base_from_os_release(os_release: Mapping[str, str]) -> Optional[_distro.DistroBase]:
+    """Get the base described by the fields of an os-release file.
+
+    The distribution is normalized as the distro package does.
+
+    :param os_release: The fields of an os-release file, as returned by
+        :func:`parse_os_release`.
+    :returns: The base, or ``None`` if the fields don't include both an ``ID`` and a
+        ``VERSION_ID``.
+    """
+    distribution = os_release.get("ID", "").lower().replace(" ", "_")
+    series = os_release.get("VERSION_ID", "")
+    if not distribution or not series:
+        return None
+    return _distro.DistroBase(_NORMALIZED_OS_ID.get(distribution, distribution), series)
+
+
+def _resolve_in_root(root: pathlib.Path, path: str) -> Optional[pathlib.Path]:
+    """Resolve a path as if ``root`` were the root directory.
+
+    Absolute symbolic links, such as an ``/etc/os-release`` link to
+    ``/usr/lib/os-release``, are followed inside the root rather than on the host.
+
+    :returns: The resolved path, or ``None`` if there are too many symbolic links.
+    """
+    parts = list(pathlib.PurePosixPath(path).parts)
+    current = root
+    links = 0
+    while parts:
+        part = parts.pop(0)
+        if part == "..":
+            if current != root:
+                current = current.parent
+            continue
+        if part in ("/", "."):
+            continue
+        candidate = current / part
+        try:
+            target = os.readlink(candidate)
+        except OSError:
+            # Not a symbolic link.
+            current = candidate
+            continue
+        links += 1
+        if links > MAX_SYMLINKS:
+            return None
+        target_path = pathlib.PurePosixPath(target)
+        if target_path.is_absolute():
+            current = root
+        parts[:0] = target_path.parts
+    return current
+
+
+def read_root_os_release(root: Union[str, "os.PathLike[str]"]) -> Dict[str, str]:
+    """Read the os-release file of a root filesystem.
+
+    Only ``etc/os-release`` and ``usr/lib/os-release`` are read.
+
+    :param root: The root directory of the filesystem, such as a chroot or an
+        extracted image.
+    :returns: The fields of the os-release file.
+    :raises ValueError: If the root has no os-release file.
+    """
+    root = pathlib.Path(root)
+    for path in ROOT_OS_RELEASE_PATHS:
+        resolved = _resolve_in_root(root, path)
+        if resolved is None:
+            continue
+        try:
+            content = resolved.read_text(encoding="utf-8")
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            continue
+        return parse_os_release(content)
+    raise ValueError(f"No os-release file found in {str(root)!r}")
+
+
+def base_from_root(root: Union[str, "os.PathLike[str]"]) -> _distro.DistroBase:
+    """Get the base of a root filesystem from its os-release file.
+
+    :param root: The root directory of the filesystem.
+    :returns: The base of the root filesystem.
+    :raises ValueError: If the root has no os-release file or the file doesn't set
+        both ``ID`` and ``VERSION_ID``.
+    """
+    base = base_from_os_release(read_root_os_release(root))
+    if base is None:
+        raise ValueError(
+            f"The os-release file in {str(root)!r} does not set both ID and VERSION_ID"
+        )
+    return base
+
+
+@dataclasses.dataclass(frozen=True)
+class RootBaseResult:
+    """The outcome of finding the base of a single root filesystem."""
+
+    index: int
+    """The position of the root in the input iterable."""
+
+    root: pathlib.Path
+    """The root directory of the filesystem."""
+
+    base: Optional[_distro.DistroBase] = None
+    """The base of the root filesystem, or ``None`` if it couldn't be found."""
+
+    error: Optional[Exception] = None
+    """The error that prevented the base from being found, if any."""
+
+
+def _scan_root(index: int, root: pathlib.Path) -> RootBaseResult:
+    """Find the base of a root filesystem, capturing errors as data."""
+    try:
+        base = base_from_root(root)
+    except (OSError, ValueError) as exc:
+        return RootBaseResult(index=index, root=root, error=exc)
+    return RootBaseResult(index=index, root=root, base=base)
+
+
+def get_root_bases(
+    roots: Iterable[Union[str, "os.PathLike[str]"]],
+    *,
+    max_workers: Optional[int] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> Generator[RootBaseResult, None, None]:
+    """Find the bases of many root filesystems concurrently.
+
+    This is the bulk form of :meth:`DistroBase.from_root()
+    <craft_platforms.DistroBase.from_root>`. Roots are scanned in a thread pool and
+    results are streamed back as each scan completes, so they may arrive out of order.
+    Use :attr:`RootBaseResult.index` to match a result with its root. The input
+    iterable is consumed lazily and only a bounded number of scans are in flight at a
+    time.
+
+    :param roots: The root directories of the filesystems.
+    :param max_workers: The number of worker threads. Defaults to the default of
+        :class:`concurrent.futures.ThreadPoolExecutor`.
+    :param executor: An executor to use instead of a new thread pool. The caller
+        remains responsible for shutting it down.
+    :yields: A :class:`RootBaseResult` for each root, containing either its base or
+        the error that prevented the base from being found.
+    """
+    pool = executor or concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    max_in_flight = (max_workers or min(32, (os.cpu_count() or 1) + 4)) * 4
+
+    roots_iter = enumerate(roots)
+    pending: Set[concurrent.futures.Future[RootBaseResult]] = set()
+
+    def submit_scans() -> None:
+        for index, root in itertools.islice(roots_iter, max_in_flight - len(pending)):
+            pending.add(pool.submit(_scan_root, index, pathlib.Path(root)))
+
+    try:
+        submit_scans()
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            pending.difference_update(done)
+            submit_scans()
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=True)
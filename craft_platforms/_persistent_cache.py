@@ -0,0 +1,260 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""A build plan cache that persists on disk."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+from typing import Any, Dict, Sequence, Tuple, Union
+
+from typing_extensions import Self
+
+from craft_platforms import _architectures, _buildinfo, _cache, _distro, _plan_cache
+
+CACHE_FILE_NAME = "build-plans.sqlite3"
+"""The name of the database file in a persistent cache's directory."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    fingerprint TEXT NOT NULL,
+    version TEXT NOT NULL,
+    plan TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, version)
+)
+"""
+
+_BUSY_TIMEOUT = 30.0
+"""Seconds to wait for another process to release a lock on the database."""
+
+_PACKAGE_DIR = pathlib.Path(__file__).parent
+
+
+@functools.lru_cache(maxsize=None)
+def _get_code_digest(package_dir: pathlib.Path) -> str:
+    """Get a digest of the package's source code.
+
+    Development checkouts all share the version ``dev``, so the digest keeps plans
+    made by one revision of the planners from being served to another. The
+    generated version file is left out because the version is part of the key.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        if path.name == "_version.py":
+            continue
+        digest.update(path.relative_to(package_dir).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def get_default_version() -> str:
+    """Get the version that plans are keyed by if a cache isn't given one."""
+    from craft_platforms import __version__  # noqa: PLC0415
+
+    return f"{__version__}+{_get_code_digest(_PACKAGE_DIR)}"
+
+
+def _encode_plan(plan: Sequence[_buildinfo.FrozenBuildInfo]) -> str:
+    return json.dumps(
+        [
+            [
+                info.platform,
+                info.build_on.value,
+                str(info.build_for),
+                str(info.build_base),
+            ]
+            for info in plan
+        ],
+        separators=(",", ":"),
+    )
+
+
+def _decode_plan(encoded: str) -> Tuple[_buildinfo.FrozenBuildInfo, ...]:
+    return tuple(
+        _buildinfo.FrozenBuildInfo(
+            platform,
+            _architectures.DebianArchitecture(build_on),
+            "all"
+            if build_for == "all"
+            else _architectures.DebianArchitecture(build_for),
+            _distro.DistroBase.from_str(build_base),
+        )
+        for platform, build_on, build_for, build_base in json.loads(encoded)
+    )
+
+
+class PersistentPlanCache:
+    """A cache of build plans stored in an SQLite database.
+
+    Plans are keyed by :func:`~craft_platforms.get_project_fingerprint`, the
+    version of craft-platforms that produced them and a digest of its source code,
+    so neither upgrading craft-platforms nor changing a development checkout serves
+    a stale plan. The database uses write-ahead logging, so any number of
+    threads and processes can read and write the same cache directory at once.
+
+    The cache can be moved between machines (for example, as a CI artifact) with
+    :meth:`export_to` and :meth:`import_from`.
+
+    :param directory: The directory that holds the cache. It is created if needed.
+    :param version: The version used to key plans. Defaults to the installed version
+        of craft-platforms and a digest of its source code. A version given
+        explicitly is used as it is, so the caller is responsible for changing it
+        when the planners change.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike[str]],
+        *,
+        version: str | None = None,
+    ) -> None:
+        if version is None:
+            version = get_default_version()
+
+        self.path = pathlib.Path(directory, CACHE_FILE_NAME)
+        """The path to the cache's database file."""
+
+        self.version: str = version
+        """The version under which plans are stored and looked up."""
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._connection = sqlite3.connect(
+            self.path,
+            timeout=_BUSY_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+
+    def get_build_plan(
+        self,
+        app: str,
+        *,
+        project_data: Dict[str, Any],
+        strict_platform_names: bool = False,
+        allow_app_characters: bool = False,
+    ) -> Tuple[_buildinfo.FrozenBuildInfo, ...]:
+        """Get a build plan, using the stored plan if the project is unchanged.
+
+        This takes the same arguments as :func:`~craft_platforms.get_build_plan`.
+
+        :returns: An immutable build plan.
+        """
+        fingerprint = _plan_cache.get_project_fingerprint(
+            app,
+            project_data=project_data,
+            strict_platform_names=strict_platform_names,
+            allow_app_characters=allow_app_characters,
+        )
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT plan FROM plans WHERE fingerprint = ? AND version = ?",
+                (fingerprint, self.version),
+            ).fetchone()
+            if row is not None:
+                self._hits += 1
+                return _decode_plan(row[0])
+            self._misses += 1
+
+        plan = _plan_cache.make_frozen_build_plan(
+            app,
+            project_data=project_data,
+            strict_platform_names=strict_platform_names,
+            allow_app_characters=allow_app_characters,
+        )
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO plans VALUES (?, ?, ?)",
+                (fingerprint, self.version, _encode_plan(plan)),
+            )
+        return plan
+
+    def cache_info(self) -> _cache.CacheInfo:
+        """Get the statistics of this cache.
+
+        Hits and misses are counted for this instance only. The size is the number
+        of plans stored for this instance's version.
+        """
+        with self._lock:
+            (currsize,) = self._connection.execute(
+                "SELECT COUNT(*) FROM plans WHERE version = ?", (self.version,)
+            ).fetchone()
+            return _cache.CacheInfo(
+                hits=self._hits, misses=self._misses, maxsize=None, currsize=currsize
+            )
+
+    def clear(self) -> None:
+        """Remove every plan from the cache and reset its statistics."""
+        with self._lock:
+            self._connection.execute("DELETE FROM plans")
+            self._hits = 0
+            self._misses = 0
+
+    def export_to(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Write a consistent snapshot of the cache to a single database file.
+
+        :param path: The file to write. An existing file is overwritten.
+        """
+        destination = sqlite3.connect(path)
+        try:
+            with self._lock:
+                self._connection.backup(destination)
+            # A snapshot is a single self-contained file, so don't leave it in WAL mode.
+            destination.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            destination.close()
+
+    def import_from(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Merge the plans from an exported snapshot into this cache.
+
+        Plans from other versions of craft-platforms are imported too, but are only
+        used by caches with a matching version.
+
+        :param path: A file written by :meth:`export_to`.
+        :raises FileNotFoundError: If the file doesn't exist.
+        """
+        path = pathlib.Path(path)
+        if not path.is_file():
+            raise FileNotFoundError(f"No plan cache snapshot at {str(path)!r}")
+        with self._lock:
+            self._connection.execute("ATTACH DATABASE ? AS snapshot", (str(path),))
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO plans SELECT * FROM snapshot.plans"
+                )
+            finally:
+                self._connection.execute("DETACH DATABASE snapshot")
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,179 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Memoized build planning."""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Tuple
+
+from craft_platforms import _build, _buildinfo, _cache, _distro
+
+DEFAULT_PLAN_CACHE_SIZE = 256
+"""The default maximum number of build plans kept by a :class:`PlanCache`."""
+
+PLANNER_KEYS = ("base", "build-base", "platforms", "type", "bases")
+"""The keys of the project data that the build planners read."""
+
+
+def get_project_fingerprint(
+    app: str,
+    *,
+    project_data: Dict[str, Any],
+    strict_platform_names: bool = False,
+    allow_app_characters: bool = False,
+) -> str:
+    """Get a fingerprint of everything that determines a project's build plan.
+
+    Only the keys in :data:`PLANNER_KEYS` contribute to the fingerprint, so changes
+    to any other part of the project don't change it. Formatting and the order of
+    keys within a platform don't matter, but the order of the platforms does, as it
+    determines the order of the build plan.
+
+    :param app: The name of the application (e.g. snapcraft, charmcraft, rockcraft)
+    :param project_data: The raw dictionary of the project's YAML file.
+    :param strict_platform_names: Whether to strictly validate all platform names.
+    :param allow_app_characters: Whether platform name validation allows characters
+        that are reserved for use by applications.
+    :returns: A hexadecimal SHA-256 digest.
+    """
+    planner_data = {
+        key: project_data[key] for key in PLANNER_KEYS if key in project_data
+    }
+    platforms = planner_data.get("platforms")
+    if isinstance(platforms, dict):
+        planner_data["platforms"] = list(platforms.items())
+    host_base = None
+    if app == "debcraft" and not planner_data.get("base"):
+        # Debcraft builds for the host when the project doesn't set a base.
+        host_base = str(_distro.DistroBase.from_host())
+    payload = [
+        app,
+        strict_platform_names,
+        allow_app_characters,
+        host_base,
+        planner_data,
+    ]
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def make_frozen_build_plan(
+    app: str,
+    *,
+    project_data: Dict[str, Any],
+    strict_platform_names: bool = False,
+    allow_app_characters: bool = False,
+) -> Tuple[_buildinfo.FrozenBuildInfo, ...]:
+    """Get a build plan as a tuple of FrozenBuildInfo, ready to be cached."""
+    return tuple(
+        _buildinfo.FrozenBuildInfo.from_build_info(info)
+        for info in _build.get_build_plan(
+            app,
+            project_data=project_data,
+            strict_platform_names=strict_platform_names,
+            allow_app_characters=allow_app_characters,
+        )
+    )
+
+
+class PlanCache:
+    """A bounded, thread-safe LRU cache of build plans.
+
+    Plans are keyed by :func:`get_project_fingerprint`, so planning a project that
+    hasn't changed in a way that affects its build plan is a dictionary lookup.
+    Cached plans are tuples of :class:`~craft_platforms.FrozenBuildInfo` and can
+    safely be shared between callers. Errors are not cached.
+
+    :param maxsize: The maximum number of build plans to keep. The least recently
+        used plan is evicted when the cache is full.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_PLAN_CACHE_SIZE) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer, not {maxsize}")
+        self._maxsize = maxsize
+        self._plans: collections.OrderedDict[
+            str, Tuple[_buildinfo.FrozenBuildInfo, ...]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_build_plan(
+        self,
+        app: str,
+        *,
+        project_data: Dict[str, Any],
+        strict_platform_names: bool = False,
+        allow_app_characters: bool = False,
+    ) -> Tuple[_buildinfo.FrozenBuildInfo, ...]:
+        """Get a build plan, using the cached plan if the project is unchanged.
+
+        This takes the same arguments as :func:`~craft_platforms.get_build_plan`.
+
+        :returns: An immutable build plan.
+        """
+        fingerprint = get_project_fingerprint(
+            app,
+            project_data=project_data,
+            strict_platform_names=strict_platform_names,
+            allow_app_characters=allow_app_characters,
+        )
+        with self._lock:
+            plan = self._plans.get(fingerprint)
+            if plan is not None:
+                self._plans.move_to_end(fingerprint)
+                self._hits += 1
+                return plan
+            self._misses += 1
+
+        # Plan outside the lock so that a slow project doesn't block cache hits.
+        plan = make_frozen_build_plan(
+            app,
+            project_data=project_data,
+            strict_platform_names=strict_platform_names,
+            allow_app_characters=allow_app_characters,
+        )
+        with self._lock:
+            self._plans[fingerprint] = plan
+            self._plans.move_to_end(fingerprint)
+            while len(self._plans) > self._maxsize:
+                self._plans.popitem(last=False)
+        return plan
+
+    def cache_info(self) -> _cache.CacheInfo:
+        """Get the statistics of this cache."""
+        with self._lock:
+            return _cache.CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._maxsize,
+                currsize=len(self._plans),
+            )
+
+    def clear(self) -> None:
+        """Remove every plan from the cache and reset its statistics."""
+        with self._lock:
+            self._plans.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._plans)
@@ -17,12 +17,38 @@
 
 import itertools
 import typing
-from typing import Collection, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import annotated_types
 from typing_extensions import Annotated
 
-from craft_platforms import _architectures, _buildinfo, _distro, _errors, _utils
+from craft_platforms import (
+    _architectures,
+    _buildinfo,
+    _cache,
+    _distro,
+    _errors,
+    _filter,
+    _instrument,
+    _utils,
+)
+
+_OnT = TypeVar("_OnT")
+_ForT = TypeVar("_ForT")
+_T = TypeVar("_T")
 
 RESERVED_PLATFORM_NAMES = frozenset(
     (
@@ -54,6 +80,7 @@ def get_platforms_build_plan(
     build_base: Optional[str] = None,
     *,
     allow_all_and_architecture_dependent: bool = False,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
 ) -> Sequence[_buildinfo.BuildInfo]:
     """Generate the build plan for a platforms-based artifact.
 
@@ -63,29 +90,110 @@ def get_platforms_build_plan(
     :param allow_all_and_architecture_dependent: whether to allow architecture-dependent
         platforms and architecture-independent platforms to coexist. This does not
         change the fact that only one architecture-independent platform can exist.
+    :param build_filter: If set, only entries that match this filter are included.
+        The whole project is still validated.
+    """
+    plan = iter_platforms_build_plan(
+        base,
+        platforms,
+        build_base,
+        allow_all_and_architecture_dependent=allow_all_and_architecture_dependent,
+        build_filter=build_filter,
+    )
+    if _instrument.HOOKS:
+        return _instrument.collect_plan("get_platforms_build_plan", plan, platforms)
+    return list(plan)
+
+
+def iter_platforms_build_plan(
+    base: Union[str, _distro.DistroBase],
+    platforms: Platforms,
+    build_base: Optional[str] = None,
+    *,
+    allow_all_and_architecture_dependent: bool = False,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
+    errors: Optional[List[Exception]] = None,
+) -> Iterator[_buildinfo.BuildInfo]:
+    """Lazily generate the build plan for a platforms-based artifact.
+
+    This is the streaming form of :func:`get_platforms_build_plan`. Each
+    ``BuildInfo`` is created only when requested, so a consumer that stops early
+    doesn't pay to expand every platform. Errors are raised during iteration.
+    Validation of ``build-for: all`` needs the whole plan, so it happens once the
+    last item has been yielded.
+
+    :param base: The target base
+    :param platforms: A dictionary of the platforms.
+    :param build_base: The build base, if declared.
+    :param allow_all_and_architecture_dependent: whether to allow architecture-dependent
+        platforms and architecture-independent platforms to coexist. This does not
+        change the fact that only one architecture-independent platform can exist.
+    :param build_filter: If set, only entries that match this filter are included.
+        The whole project is still validated.
+    :param errors: If set, errors in the project are appended to this list rather
+        than raised. Invalid platforms are skipped and the rest of the project is
+        still planned and validated.
     """
     if isinstance(base, _distro.DistroBase):
-        distro_base = base
+        distro_base: Optional[_distro.DistroBase] = base
     else:
-        distro_base = _distro.DistroBase.from_str(build_base or base)
-    build_plan: List[_buildinfo.BuildInfo] = []
-
-    used_reserved_names = RESERVED_PLATFORM_NAMES & platforms.keys()
-    if used_reserved_names:
-        if len(used_reserved_names) == 1:
-            raise _errors.InvalidPlatformNameError(
-                f"Platform name {next(iter(used_reserved_names))!r} is reserved.",
-                resolution="Use a different platform name, perhaps 'all' for platform-agnostic artifacts.",
+        from_str = _distro.DistroBase.from_str
+        if _instrument.HOOKS:
+            from_str = _instrument.timed(
+                _instrument.PlanningStage.RESOLVE_BASE, from_str
             )
-        used_reserved_names_str = ", ".join(
-            f"{name!r}" for name in sorted(used_reserved_names)
-        )
-        raise _errors.InvalidPlatformNameError(
-            f"Reserved platform names used: {used_reserved_names_str}",
-            resolution="Change the platform names for these platforms.",
-        )
+        try:
+            if not (build_base or base):
+                raise _errors.RequiresBaseError(
+                    "No base or build-base is declared.",
+                    resolution="Declare a base or build-base.",
+                )
+            distro_base = from_str(build_base or base)
+        except _errors.PROJECT_ERRORS as exc:
+            if errors is None:
+                raise
+            errors.append(exc)
+            distro_base = None
+
+    yield from iter_platforms_for_base(
+        distro_base,
+        platforms,
+        allow_all_and_architecture_dependent=allow_all_and_architecture_dependent,
+        build_filter=build_filter,
+        errors=errors,
+    )
 
+
+def iter_platforms_for_base(  # noqa: PLR0912
+    distro_base: Optional[_distro.DistroBase],
+    platforms: Platforms,
+    *,
+    allow_all_and_architecture_dependent: bool = False,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
+    errors: Optional[List[Exception]] = None,
+) -> Iterator[_buildinfo.BuildInfo]:
+    """Lazily generate the build plan for platforms that all build on one base.
+
+    This takes the same arguments as :func:`iter_platforms_build_plan`, but with the
+    build base already determined. If the base is ``None`` because it's invalid, the
+    platforms are validated but no entries are generated.
+    """
+    used_reserved_names = check_reserved_names(
+        platforms,
+        resolution="Change the platform names for these platforms.",
+        errors=errors,
+    )
+
+    build_for_all_validator = BuildForAllValidator(
+        allow_all_and_architecture_dependent=allow_all_and_architecture_dependent
+    )
+    # Every entry has the same base, so a filter that excludes it excludes them all.
+    skip_all = build_filter is not None and (
+        distro_base is None or not build_filter.matches_build_base(distro_base)
+    )
     for platform_name, platform in platforms.items():
+        if platform_name in used_reserved_names:
+            continue
         if platform is None:
             # This is a workaround for Python 3.10.
             # In python 3.12+ we can just check:
@@ -93,72 +201,214 @@ def get_platforms_build_plan(
             try:
                 architecture = _architectures.DebianArchitecture(platform_name)
             except ValueError:
-                raise _errors.InvalidDebianArchPlatformNameError(
-                    platform_name
-                ) from None
-            build_plan.append(
-                _buildinfo.BuildInfo(
-                    platform=platform_name,
-                    build_on=architecture,
-                    build_for=architecture,
-                    build_base=distro_base,
-                ),
+                error = _errors.InvalidDebianArchPlatformNameError(platform_name)
+                if errors is None:
+                    raise error from None
+                errors.append(error)
+                continue
+            build_for_all_validator.add(platform_name, architecture)
+            if skip_all or distro_base is None:
+                continue
+            if build_filter is not None and not (
+                build_filter.matches_platform(platform_name)
+                and build_filter.matches_build_on(architecture)
+                and build_filter.matches_build_for(architecture)
+            ):
+                continue
+            info = _buildinfo.BuildInfo(
+                platform=platform_name,
+                build_on=architecture,
+                build_for=architecture,
+                build_base=distro_base,
             )
+            if build_filter is None or build_filter(info):
+                yield info
         else:
-            for build_on, build_for in itertools.product(
-                _utils.vectorize(platform["build-on"]),
-                _utils.vectorize(platform.get("build-for", [platform_name])),
-            ):
-                build_plan.append(
-                    _buildinfo.BuildInfo(
-                        platform=platform_name,
-                        build_on=_architectures.DebianArchitecture(build_on),
-                        build_for=(
-                            "all"
-                            if build_for == "all"
-                            else _architectures.DebianArchitecture(build_for)
-                        ),
-                        build_base=distro_base,
-                    ),
+            try:
+                build_ons, build_fors = parse_build_on_for(
+                    _utils.vectorize(platform["build-on"]),
+                    _utils.vectorize(platform.get("build-for", [platform_name])),
+                    _architectures.DebianArchitecture,
+                    parse_build_for,
+                    errors=errors,
+                )
+            except _errors.PROJECT_ERRORS as exc:
+                if errors is None:
+                    raise
+                errors.append(exc)
+                continue
+            for build_for in build_fors:
+                build_for_all_validator.add(platform_name, build_for)
+            if skip_all or distro_base is None:
+                continue
+            if build_filter is not None:
+                if not build_filter.matches_platform(platform_name):
+                    continue
+                build_ons = [
+                    arch for arch in build_ons if build_filter.matches_build_on(arch)
+                ]
+                build_fors = [
+                    arch for arch in build_fors if build_filter.matches_build_for(arch)
+                ]
+            for build_on, build_for in itertools.product(build_ons, build_fors):
+                info = _buildinfo.BuildInfo(
+                    platform=platform_name,
+                    build_on=build_on,
+                    build_for=build_for,
+                    build_base=distro_base,
                 )
+                if build_filter is None or build_filter(info):
+                    yield info
 
-    build_for_archs = {info.build_for for info in build_plan}
-    if "all" in build_for_archs:
-        _validate_build_for_all(
-            build_plan,
-            build_for_archs,
-            allow_all_and_architecture_dependent=allow_all_and_architecture_dependent,
+    validate = build_for_all_validator.validate
+    if _instrument.HOOKS:
+        validate = _instrument.timed(
+            _instrument.PlanningStage.VALIDATE_BUILD_FOR_ALL, validate
         )
+    validate(errors=errors)
 
-    return build_plan
 
-
-def _validate_build_for_all(
-    build_plan: Collection[_buildinfo.BuildInfo],
-    build_for_archs: Collection[str],
+def check_reserved_names(
+    platforms: Platforms,
     *,
-    allow_all_and_architecture_dependent: bool,
-) -> None:
-    """Validate the build plan if there's a "build-for: all"."""
-    platforms_with_all = {
-        info.platform for info in build_plan if info.build_for == "all"
-    }
-    if allow_all_and_architecture_dependent:
-        if len(platforms_with_all) > 1:
-            raise _errors.AllInMultiplePlatformsError(platforms_with_all)
-        platforms_with_arch_dependent = {
-            info.platform for info in build_plan if info.build_for != "all"
-        }
-        platforms_with_all_and_another = (
-            platforms_with_all & platforms_with_arch_dependent
+    resolution: str,
+    errors: Optional[List[Exception]] = None,
+) -> FrozenSet[str]:
+    """Check that no platform uses a reserved name.
+
+    :param platforms: The platforms to check.
+    :param resolution: How to resolve the use of several reserved names.
+    :param errors: If set, an error is appended to this list rather than raised.
+    :returns: The reserved names that are used.
+    """
+    used_reserved_names = RESERVED_PLATFORM_NAMES & platforms.keys()
+    if not used_reserved_names:
+        return used_reserved_names
+    if len(used_reserved_names) == 1:
+        error = _errors.InvalidPlatformNameError(
+            f"Platform name {next(iter(used_reserved_names))!r} is reserved.",
+            resolution="Use a different platform name, perhaps 'all' for platform-agnostic artifacts.",
         )
-        if platforms_with_all_and_another:
-            raise _errors.AllOnlyBuildInPlatformError(platforms_with_all_and_another)
     else:
-        if len(platforms_with_all) > 1:
-            raise _errors.AllSinglePlatformError(platforms_with_all)
-        if len(build_for_archs) > 1:
-            raise _errors.AllOnlyBuildError(platforms_with_all)
+        used_reserved_names_str = ", ".join(
+            f"{name!r}" for name in sorted(used_reserved_names)
+        )
+        error = _errors.InvalidPlatformNameError(
+            f"Reserved platform names used: {used_reserved_names_str}",
+            resolution=resolution,
+        )
+    if errors is None:
+        raise error
+    errors.append(error)
+    return used_reserved_names
+
+
+def parse_build_for(
+    build_for: str,
+) -> Union[_architectures.DebianArchitecture, Literal["all"]]:
+    """Parse a build-for entry, which may be ``all``."""
+    return "all" if build_for == "all" else _architectures.DebianArchitecture(build_for)
+
+
+def parse_build_on_for(
+    build_on: Sequence[str],
+    build_for: Sequence[str],
+    parse_build_on: Callable[[str], _OnT],
+    parse_build_for: Callable[[str], _ForT],
+    *,
+    errors: Optional[List[Exception]] = None,
+) -> Tuple[List[_OnT], List[_ForT]]:
+    """Parse a platform's build-on and build-for entries.
+
+    Each entry is parsed once rather than once per combination, and in an order that
+    raises the same error as parsing each combination of the two would have.
+
+    :param errors: If set, every entry is parsed and the errors are appended to this
+        list rather than raised.
+    :returns: Lists of the parsed build-on and build-for entries. Both are empty if
+        the platform has no combinations or, when collecting errors, if any entry is
+        invalid.
+    """
+    if not build_on or not build_for:
+        return [], []
+    if errors is None:
+        first_build_on = parse_build_on(build_on[0])
+        build_fors = [parse_build_for(arch) for arch in build_for]
+        build_ons = [first_build_on, *(parse_build_on(arch) for arch in build_on[1:])]
+        return build_ons, build_fors
+
+    error_count = len(errors)
+    build_ons = _parse_each(build_on[:1], parse_build_on, errors)
+    build_fors = _parse_each(build_for, parse_build_for, errors)
+    build_ons.extend(_parse_each(build_on[1:], parse_build_on, errors))
+    if len(errors) > error_count:
+        return [], []
+    return build_ons, build_fors
+
+
+def _parse_each(
+    entries: Sequence[str], parse: Callable[[str], _T], errors: List[Exception]
+) -> List[_T]:
+    """Parse each entry, appending the errors to a list rather than raising them."""
+    parsed: List[_T] = []
+    for entry in entries:
+        with _errors.collect_errors(errors, _errors.PROJECT_ERRORS):
+            parsed.append(parse(entry))
+    return parsed
+
+
+class BuildForAllValidator:
+    """Validate ``build-for: all`` rules for a build plan as it's generated.
+
+    Items are recorded one at a time with :meth:`add`, keeping only what the rules
+    need, so the plan itself doesn't have to be kept or traversed again.
+    """
+
+    def __init__(self, *, allow_all_and_architecture_dependent: bool) -> None:
+        self._allow_all_and_architecture_dependent = (
+            allow_all_and_architecture_dependent
+        )
+        self._build_for_archs: Set[str] = set()
+        self._platforms_with_all: Set[str] = set()
+        self._platforms_with_arch_dependent: Set[str] = set()
+
+    def add(self, platform: str, build_for: str) -> None:
+        """Record a single build-for entry of a platform."""
+        self._build_for_archs.add(build_for)
+        if build_for == "all":
+            self._platforms_with_all.add(platform)
+        else:
+            self._platforms_with_arch_dependent.add(platform)
+
+    def validate(self, *, errors: Optional[List[Exception]] = None) -> None:
+        """Validate the recorded build plan if there's a "build-for: all".
+
+        :param errors: If set, every rule that's broken is appended to this list
+            rather than the first being raised.
+        """
+        if "all" not in self._build_for_archs:
+            return
+        platforms_with_all = self._platforms_with_all
+        problems: List[_errors.BuildForAllError] = []
+        if self._allow_all_and_architecture_dependent:
+            if len(platforms_with_all) > 1:
+                problems.append(_errors.AllInMultiplePlatformsError(platforms_with_all))
+            platforms_with_all_and_another = (
+                platforms_with_all & self._platforms_with_arch_dependent
+            )
+            if platforms_with_all_and_another:
+                problems.append(
+                    _errors.AllOnlyBuildInPlatformError(platforms_with_all_and_another)
+                )
+        else:
+            if len(platforms_with_all) > 1:
+                problems.append(_errors.AllSinglePlatformError(platforms_with_all))
+            if len(self._build_for_archs) > 1:
+                problems.append(_errors.AllOnlyBuildError(platforms_with_all))
+        if problems:
+            if errors is None:
+                raise problems[0]
+            errors.extend(problems)
 
 
 def parse_base_and_name(platform_name: str) -> Tuple[Optional[_distro.DistroBase], str]:
@@ -172,6 +422,13 @@ def parse_base_and_name(platform_name: str) -> Tuple[Optional[_distro.DistroBase
 
     :raises ValueError: If the base is invalid.
     """
+    return _parse_base_and_name(platform_name)
+
+
+@_cache.lru_cache("base_and_name", maxsize=_architectures.TOKEN_CACHE_SIZE)
+def _parse_base_and_name(
+    platform_name: str,
+) -> Tuple[Optional[_distro.DistroBase], str]:
     if ":" in platform_name:
         base_str, _, name = platform_name.partition(":")
         # Only parse as base if it contains "@" (looks like a base string)
@@ -0,0 +1,242 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Scheduling of build plans onto build runners."""
+
+import dataclasses
+import heapq
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from typing_extensions import Self
+
+from craft_platforms import _architectures, _buildinfo, _distro
+
+
+@dataclasses.dataclass(frozen=True)
+class Runner:
+    """A machine that can run builds."""
+
+    name: str
+    """A unique name for the runner."""
+
+    architecture: _architectures.DebianArchitecture
+    """The architecture that the runner builds on."""
+
+    bases: Optional[FrozenSet[_distro.DistroBase]] = None
+    """The bases the runner can build on, or ``None`` if it can build on any base."""
+
+    capacity: int = 1
+    """The number of builds the runner can run at once."""
+
+    cost: float = 1.0
+    """How long a build takes on this runner, relative to other runners.
+
+    For example, a runner that takes three times as long as others has a cost of 3.
+    """
+
+    def __post_init__(self) -> None:
+        if self.capacity < 1:
+            raise ValueError(
+                f"Runner {self.name!r} must have a capacity of at least 1."
+            )
+        if self.cost <= 0:
+            raise ValueError(f"Runner {self.name!r} must have a positive cost.")
+        if self.bases is not None and not isinstance(self.bases, frozenset):
+            object.__setattr__(self, "bases", frozenset(self.bases))
+
+    @classmethod
+    def from_machine(
+        cls,
+        name: str,
+        machine: str,
+        *,
+        bases: Optional[Iterable[_distro.DistroBase]] = None,
+        capacity: int = 1,
+        cost: float = 1.0,
+    ) -> Self:
+        """Create a runner from its machine architecture.
+
+        :param name: A unique name for the runner.
+        :param machine: The runner's architecture, as returned by ``uname -m``.
+        :param bases: The bases the runner can build on, or ``None`` for any base.
+        :param capacity: The number of builds the runner can run at once.
+        :param cost: How long a build takes on this runner, relative to others.
+        :raises ValueError: If the machine isn't a valid Debian architecture.
+        """
+        return cls(
+            name=name,
+            architecture=_architectures.DebianArchitecture.from_machine(machine),
+            bases=None if bases is None else frozenset(bases),
+            capacity=capacity,
+            cost=cost,
+        )
+
+    def can_build(self, info: _buildinfo.BuildInfo) -> bool:
+        """Determine whether this runner can build a build plan entry."""
+        return self.architecture == info.build_on and (
+            self.bases is None or any(base == info.build_base for base in self.bases)
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class Assignment:
+    """A build plan entry assigned to a slot on a runner."""
+
+    build_info: _buildinfo.BuildInfo
+    """The entry to build."""
+
+    runner: Runner
+    """The runner to build it on."""
+
+    slot: int
+    """Which of the runner's concurrent slots runs the build."""
+
+    start: float
+    """When the build starts, in units of build cost."""
+
+    end: float
+    """When the build ends, in units of build cost."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Schedule:
+    """An assignment of a build plan's entries to runners."""
+
+    assignments: Sequence[Assignment]
+    """The scheduled builds, in the order they were assigned."""
+
+    unschedulable: Sequence[_buildinfo.BuildInfo]
+    """Entries that no runner in the inventory can build."""
+
+    @property
+    def makespan(self) -> float:
+        """The time at which the last build ends."""
+        return max((assignment.end for assignment in self.assignments), default=0.0)
+
+    def for_runner(self, name: str) -> List[Assignment]:
+        """Get a runner's builds, in the order they start."""
+        return sorted(
+            (
+                assignment
+                for assignment in self.assignments
+                if assignment.runner.name == name
+            ),
+            key=lambda assignment: (assignment.start, assignment.slot),
+        )
+
+
+class _RunnerClass:
+    """A group of interchangeable runner slots.
+
+    Slots that build on the same architecture and bases at the same cost are
+    interchangeable, so only the least loaded one needs to be considered. Each class
+    keeps its slots in a heap ordered by when they next become free.
+    """
+
+    def __init__(self, runner: Runner) -> None:
+        self.template = runner
+        self.cost = runner.cost
+        self.slots: List[Tuple[float, int, Runner, int]] = []
+
+    def add(self, runner: Runner) -> None:
+        for slot in range(runner.capacity):
+            heapq.heappush(self.slots, (0.0, len(self.slots), runner, slot))
+
+
+def schedule_build_plan(
+    build_plan: Iterable[_buildinfo.BuildInfo],
+    runners: Iterable[Runner],
+    *,
+    cost: Optional[Callable[[_buildinfo.BuildInfo], float]] = None,
+) -> Schedule:
+    """Assign a build plan's entries to runners to minimize the makespan.
+
+    Entries are assigned longest first, each to the runner slot where it would
+    finish earliest. Among entries of the same cost, those that fewer runner slots
+    can build are assigned first so that they aren't crowded out. Minimizing the
+    makespan exactly is NP-hard; this greedy strategy is fast and, for identical
+    runners, is never more than a third longer than the optimum.
+
+    Runner slots that are interchangeable are grouped together, so scheduling takes
+    ``O(n log n)`` time for ``n`` entries with a typical runner inventory.
+
+    :param build_plan: The entries to schedule.
+    :param runners: The available runners.
+    :param cost: A function that gives the relative cost of building an entry. By
+        default, every entry costs 1.
+    :returns: The schedule, including any entries that no runner can build.
+    :raises ValueError: If two runners have the same name.
+    """
+    classes: Dict[Tuple[object, ...], _RunnerClass] = {}
+    names = set()
+    for runner in runners:
+        if runner.name in names:
+            raise ValueError(f"Duplicate runner name {runner.name!r}.")
+        names.add(runner.name)
+        key = (runner.architecture, runner.bases, runner.cost)
+        if key not in classes:
+            classes[key] = _RunnerClass(runner)
+        classes[key].add(runner)
+
+    # Entries with the same build environment can run on the same runner classes.
+    eligible: Dict[Tuple[object, ...], List[_RunnerClass]] = {}
+    schedulable: List[
+        Tuple[float, int, int, _buildinfo.BuildInfo, List[_RunnerClass]]
+    ] = []
+    unschedulable: List[_buildinfo.BuildInfo] = []
+    for index, info in enumerate(build_plan):
+        environment = (info.build_on, info.build_base)
+        runner_classes = eligible.get(environment)
+        if runner_classes is None:
+            runner_classes = [
+                runner_class
+                for runner_class in classes.values()
+                if runner_class.template.can_build(info)
+            ]
+            eligible[environment] = runner_classes
+        if runner_classes:
+            entry_cost = 1.0 if cost is None else cost(info)
+            slots = sum(len(runner_class.slots) for runner_class in runner_classes)
+            schedulable.append((entry_cost, slots, index, info, runner_classes))
+        else:
+            unschedulable.append(info)
+
+    # Longest first, then most constrained first, then in plan order.
+    schedulable.sort(key=lambda item: (-item[0], item[1], item[2]))
+    assignments: List[Assignment] = []
+    for entry_cost, _, _, info, runner_classes in schedulable:
+        best = min(
+            runner_classes,
+            key=lambda runner_class: (
+                runner_class.slots[0][0] + entry_cost * runner_class.cost
+            ),
+        )
+        start, order, runner, slot = best.slots[0]
+        end = start + entry_cost * best.cost
+        heapq.heapreplace(best.slots, (end, order, runner, slot))
+        assignments.append(
+            Assignment(build_info=info, runner=runner, slot=slot, start=start, end=end)
+        )
+
+    return Schedule(assignments=assignments, unschedulable=unschedulable)
@@ -0,0 +1,182 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Serialization of build plans as JSON and as a compact binary encoding."""
+
+import itertools
+import json
+import struct
+from typing import Dict, Iterable, List, Tuple, Union
+
+from craft_platforms import _architectures, _buildinfo, _distro
+
+_Arch = _architectures.DebianArchitecture
+
+_ARCHITECTURE_CODES: Tuple[_Arch, ...] = (
+    _Arch.AMD64,
+    _Arch.ARM64,
+    _Arch.ARMHF,
+    _Arch.I386,
+    _Arch.PPC64EL,
+    _Arch.RISCV64,
+    _Arch.S390X,
+)
+"""The architecture for each code of the binary encoding.
+
+New architectures must be added at the end so that existing encodings stay valid.
+"""
+
+_CODES_BY_ARCHITECTURE: Dict[_Arch, int] = {
+    arch: code for code, arch in enumerate(_ARCHITECTURE_CODES)
+}
+_ALL_CODE = 0xFF
+"""The code for ``build-for: all``."""
+
+_MAGIC = b"CPBP"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBcI")
+"""The magic bytes, format version, index type and length of the string table."""
+
+_SHORT_INDEX = b"H"
+_LONG_INDEX = b"I"
+_MAX_SHORT_INDEX = 0xFFFF
+_ENTRY_STRUCTS = {
+    index: struct.Struct("<{0}BB{0}{0}".format(index.decode()))
+    for index in (_SHORT_INDEX, _LONG_INDEX)
+}
+"""The platform name, build-on, build-for, distribution and series of an entry."""
+_SEPARATOR = "\0"
+
+
+def build_plan_to_json(plan: Iterable[_buildinfo.BuildInfo]) -> str:
+    """Serialize a build plan as a JSON array of :meth:`BuildInfo.to_dict` objects.
+
+    :param plan: The entries of the build plan.
+    :returns: The plan as compact JSON.
+    """
+    return json.dumps([info.to_dict() for info in plan], separators=(",", ":"))
+
+
+def build_plan_from_json(
+    data: Union[str, bytes],
+) -> List[_buildinfo.BuildInfo]:
+    """Deserialize a build plan made by :func:`build_plan_to_json`.
+
+    :param data: The JSON build plan.
+    :returns: The entries of the build plan.
+    :raises ValueError: If the data isn't a valid build plan.
+    """
+    entries = json.loads(data)
+    if not isinstance(entries, list):
+        raise ValueError("A build plan must be a JSON array.")  # noqa: TRY004 (malformed data)
+    from_dict = _buildinfo.BuildInfo.from_dict
+    return [from_dict(entry) for entry in entries]
+
+
+def build_plan_to_bytes(plan: Iterable[_buildinfo.BuildInfo]) -> bytes:
+    """Encode a build plan in a compact binary form.
+
+    Architectures are stored as one-byte codes and each distinct platform name,
+    distribution and series is stored once, so an entry takes 8 bytes in most
+    plans. The encoding is only meant to be read by
+    :func:`build_plan_from_bytes` from the same or a later version of
+    craft-platforms.
+
+    :param plan: The entries of the build plan.
+    :returns: The encoded plan.
+    :raises ValueError: If an entry can't be encoded.
+    """
+    strings: Dict[str, int] = {}
+    add = strings.setdefault
+    codes = _CODES_BY_ARCHITECTURE
+    try:
+        rows = [
+            (
+                add(info.platform, len(strings)),
+                codes[info.build_on],
+                _ALL_CODE if info.build_for == "all" else codes[info.build_for],
+                add(info.build_base.distribution, len(strings)),
+                add(info.build_base.series, len(strings)),
+            )
+            for info in plan
+        ]
+    except KeyError as exc:
+        raise ValueError(f"Cannot encode architecture {exc.args[0]!r}") from None
+    if any(_SEPARATOR in string for string in strings):
+        raise ValueError("Cannot encode strings that contain a null character.")
+
+    index = _SHORT_INDEX if len(strings) <= _MAX_SHORT_INDEX else _LONG_INDEX
+    entry = _ENTRY_STRUCTS[index]
+    table = _SEPARATOR.join(strings).encode()
+    return b"".join(
+        (
+            _HEADER.pack(_MAGIC, _VERSION, index, len(table)),
+            table,
+            *itertools.starmap(entry.pack, rows),
+        )
+    )
+
+
+def build_plan_from_bytes(data: bytes) -> List[_buildinfo.BuildInfo]:
+    """Decode a build plan made by :func:`build_plan_to_bytes`.
+
+    Entries with the same base share a single :class:`~craft_platforms.DistroBase`.
+
+    :param data: The encoded build plan.
+    :returns: The entries of the build plan.
+    :raises ValueError: If the data isn't a valid encoded build plan.
+    """
+    try:
+        magic, version, index, table_size = _HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("Not an encoded build plan.") from None
+    if magic != _MAGIC:
+        raise ValueError("Not an encoded build plan.")
+    if version != _VERSION:
+        raise ValueError(f"Unsupported build plan encoding version: {version}")
+    entry = _ENTRY_STRUCTS.get(index)
+    if entry is None:
+        raise ValueError("Invalid encoded build plan.")
+
+    body = memoryview(data)[_HEADER.size + table_size :]
+    if len(data) < _HEADER.size + table_size or len(body) % entry.size:
+        raise ValueError("Invalid encoded build plan: truncated data.")
+    strings = bytes(data[_HEADER.size : _HEADER.size + table_size]).decode()
+    table = strings.split(_SEPARATOR)
+
+    architectures = _ARCHITECTURE_CODES
+    build_info = _buildinfo.BuildInfo
+    bases: Dict[Tuple[int, int], _distro.DistroBase] = {}
+    entries: List[_buildinfo.BuildInfo] = []
+    try:
+        for platform, build_on, build_for, distribution, series in entry.iter_unpack(
+            body
+        ):
+            base = bases.get((distribution, series))
+            if base is None:
+                base = bases[distribution, series] = _buildinfo.intern_base(
+                    _distro.DistroBase(table[distribution], table[series])
+                )
+            entries.append(
+                build_info(
+                    table[platform],
+                    architectures[build_on],
+                    "all" if build_for == _ALL_CODE else architectures[build_for],
+                    base,
+                )
+            )
+    except IndexError:
+        raise ValueError("Invalid encoded build plan.") from None
+    return entries
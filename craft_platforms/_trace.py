@@ -0,0 +1,191 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Traces of build planning in the Chrome trace event format."""
+
+import contextlib
+import json
+import os
+import pathlib
+import threading
+import time
+from typing import IO, Any, Dict, Generator, List, Optional, Set, Union
+
+from typing_extensions import Self
+
+from craft_platforms import _instrument
+
+DEFAULT_BUFFER_SIZE = 10_000
+"""The number of trace events kept in memory before they're written to the file."""
+
+_CATEGORY = "craft_platforms"
+
+
+class ChromeTracer:
+    """A stage hook that writes a timeline of build planning to a trace file.
+
+    The file is a JSON trace in the Chrome trace event format, which can be opened
+    in `Perfetto <https://ui.perfetto.dev>`_ or ``chrome://tracing``. Each call to
+    :func:`~craft_platforms.get_build_plan`, to an app-specific planner and to each
+    of their stages is a span, with the project's name, number of platforms and
+    number of build plan entries as its arguments. Spans are grouped by the thread
+    that planned them, so the overlap of workers in a thread pool can be seen.
+
+    Events are kept in memory and written to the file in bulk. Use the tracer as a
+    context manager to install it as a stage hook and to finish the file when
+    planning is done:
+
+    .. code-block:: python
+
+        with ChromeTracer("plan.trace.json") as tracer:
+            for name, project_data in projects:
+                with tracer.span("project", project=name):
+                    get_build_plan(app, project_data=project_data)
+
+    Projects planned in other processes, such as the workers of
+    :func:`~craft_platforms.get_build_plans` with its default process pool, aren't
+    traced.
+
+    :param path: The file to write the trace to. It's replaced if it exists.
+    :param buffer_size: The number of events kept in memory before they're
+        written to the file.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        self.path = pathlib.Path(path)
+        self.buffer_size = buffer_size
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._buffer: List[Dict[str, Any]] = []
+        self._threads: Set[int] = set()
+        self._file: Optional[IO[str]] = None
+        self._written = 0
+        self._closed = False
+
+    def __call__(self, event: _instrument.StageEvent) -> None:
+        """Record a stage of build planning as a span."""
+        if event.stage == _instrument.PlanningStage.EXPAND:
+            # Expansion is the time between the other stages, not a single span.
+            return
+        if event.stage == _instrument.PlanningStage.PLANNER:
+            name = event.details["planner"]
+        else:
+            name = event.stage.value
+        self._add_span(
+            name,
+            event.start,
+            event.duration,
+            {"app": event.app, "count": event.count, **event.details},
+        )
+
+    @contextlib.contextmanager
+    def span(self, name: str, **args: Any) -> Generator[None, None, None]:
+        """Record a span around a block of code, such as planning one project.
+
+        :param name: The name of the span.
+        :param args: Arguments shown with the span, such as a project identifier.
+            They must be serializable as JSON.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add_span(name, start, time.perf_counter() - start, args)
+
+    def _add_span(
+        self, name: str, start: float, duration: float, args: Dict[str, Any]
+    ) -> None:
+        thread_id = threading.get_ident()
+        with self._lock:
+            if self._closed:
+                return
+            if thread_id not in self._threads:
+                self._threads.add(thread_id)
+                self._buffer.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": self._pid,
+                        "tid": thread_id,
+                        "args": {"name": threading.current_thread().name},
+                    }
+                )
+            self._buffer.append(
+                {
+                    "name": name,
+                    "cat": _CATEGORY,
+                    "ph": "X",
+                    "ts": (start - self._origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": self._pid,
+                    "tid": thread_id,
+                    "args": args,
+                }
+            )
+            if len(self._buffer) >= self.buffer_size:
+                self._flush()
+
+    def flush(self) -> None:
+        """Write the buffered events to the file.
+
+        Events are written automatically once :attr:`buffer_size` events are
+        buffered, and when the tracer is closed.
+        """
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._closed:
+            return
+        if self._file is None:
+            self._file = self.path.open("w", encoding="utf-8")
+            self._file.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+        if self._buffer:
+            separator = ",\n" if self._written else ""
+            self._file.write(
+                separator + ",\n".join(json.dumps(event) for event in self._buffer)
+            )
+            self._written += len(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write the remaining events and finish the trace file.
+
+        Spans that end after the tracer is closed aren't recorded. Closing a tracer
+        that's already closed does nothing.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._flush()
+            self._closed = True
+            if self._file is not None:
+                self._file.write("\n]}\n")
+                self._file.close()
+
+    def __enter__(self) -> Self:
+        _instrument.add_stage_hook(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        _instrument.remove_stage_hook(self)
+        self.close()
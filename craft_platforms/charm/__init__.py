@@ -20,6 +20,9 @@ from ._build import (
     get_platforms_charm_build_plan,
     get_bases_charm_build_plan,
     get_charm_build_plan,
+    iter_platforms_charm_build_plan,
+    iter_bases_charm_build_plan,
+    iter_charm_build_plan,
 )
 
 
@@ -28,4 +31,7 @@ __all__ = [
     "get_platforms_charm_build_plan",
     "get_bases_charm_build_plan",
     "get_charm_build_plan",
+    "iter_platforms_charm_build_plan",
+    "iter_bases_charm_build_plan",
+    "iter_charm_build_plan",
 ]
@@ -15,14 +15,28 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Charmcraft-specific platforms information."""
 
+import functools
 import itertools
-from typing import Any, Collection, Dict, Iterable, List, Optional, Sequence
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from craft_platforms import (
     _architectures,
     _buildinfo,
     _distro,
     _errors,
+    _filter,
+    _instrument,
     _platforms,
     _utils,
 )
@@ -40,29 +54,32 @@ If no platforms are defined, the charm will be built on and for these architectu
 """
 
 
-def _validate_base_definition(  # noqa: PLR0912
+def _get_base_definition_errors(  # noqa: PLR0912
     base: Optional[str],
     build_base: Optional[str],
     platform_name: Optional[str],
     platform: Optional[_platforms.PlatformDict],
-) -> None:
-    """Validate that a base is defined correctly in the data used to create a build.
+) -> List[_errors.CraftPlatformsError]:
+    """Get the ways that a base is defined incorrectly in the data for a build.
 
     The rules are:
      - a base must be defined in only one place
      - each platform must build on and build for the same base
 
-    :raises ValueError: If the base is not defined correctly in the build data.
+    :returns: An error for each rule that's broken, in the order they're checked.
     """
     if not (platform_name or base or build_base):
-        raise _errors.RequiresBaseError(
-            message="No base, build-base, or platforms are declared.",
-            resolution="Declare a base or build-base.",
-        )
+        return [
+            _errors.RequiresBaseError(
+                message="No base, build-base, or platforms are declared.",
+                resolution="Declare a base or build-base.",
+            )
+        ]
 
     if not platform_name:
-        return
+        return []
 
+    problems: List[_errors.CraftPlatformsError] = []
     # validate base defined in the platform name
     platform_base, _ = _platforms.parse_base_and_name(platform_name=platform_name)
 
@@ -75,25 +92,34 @@ def _validate_base_definition(  # noqa: PLR0912
             for check_base in build_for_bases:
                 if check_base in (None, platform_base):
                     continue
-                raise _errors.InvalidMultiBaseError(
-                    message=(
-                        f"Platform {platform_name!r} declares a base in the "
-                        "platform's name and declares an incompatible 'build-for' "
-                        f"entry ({check_base})."
-                    ),
-                    resolution=(
-                        "Either remove the base from the platform's name or remove "
-                        "the incompatible 'build-for' entry for the platform."
-                    ),
+                problems.append(
+                    _errors.InvalidMultiBaseError(
+                        message=(
+                            f"Platform {platform_name!r} declares a base in the "
+                            "platform's name and declares an incompatible 'build-for' "
+                            f"entry ({check_base})."
+                        ),
+                        resolution=(
+                            "Either remove the base from the platform's name or remove "
+                            "the incompatible 'build-for' entry for the platform."
+                        ),
+                    )
                 )
+                break
         # create a set of the bases defined in the build-on and build-for entries
         bases = set()
-        for entry in [
-            *_utils.vectorize(platform.get("build-on", [platform_name])),
-            *_utils.vectorize(platform.get("build-for", [platform_name])),
-        ]:
-            distro_base, _ = _architectures.parse_base_and_architecture(arch=entry)
-            bases.add(str(distro_base) if distro_base else None)
+        try:
+            for entry in [
+                *_utils.vectorize(platform.get("build-on", [platform_name])),
+                *_utils.vectorize(platform.get("build-for", [platform_name])),
+            ]:
+                distro_base, _ = _architectures.parse_base_and_architecture(arch=entry)
+                bases.add(str(distro_base) if distro_base else None)
+        except ValueError:
+            # An invalid entry is only the first error if no rule is broken yet.
+            if problems:
+                return problems
+            raise
 
         if len(bases) == 0:
             # an empty set means no bases are defined
@@ -103,57 +129,102 @@ def _validate_base_definition(  # noqa: PLR0912
             build_on_for_base = next(iter(bases))
         else:
             # otherwise there are multiple bases defined or some entries missing bases
-            raise _errors.InvalidMultiBaseError(
-                message=(
-                    f"Platform {platform_name!r} has mismatched bases in the 'build-on' "
-                    "and 'build-for' entries."
-                ),
-                resolution=(
-                    "Use the same base for all 'build-on' and 'build-for' entries for "
-                    "the platform."
-                ),
+            problems.append(
+                _errors.InvalidMultiBaseError(
+                    message=(
+                        f"Platform {platform_name!r} has mismatched bases in the "
+                        "'build-on' and 'build-for' entries."
+                    ),
+                    resolution=(
+                        "Use the same base for all 'build-on' and 'build-for' entries "
+                        "for the platform."
+                    ),
+                )
             )
+            # The remaining rules need to know the platform's base.
+            return problems
     else:
         build_on_for_base = None
 
     if (platform_base or build_on_for_base) and (base or build_base):
-        raise _errors.InvalidMultiBaseError(
-            message=f"Platform {platform_name!r} declares a base and a top-level base "
-            "or build-base is declared.",
-            resolution=(
-                "Remove the base from the platform's name or remove the top-level base "
-                "or build-base."
-            ),
+        problems.append(
+            _errors.InvalidMultiBaseError(
+                message=f"Platform {platform_name!r} declares a base and a top-level "
+                "base or build-base is declared.",
+                resolution=(
+                    "Remove the base from the platform's name or remove the top-level "
+                    "base or build-base."
+                ),
+            )
         )
 
     if not (platform_base or build_on_for_base) and not (base or build_base):
-        raise _errors.RequiresBaseError(
-            message=(
-                "No base or build-base is declared and no base is declared "
-                "in the platforms section."
-            ),
-            resolution="Declare a base or build-base.",
+        problems.append(
+            _errors.RequiresBaseError(
+                message=(
+                    "No base or build-base is declared and no base is declared "
+                    "in the platforms section."
+                ),
+                resolution="Declare a base or build-base.",
+            )
         )
 
+    return problems
 
-def _get_base_from_build_data(
+
+def _validate_base_definition(
     base: Optional[str],
     build_base: Optional[str],
     platform_name: Optional[str],
     platform: Optional[_platforms.PlatformDict],
-) -> _distro.DistroBase:
-    """Get the base from a data used to create a build.
-
-    :returns: The base to use for a build.
+) -> None:
+    """Validate that a base is defined correctly in the data used to create a build.
 
     :raises ValueError: If the base is not defined correctly in the build data.
     """
-    _validate_base_definition(
+    problems = _get_base_definition_errors(
         base=base,
         build_base=build_base,
         platform_name=platform_name,
         platform=platform,
     )
+    if problems:
+        raise problems[0]
+
+
+def _get_base_from_build_data(
+    base: Optional[str],
+    build_base: Optional[str],
+    platform_name: Optional[str],
+    platform: Optional[_platforms.PlatformDict],
+    *,
+    errors: Optional[List[Exception]] = None,
+) -> Optional[_distro.DistroBase]:
+    """Get the base from a data used to create a build.
+
+    :param errors: If set, the rules that the build data breaks are appended to this
+        list rather than raised, and ``None`` is returned.
+    :returns: The base to use for a build.
+
+    :raises ValueError: If the base is not defined correctly in the build data.
+    """
+    if errors is None:
+        _validate_base_definition(
+            base=base,
+            build_base=build_base,
+            platform_name=platform_name,
+            platform=platform,
+        )
+    else:
+        problems = _get_base_definition_errors(
+            base=base,
+            build_base=build_base,
+            platform_name=platform_name,
+            platform=platform,
+        )
+        if problems:
+            errors.extend(problems)
+            return None
 
     if build_base:
         return _distro.DistroBase.from_str(build_base)
@@ -183,6 +254,8 @@ def get_platforms_charm_build_plan(
     base: Optional[str],
     platforms: Optional[_platforms.Platforms],
     build_base: Optional[str] = None,
+    *,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
 ) -> Sequence[_buildinfo.BuildInfo]:
     """Generate the build plan for a platforms-based charm.
 
@@ -203,6 +276,8 @@ def get_platforms_charm_build_plan(
     :param platforms: The mapping of platform names to ``PlatformDicts``. If
       the ``base`` and ``build-base`` are unset, then the base must be defined
       in the platforms.
+    :param build_filter: If set, only entries that match this filter are included.
+      Every platform is still validated.
 
     :raises ValueError: If the build plan can't be created due to invalid base
       and platform definitions.
@@ -210,49 +285,118 @@ def get_platforms_charm_build_plan(
     :returns: A build plan describing the environments where the charm can build
       and where the charm can run.
     """
+    plan = iter_platforms_charm_build_plan(
+        base=base,
+        platforms=platforms,
+        build_base=build_base,
+        build_filter=build_filter,
+    )
+    if _instrument.HOOKS:
+        return _instrument.collect_plan(
+            "get_platforms_charm_build_plan", plan, platforms
+        )
+    return list(plan)
+
+
+def _parse_build_on(
+    platform_name: str, build_on: str
+) -> _architectures.DebianArchitecture:
+    """Parse a charm platform's build-on entry, which can't be ``all``."""
+    _, build_on_arch = _architectures.parse_base_and_architecture(arch=build_on)
+    if build_on_arch == "all":
+        raise ValueError(
+            f"Platform {platform_name!r} has an invalid 'build-on' entry of 'all'."
+        )
+    return build_on_arch
+
+
+def _parse_build_for(
+    build_for: str,
+) -> Union[_architectures.DebianArchitecture, Literal["all"]]:
+    """Parse a charm platform's build-for entry, dropping any base prefix."""
+    return _architectures.parse_base_and_architecture(arch=build_for)[1]
+
+
+def iter_platforms_charm_build_plan(  # noqa: PLR0912
+    base: Optional[str],
+    platforms: Optional[_platforms.Platforms],
+    build_base: Optional[str] = None,
+    *,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
+    errors: Optional[List[Exception]] = None,
+) -> Iterator[_buildinfo.BuildInfo]:
+    """Lazily generate the build plan for a platforms-based charm.
+
+    This is the streaming form of :func:`get_platforms_charm_build_plan`. Each
+    platform is validated and expanded only when the consumer reaches it, and errors
+    are raised during iteration.
+
+    :param base: The run-time environment for the charm, formatted  as
+      ``distribution@series``.
+    :param platforms: The mapping of platform names to ``PlatformDicts``.
+    :param build_base: The build environment to using when building the charm,
+      formatted as ``distribution@series``.
+    :param build_filter: If set, only entries that match this filter are included.
+      Every platform is still validated.
+    :param errors: If set, errors are appended to this list rather than raised.
+      Invalid platforms are skipped and the other platforms are still validated.
+
+    :raises ValueError: If the build plan can't be created due to invalid base
+      and platform definitions.
+
+    :yields: Each environment where the charm can build and where the charm can run.
+    """
+    get_base = _get_base_from_build_data
+    if _instrument.HOOKS:
+        get_base = _instrument.timed(_instrument.PlanningStage.RESOLVE_BASE, get_base)
     if platforms is None:
-        distro_base = _get_base_from_build_data(
+        distro_base = get_base(
             base=base,
             build_base=build_base,
             platform_name=None,
             platform=None,
+            errors=errors,
         )
+        if distro_base is None:
+            return
 
         # If no platforms are specified, build for all default architectures without
         # an option of cross-compiling.
-        return [
-            _buildinfo.BuildInfo(
+        for arch in DEFAULT_ARCHITECTURES:
+            info = _buildinfo.BuildInfo(
                 platform=arch.value,
                 build_on=arch,
                 build_for=arch,
                 build_base=distro_base,
             )
-            for arch in DEFAULT_ARCHITECTURES
-        ]
+            if build_filter is None or build_filter(info):
+                yield info
+        return
 
-    used_reserved_names = _platforms.RESERVED_PLATFORM_NAMES & platforms.keys()
-    if used_reserved_names:
-        if len(used_reserved_names) == 1:
-            raise _errors.InvalidPlatformNameError(
-                f"Platform name {next(iter(used_reserved_names))!r} is reserved.",
-                resolution="Use a different platform name, perhaps 'all' for platform-agnostic artifacts.",
-            )
-        used_reserved_names_str = ", ".join(
-            f"{name!r}" for name in sorted(used_reserved_names)
-        )
-        raise _errors.InvalidPlatformNameError(
-            f"Reserved platform names used: {used_reserved_names_str}",
-            resolution="Change the platform name strings for these platforms.",
-        )
+    used_reserved_names = _platforms.check_reserved_names(
+        platforms,
+        resolution="Change the platform name strings for these platforms.",
+        errors=errors,
+    )
 
-    build_plan: List[_buildinfo.BuildInfo] = []
     for platform_name, platform in platforms.items():
-        distro_base = _get_base_from_build_data(
-            base=base,
-            build_base=build_base,
-            platform_name=platform_name,
-            platform=platform,
-        )
+        if platform_name in used_reserved_names:
+            continue
+        try:
+            distro_base = get_base(
+                base=base,
+                build_base=build_base,
+                platform_name=platform_name,
+                platform=platform,
+                errors=errors,
+            )
+        except _errors.PROJECT_ERRORS as exc:
+            # The platform's data is malformed, so parsing it again would only
+            # report the same error.
+            if errors is None:
+                raise
+            errors.append(exc)
+            continue
 
         if platform is None:
             _, arch_str = _platforms.parse_base_and_name(platform_name)
@@ -263,46 +407,51 @@ def get_platforms_charm_build_plan(
             try:
                 arch = _architectures.DebianArchitecture(arch_str)
             except ValueError:
-                raise ValueError(
+                error = ValueError(
                     f"Platform name {platform_name!r} is not a valid Debian architecture. "
                     "Specify a build-on and build-for.",
-                ) from None
-
-            build_plan.append(
-                _buildinfo.BuildInfo(
-                    platform=platform_name,
-                    build_on=arch,
-                    build_for=arch,
-                    build_base=distro_base,
-                ),
-            )
+                )
+                if errors is None:
+                    raise error from None
+                errors.append(error)
+                continue
+            build_ons: List[_architectures.DebianArchitecture] = [arch]
+            build_fors: List[
+                Union[_architectures.DebianArchitecture, Literal["all"]]
+            ] = [arch]
         else:
-            for build_on, build_for in itertools.product(
+            build_ons, build_fors = _platforms.parse_build_on_for(
                 _utils.vectorize(platform.get("build-on", [platform_name])),
                 _utils.vectorize(platform.get("build-for", [platform_name])),
-            ):
-                _, build_on_arch = _architectures.parse_base_and_architecture(
-                    arch=build_on
-                )
-                if build_on_arch == "all":
-                    raise ValueError(
-                        f"Platform {platform_name!r} has an invalid 'build-on' entry of 'all'."
-                    )
-
-                _, build_for_arch = _architectures.parse_base_and_architecture(
-                    arch=build_for
-                )
+                functools.partial(_parse_build_on, platform_name),
+                _parse_build_for,
+                errors=errors,
+            )
 
-                build_plan.append(
-                    _buildinfo.BuildInfo(
-                        platform=platform_name,
-                        build_on=build_on_arch,
-                        build_for=build_for_arch,
-                        build_base=distro_base,
-                    ),
-                )
+        if distro_base is None:
+            continue
+        if build_filter is not None:
+            if not (
+                build_filter.matches_platform(platform_name)
+                and build_filter.matches_build_base(distro_base)
+            ):
+                continue
+            build_ons = [
+                arch for arch in build_ons if build_filter.matches_build_on(arch)
+            ]
+            build_fors = [
+                arch for arch in build_fors if build_filter.matches_build_for(arch)
+            ]
 
-    return build_plan
+        for build_on, build_for in itertools.product(build_ons, build_fors):
+            info = _buildinfo.BuildInfo(
+                platform=platform_name,
+                build_on=build_on,
+                build_for=build_for,
+                build_base=distro_base,
+            )
+            if build_filter is None or build_filter(info):
+                yield info
 
 
 def _gen_build_plan_for_base(base: Dict[str, Any]) -> Iterable[_buildinfo.BuildInfo]:
@@ -326,25 +475,75 @@ def _gen_build_plan_for_base(base: Dict[str, Any]) -> Iterable[_buildinfo.BuildI
 
 def get_bases_charm_build_plan(
     bases: Sequence[Dict[str, Any]],
+    *,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
 ) -> Sequence[_buildinfo.BuildInfo]:
     """Get a build plan for a legacy "bases" based charm."""
-    plan: List[_buildinfo.BuildInfo] = []
+    plan = iter_bases_charm_build_plan(bases, build_filter=build_filter)
+    if _instrument.HOOKS:
+        return _instrument.collect_plan("get_bases_charm_build_plan", plan, None)
+    return list(plan)
+
+
+def iter_bases_charm_build_plan(
+    bases: Iterable[Dict[str, Any]],
+    *,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
+    errors: Optional[List[Exception]] = None,
+) -> Iterator[_buildinfo.BuildInfo]:
+    """Lazily generate a build plan for a legacy "bases" based charm.
+
+    :param errors: If set, the error for each invalid base is appended to this list
+        rather than raised, and the other bases are still planned.
+    """
     for base in bases:
-        plan.extend(_gen_build_plan_for_base(base))
-    return plan
+        build_plan: Iterable[_buildinfo.BuildInfo]
+        if errors is None:
+            build_plan = _gen_build_plan_for_base(base)
+        else:
+            try:
+                build_plan = list(_gen_build_plan_for_base(base))
+            except _errors.PROJECT_ERRORS as exc:
+                errors.append(exc)
+                continue
+        if build_filter is None:
+            yield from build_plan
+        else:
+            yield from filter(build_filter, build_plan)
 
 
 def get_charm_build_plan(
     project_data: Dict[str, Any],
+    *,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
 ) -> Sequence[_buildinfo.BuildInfo]:
+    plan = iter_charm_build_plan(project_data, build_filter=build_filter)
+    if _instrument.HOOKS:
+        return _instrument.collect_plan(
+            "get_charm_build_plan", plan, project_data.get("platforms")
+        )
+    return list(plan)
+
+
+def iter_charm_build_plan(
+    project_data: Dict[str, Any],
+    *,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
+    errors: Optional[List[Exception]] = None,
+) -> Iterator[_buildinfo.BuildInfo]:
+    """Lazily generate the build plan for a charm from its project data."""
     if "platforms" in project_data:
-        return get_platforms_charm_build_plan(
+        return iter_platforms_charm_build_plan(
             base=project_data.get("base"),
             build_base=project_data.get("build-base"),
             platforms=project_data.get(
                 "platforms",
             ),
+            build_filter=build_filter,
+            errors=errors,
         )
     if "bases" in project_data:
-        return get_bases_charm_build_plan(project_data["bases"])
+        return iter_bases_charm_build_plan(
+            project_data["bases"], build_filter=build_filter, errors=errors
+        )
     raise NotImplementedError("Unknown charm type with no bases or platforms.")
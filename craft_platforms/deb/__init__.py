@@ -15,9 +15,10 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Deb-specific module for craft-platforms."""
 
-from ._build import get_deb_build_plan
+from ._build import get_deb_build_plan, iter_deb_build_plan
 
 
 __all__ = [
     "get_deb_build_plan",
+    "iter_deb_build_plan",
 ]
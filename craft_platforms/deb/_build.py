@@ -15,9 +15,9 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Debcraft-specific platforms information."""
 
-from typing import Optional, Sequence
+from typing import Iterator, List, Optional, Sequence
 
-from craft_platforms import _buildinfo, _platforms
+from craft_platforms import _buildinfo, _filter, _instrument, _platforms
 from craft_platforms._architectures import DebianArchitecture
 from craft_platforms._distro import DistroBase
 
@@ -26,6 +26,8 @@ def get_deb_build_plan(
     base: Optional[str],
     platforms: Optional[_platforms.Platforms],
     build_base: Optional[str] = None,
+    *,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
 ) -> Sequence[_buildinfo.BuildInfo]:
     """Generate the build plan for a deb.
 
@@ -36,10 +38,42 @@ def get_deb_build_plan(
     :param base: the deb base (e.g. ``'ubuntu@24.04'``)
     :param platforms: the platforms structure in ``debcraft.yaml``
     :param build_base: the build base, if provided in ``debcraft.yaml``.
+    :param build_filter: If set, only entries that match this filter are included.
     :raises NeedsBuildBaseError: If base is bare and no build base is specified
     """
+    plan = iter_deb_build_plan(base, platforms, build_base, build_filter=build_filter)
+    if _instrument.HOOKS:
+        return _instrument.collect_plan("get_deb_build_plan", plan, platforms)
+    return list(plan)
+
+
+def iter_deb_build_plan(
+    base: Optional[str],
+    platforms: Optional[_platforms.Platforms],
+    build_base: Optional[str] = None,
+    *,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
+    errors: Optional[List[Exception]] = None,
+) -> Iterator[_buildinfo.BuildInfo]:
+    """Lazily generate the build plan for a deb.
+
+    This is the streaming form of :func:`get_deb_build_plan`. Errors are raised
+    during iteration.
+
+    :param base: the deb base (e.g. ``'ubuntu@24.04'``)
+    :param platforms: the platforms structure in ``debcraft.yaml``
+    :param build_base: the build base, if provided in ``debcraft.yaml``.
+    :param build_filter: If set, only entries that match this filter are included.
+    :param errors: If set, errors are appended to this list rather than raised, and
+        the rest of the project is still validated.
+    """
     if not base:
-        base = str(DistroBase.from_host())
+        from_host = DistroBase.from_host
+        if _instrument.HOOKS:
+            from_host = _instrument.timed(
+                _instrument.PlanningStage.RESOLVE_BASE, from_host
+            )
+        base = str(from_host())
     if not platforms:
         platforms = {
             "all": {
@@ -56,9 +90,11 @@ def get_deb_build_plan(
                 "build-for": ["all"],
             }
 
-    return _platforms.get_platforms_build_plan(
+    yield from _platforms.iter_platforms_build_plan(
         base,
         platforms,
         build_base,
         allow_all_and_architecture_dependent=True,
+        build_filter=build_filter,
+        errors=errors,
     )
@@ -15,9 +15,10 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Rock-specific module for craft-platforms."""
 
-from ._build import get_rock_build_plan
+from ._build import get_rock_build_plan, iter_rock_build_plan
 
 
 __all__ = [
     "get_rock_build_plan",
+    "iter_rock_build_plan",
 ]
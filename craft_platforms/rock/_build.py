@@ -15,9 +15,9 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Rockcraft-specific platforms information."""
 
-from typing import Optional, Sequence
+from typing import Iterator, List, Optional, Sequence
 
-from craft_platforms import _buildinfo, _errors, _platforms
+from craft_platforms import _buildinfo, _errors, _filter, _instrument, _platforms
 
 _LEGACY_BASES_MAP = {
     "ubuntu:20.04": "ubuntu@20.04",
@@ -29,6 +29,8 @@ def get_rock_build_plan(
     base: str,
     platforms: _platforms.Platforms,
     build_base: Optional[str] = None,
+    *,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
 ) -> Sequence[_buildinfo.BuildInfo]:
     """Generate the build plan for a rock.
 
@@ -38,11 +40,43 @@ def get_rock_build_plan(
     :param base: the rock base (e.g. ``'ubuntu@24.04'``)
     :param platforms: the platforms structure in ``rockcraft.yaml``
     :param build_base: the build base, if provided in ``rockcraft.yaml``.
+    :param build_filter: If set, only entries that match this filter are included.
+    :raises NeedsBuildBaseError: If base is bare and no build base is specified
+    """
+    plan = iter_rock_build_plan(base, platforms, build_base, build_filter=build_filter)
+    if _instrument.HOOKS:
+        return _instrument.collect_plan("get_rock_build_plan", plan, platforms)
+    return list(plan)
+
+
+def iter_rock_build_plan(
+    base: str,
+    platforms: _platforms.Platforms,
+    build_base: Optional[str] = None,
+    *,
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
+    errors: Optional[List[Exception]] = None,
+) -> Iterator[_buildinfo.BuildInfo]:
+    """Lazily generate the build plan for a rock.
+
+    This is the streaming form of :func:`get_rock_build_plan`. Errors are raised
+    during iteration.
+
+    :param base: the rock base (e.g. ``'ubuntu@24.04'``)
+    :param platforms: the platforms structure in ``rockcraft.yaml``
+    :param build_base: the build base, if provided in ``rockcraft.yaml``.
+    :param build_filter: If set, only entries that match this filter are included.
+    :param errors: If set, errors are appended to this list rather than raised, and
+        the rest of the project is still validated.
     :raises NeedsBuildBaseError: If base is bare and no build base is specified
     """
     # Bare bases require a build_base
+    base_error = None
     if base == "bare" and build_base is None:
-        raise _errors.NeedBuildBaseError(base=base)
+        base_error = _errors.NeedBuildBaseError(base=base)
+        if errors is None:
+            raise base_error
+        errors.append(base_error)
 
     if base in _LEGACY_BASES_MAP:
         base = _LEGACY_BASES_MAP[base]
@@ -51,9 +85,19 @@ def get_rock_build_plan(
 
     for name, platform in platforms.items():
         if platform and "all" in platform.get("build-for", []):
-            raise _errors.InvalidPlatformError(
+            error = _errors.InvalidPlatformError(
                 name,
                 details="Rockcraft cannot build platform-independent images.",
                 resolution="Replace 'build-for: [all]' with a valid architecture",
             )
-    return _platforms.get_platforms_build_plan(base, platforms, build_base)
+            if errors is None:
+                raise error
+            errors.append(error)
+    if base_error is not None:
+        yield from _platforms.iter_platforms_for_base(
+            None, platforms, build_filter=build_filter, errors=errors
+        )
+        return
+    yield from _platforms.iter_platforms_build_plan(
+        base, platforms, build_base, build_filter=build_filter, errors=errors
+    )
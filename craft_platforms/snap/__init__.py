@@ -19,10 +19,12 @@ from ._build import (
     get_default_architectures,
     get_distro_base_from_core_base,
     get_platforms_snap_build_plan,
+    iter_platforms_snap_build_plan,
 )
 
 __all__ = [
     "get_default_architectures",
     "get_distro_base_from_core_base",
     "get_platforms_snap_build_plan",
+    "iter_platforms_snap_build_plan",
 ]
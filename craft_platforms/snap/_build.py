@@ -17,9 +17,17 @@
 
 import re
 import typing
-from typing import Optional, Sequence, Union
+from typing import Iterator, List, Optional, Sequence, Union
 
-from craft_platforms import _architectures, _buildinfo, _distro, _errors, _platforms
+from craft_platforms import (
+    _architectures,
+    _buildinfo,
+    _distro,
+    _errors,
+    _filter,
+    _instrument,
+    _platforms,
+)
 
 CORE16_18_DEFAULT_ARCHITECTURES = (
     _architectures.DebianArchitecture.AMD64,
@@ -170,6 +178,7 @@ def get_platforms_snap_build_plan(
     build_base: Optional[str] = None,
     snap_type: typing.Literal["base", "kernel", "snapd"],
     platforms: Union[_platforms.Platforms, None],
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
 ) -> Sequence[_buildinfo.BuildInfo]: ...
 @typing.overload
 def get_platforms_snap_build_plan(
@@ -178,6 +187,7 @@ def get_platforms_snap_build_plan(
     build_base: Optional[str] = None,
     snap_type: Optional[str] = None,
     platforms: Union[_platforms.Platforms, None],
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
 ) -> Sequence[_buildinfo.BuildInfo]: ...
 def get_platforms_snap_build_plan(
     base: Optional[str],
@@ -185,6 +195,7 @@ def get_platforms_snap_build_plan(
     build_base: Optional[str] = None,
     snap_type: Optional[str] = None,
     platforms: Union[_platforms.Platforms, None],
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
 ) -> Sequence[_buildinfo.BuildInfo]:
     """Generate the build plan for a platforms-based snap.
 
@@ -192,10 +203,60 @@ def get_platforms_snap_build_plan(
     :param build_base: The ``build-base`` string in ``snapcraft.yaml`` (or ``None`` if
         not given)
     :param snap_type: One of "base", "kernel", "snapd"
+    :param build_filter: If set, only entries that match this filter are included.
+    """
+    plan = iter_platforms_snap_build_plan(
+        base,
+        build_base=build_base,
+        snap_type=snap_type,
+        platforms=platforms,
+        build_filter=build_filter,
+    )
+    if _instrument.HOOKS:
+        return _instrument.collect_plan(
+            "get_platforms_snap_build_plan", plan, platforms
+        )
+    return list(plan)
+
+
+def iter_platforms_snap_build_plan(
+    base: Optional[str],
+    *,
+    build_base: Optional[str] = None,
+    snap_type: Optional[str] = None,
+    platforms: Union[_platforms.Platforms, None],
+    build_filter: Optional[_filter.BuildPlanFilter] = None,
+    errors: Optional[List[Exception]] = None,
+) -> Iterator[_buildinfo.BuildInfo]:
+    """Lazily generate the build plan for a platforms-based snap.
+
+    This is the streaming form of :func:`get_platforms_snap_build_plan`. Errors are
+    raised during iteration.
+
+    :param base: The ``base`` string in ``snapcraft.yaml`` (or ``None`` if not given)
+    :param build_base: The ``build-base`` string in ``snapcraft.yaml`` (or ``None`` if
+        not given)
+    :param snap_type: One of "base", "kernel", "snapd"
+    :param build_filter: If set, only entries that match this filter are included.
+    :param errors: If set, errors are appended to this list rather than raised, and
+        the rest of the project is still validated.
     """
-    distro_base = get_snap_base(base=base, build_base=build_base, snap_type=snap_type)
+    get_base = get_snap_base
+    if _instrument.HOOKS:
+        get_base = _instrument.timed(_instrument.PlanningStage.RESOLVE_BASE, get_base)
+    try:
+        distro_base: Optional[_distro.DistroBase] = get_base(
+            base=base, build_base=build_base, snap_type=snap_type
+        )
+    except _errors.PROJECT_ERRORS as exc:
+        if errors is None:
+            raise
+        errors.append(exc)
+        distro_base = None
     if not platforms:
         platforms = dict.fromkeys(
             get_default_architectures(base or build_base or "default")
         )
-    return _platforms.get_platforms_build_plan(distro_base, platforms)
+    yield from _platforms.iter_platforms_for_base(
+        distro_base, platforms, build_filter=build_filter, errors=errors
+    )
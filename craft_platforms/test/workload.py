@@ -0,0 +1,305 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Seeded generation of synthetic project workloads for load testing."""
+
+import dataclasses
+import itertools
+import random
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from craft_platforms import _architectures
+
+APPS = ("charmcraft", "debcraft", "rockcraft", "snapcraft")
+"""The applications whose projects can be generated."""
+
+_ARCHITECTURES = tuple(arch.value for arch in _architectures.DebianArchitecture)
+_CHARM_BASES = ("ubuntu@20.04", "ubuntu@22.04", "ubuntu@24.04")
+_DEB_BASES = ("ubuntu@22.04", "ubuntu@24.04", "debian@12")
+_ROCK_BASES = ("ubuntu@22.04", "ubuntu@24.04")
+_SNAP_BASES = ("core22", "core24")
+_INVALID_ARCHITECTURE = "z80"
+# The ratio of platforms and legacy bases written in their short forms.
+_SHORT_FORM_RATIO = 0.5
+# The ratio of rock projects with a bare base.
+_BARE_RATIO = 0.2
+
+
+def _default_app_weights() -> Dict[str, float]:
+    return dict.fromkeys(APPS, 1.0)
+
+
+def _default_platform_counts() -> Dict[int, float]:
+    return {1: 40.0, 2: 25.0, 3: 15.0, 4: 10.0, 8: 7.0, 32: 3.0}
+
+
+@dataclasses.dataclass(frozen=True)
+class WorkloadConfig:
+    """The shape of a generated workload.
+
+    Weights are relative to each other and needn't sum to one. Ratios are the
+    probability that a single project has the given feature, where it applies.
+    """
+
+    seed: int = 0
+    """The seed of the workload. The same seed always generates the same projects."""
+
+    app_weights: Mapping[str, float] = dataclasses.field(
+        default_factory=_default_app_weights
+    )
+    """The relative weight of each application's projects."""
+
+    platform_counts: Mapping[int, float] = dataclasses.field(
+        default_factory=_default_platform_counts
+    )
+    """The relative weight of each count of platforms (or legacy bases) in a project."""
+
+    multi_base_ratio: float = 0.2
+    """The ratio of charm projects that declare a base in each platform."""
+
+    build_for_all_ratio: float = 0.1
+    """The ratio of projects with a ``build-for: [all]`` platform.
+
+    Rock projects never build for ``all``.
+    """
+
+    legacy_bases_ratio: float = 0.1
+    """The ratio of charm projects that use the legacy ``bases`` key."""
+
+    invalid_ratio: float = 0.0
+    """The ratio of projects that contain an invalid entry."""
+
+    def __post_init__(self) -> None:
+        unknown_apps = set(self.app_weights) - set(APPS)
+        if unknown_apps:
+            raise ValueError(f"Unknown applications: {', '.join(sorted(unknown_apps))}")
+        if not any(weight > 0 for weight in self.app_weights.values()):
+            raise ValueError("At least one application must have a positive weight")
+        if not any(weight > 0 for weight in self.platform_counts.values()):
+            raise ValueError("At least one platform count must have a positive weight")
+        if any(count < 1 for count in self.platform_counts):
+            raise ValueError("Platform counts must be at least 1")
+        for field in (
+            "multi_base_ratio",
+            "build_for_all_ratio",
+            "legacy_bases_ratio",
+            "invalid_ratio",
+        ):
+            if not 0 <= getattr(self, field) <= 1:
+                raise ValueError(f"{field} must be between 0 and 1")
+
+
+class WorkloadProject(NamedTuple):
+    """A single generated project."""
+
+    index: int
+    """The position of the project in the workload."""
+
+    app: str
+    """The application that builds the project."""
+
+    project_data: Dict[str, Any]
+    """The project's data, as passed to :func:`~craft_platforms.get_build_plan`."""
+
+    valid: bool
+    """Whether the project was generated to be valid."""
+
+
+def _platforms(
+    rng: random.Random, count: int, bases: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """Generate platforms in a mix of shorthand and longhand forms.
+
+    :param bases: Bases to choose from to prefix each platform's architectures with,
+        for multi-base platforms.
+    """
+    platforms: Dict[str, Any] = {}
+    for index in range(count):
+        prefix = f"{rng.choice(bases)}:" if bases else ""
+        arch = rng.choice(_ARCHITECTURES)
+        shorthand = f"{prefix}{arch}"
+        if shorthand not in platforms and rng.random() < _SHORT_FORM_RATIO:
+            platforms[shorthand] = None
+            continue
+        build_on = rng.sample(_ARCHITECTURES, rng.randint(1, 3))
+        platforms[f"{arch}-{index}"] = {
+            "build-on": [f"{prefix}{on}" for on in build_on],
+            "build-for": [shorthand],
+        }
+    return platforms
+
+
+def _all_platform(rng: random.Random, base: Optional[str] = None) -> Dict[str, Any]:
+    prefix = f"{base}:" if base else ""
+    build_on = rng.sample(_ARCHITECTURES, rng.randint(1, len(_ARCHITECTURES)))
+    return {
+        "build-on": [f"{prefix}{on}" for on in build_on],
+        "build-for": [f"{prefix}all"],
+    }
+
+
+def _legacy_bases(rng: random.Random, count: int) -> List[Dict[str, Any]]:
+    bases = []
+    for _ in range(count):
+        channel = rng.choice(_CHARM_BASES).partition("@")[2]
+        archs = rng.sample(_ARCHITECTURES, rng.randint(1, 2))
+        base = {"name": "ubuntu", "channel": channel, "architectures": archs}
+        if rng.random() < _SHORT_FORM_RATIO:
+            # The short form, which builds on and runs on the same base.
+            bases.append(base)
+        else:
+            bases.append(
+                {"build-on": [base], "run-on": [{**base, "architectures": archs[:]}]}
+            )
+    return bases
+
+
+def _charm(rng: random.Random, count: int, config: WorkloadConfig) -> Dict[str, Any]:
+    project: Dict[str, Any] = {"name": "my-charm", "type": "charm"}
+    if rng.random() < config.legacy_bases_ratio:
+        project["bases"] = _legacy_bases(rng, count)
+        return project
+    if rng.random() < config.multi_base_ratio:
+        platforms = _platforms(rng, count, _CHARM_BASES)
+        if rng.random() < config.build_for_all_ratio:
+            platforms["all"] = _all_platform(rng, rng.choice(_CHARM_BASES))
+        project["platforms"] = platforms
+        return project
+    project["base"] = rng.choice(_CHARM_BASES)
+    project["platforms"] = _platforms(rng, count)
+    if rng.random() < config.build_for_all_ratio:
+        project["platforms"]["all"] = _all_platform(rng)
+    return project
+
+
+def _deb(rng: random.Random, count: int, config: WorkloadConfig) -> Dict[str, Any]:
+    platforms = _platforms(rng, count)
+    if rng.random() < config.build_for_all_ratio:
+        platforms["all"] = _all_platform(rng)
+    return {"name": "my-deb", "base": rng.choice(_DEB_BASES), "platforms": platforms}
+
+
+def _rock(rng: random.Random, count: int, config: WorkloadConfig) -> Dict[str, Any]:
+    del config  # Rocks can't build for "all".
+    project: Dict[str, Any] = {"name": "my-rock"}
+    base = rng.choice(_ROCK_BASES)
+    if rng.random() < _BARE_RATIO:
+        project["base"] = "bare"
+        project["build-base"] = base
+    else:
+        project["base"] = base
+    project["platforms"] = _platforms(rng, count)
+    return project
+
+
+def _snap(rng: random.Random, count: int, config: WorkloadConfig) -> Dict[str, Any]:
+    # "build-for: [all]" must be a snap's only platform.
+    if rng.random() < config.build_for_all_ratio:
+        platforms = {"all": _all_platform(rng)}
+    else:
+        platforms = _platforms(rng, count)
+    return {"name": "my-snap", "base": rng.choice(_SNAP_BASES), "platforms": platforms}
+
+
+_GENERATORS: Dict[
+    str, Callable[[random.Random, int, WorkloadConfig], Dict[str, Any]]
+] = {
+    "charmcraft": _charm,
+    "debcraft": _deb,
+    "rockcraft": _rock,
+    "snapcraft": _snap,
+}
+
+# Platforms that no planner accepts.
+_INVALID_PLATFORMS = (
+    ("bad-build-on", {"build-on": [_INVALID_ARCHITECTURE], "build-for": ["amd64"]}),
+    ("bad-build-for", {"build-on": ["amd64"], "build-for": [_INVALID_ARCHITECTURE]}),
+    ("no-build-on", {"build-for": ["amd64"]}),
+    (_INVALID_ARCHITECTURE, None),
+)
+
+
+def _make_invalid(rng: random.Random, project: Dict[str, Any]) -> None:
+    """Add an invalid entry to a valid project."""
+    if "bases" in project:
+        bases = project["bases"]
+        bases[rng.randrange(len(bases))] = {
+            "name": "ubuntu",
+            "channel": "22.04",
+            "architectures": [_INVALID_ARCHITECTURE],
+        }
+        return
+    name, platform = rng.choice(_INVALID_PLATFORMS)
+    project["platforms"][name] = platform
+
+
+def _generate(index: int, config: WorkloadConfig) -> WorkloadProject:
+    # Each project has its own generator so that any slice of a workload can be
+    # generated without generating the projects before it.
+    rng = random.Random(f"{config.seed}:{index}")  # noqa: S311 (not for security)
+    app = rng.choices(list(config.app_weights), list(config.app_weights.values()))[0]
+    count = rng.choices(
+        list(config.platform_counts), list(config.platform_counts.values())
+    )[0]
+    project = _GENERATORS[app](rng, count, config)
+    valid = rng.random() >= config.invalid_ratio
+    if not valid:
+        _make_invalid(rng, project)
+    return WorkloadProject(index=index, app=app, project_data=project, valid=valid)
+
+
+def iter_workload(
+    count: Optional[int] = None,
+    *,
+    config: Optional[WorkloadConfig] = None,
+    start: int = 0,
+) -> Iterator[WorkloadProject]:
+    """Generate a deterministic workload of synthetic projects.
+
+    Projects are generated lazily, one at a time, so a workload of any size can be
+    streamed without holding it in memory. Each project depends only on the seed and
+    its index, so a workload can be split into shards with ``start`` and ``count``
+    and each shard generated independently.
+
+    To plan a workload, pass its ``(app, project_data)`` pairs to
+    :func:`~craft_platforms.get_build_plans`:
+
+    .. code-block:: python
+
+        workload = iter_workload(1_000_000, config=WorkloadConfig(seed=42))
+        results = get_build_plans((p.app, p.project_data) for p in workload)
+
+    :param count: The number of projects to generate, or ``None`` to generate
+        projects forever.
+    :param config: The shape of the workload. Defaults to :class:`WorkloadConfig`'s
+        defaults.
+    :param start: The index of the first project to generate.
+    :yields: A :class:`WorkloadProject` for each project, in index order.
+    """
+    if config is None:
+        config = WorkloadConfig()
+    indices = itertools.count(start) if count is None else range(start, start + count)
+    for index in indices:
+        yield _generate(index, config)
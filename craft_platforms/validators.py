@@ -20,11 +20,14 @@ validators.
 """
 
 import unicodedata
-from typing import List
+from typing import Iterable, List, Tuple
 
+from craft_platforms import _cache
 from craft_platforms._errors import InvalidPlatformNameError
 from craft_platforms._platforms import RESERVED_PLATFORM_NAMES
 
+NAME_CACHE_SIZE = 4096
+
 _ALLOWED_UNICODE_CATEGORIES = (
     # See: https://www.unicode.org/reports/tr44/tr44-34.html#General_Category_Values
     "L",  # All letter characters
@@ -41,12 +44,66 @@ _ALLOWED_MIDDLE_CHARACTERS = (
 
 _APPLICATION_RESERVED_CHARACTERS = ("/", "_")  # Only allowed for use by an application.
 
+_ALLOWED_PUNCTUATION = frozenset(
+    _ALLOWED_MIDDLE_CHARACTERS + _APPLICATION_RESERVED_CHARACTERS
+)
+
+# Every ASCII character that may appear somewhere in a platform name. Checking a
+# pure-ASCII name against this set avoids looking up each character's category.
+_ALLOWED_ASCII_CHARACTERS = _ALLOWED_PUNCTUATION | frozenset(
+    character
+    for character in map(chr, range(128))
+    if unicodedata.category(character).startswith(_ALLOWED_UNICODE_CATEGORIES)
+)
+
+
+@_cache.lru_cache("strict_platform_name", maxsize=NAME_CACHE_SIZE)
+def _get_invalid_characters(
+    name: str, *, allow_app_characters: bool
+) -> Tuple[str, ...]:
+    """Get the characters that make a platform name invalid, in reporting order."""
+    invalid_characters: List[str] = []
+    if not allow_app_characters:
+        invalid_characters.extend(
+            character
+            for character in _APPLICATION_RESERVED_CHARACTERS
+            if character in name
+        )
+
+    invalid_characters.extend(
+        character
+        for character in _ALLOWED_MIDDLE_CHARACTERS
+        if name.startswith(character) or name.endswith(character)
+    )
+
+    if name.isascii():
+        if not _ALLOWED_ASCII_CHARACTERS.issuperset(name):
+            invalid_characters.extend(
+                character
+                for character in name
+                if character not in _ALLOWED_ASCII_CHARACTERS
+            )
+    else:
+        invalid_characters.extend(
+            character
+            for character in name
+            if character not in _ALLOWED_PUNCTUATION
+            and not unicodedata.category(character).startswith(
+                _ALLOWED_UNICODE_CATEGORIES
+            )
+        )
+
+    return tuple(invalid_characters)
+
 
 def validate_strict_platform_name(
     name: str, *, allow_app_characters: bool = True
 ) -> str:
     """Validate a strictly-defined platform name.
 
+    The result of validating each name is cached, so validating the same name again
+    is a dictionary lookup.
+
     :param name: the platform name to validate.
     :param allow_app_characters: Whether to allow characters that are reserved for use
         by applications. If False, an app-generated platform name can raise an error.
@@ -60,37 +117,36 @@ def validate_strict_platform_name(
             doc_slug="platform-name-rules",
             reportable=False,
         )
-    invalid_characters: List[str] = []
-    if not allow_app_characters:
-        invalid_characters.extend(
-            character
-            for character in _APPLICATION_RESERVED_CHARACTERS
-            if character in name
-        )
-
-    invalid_characters.extend(
-        character
-        for character in _ALLOWED_MIDDLE_CHARACTERS
-        if name.startswith(character) or name.endswith(character)
+    invalid_characters = _get_invalid_characters(
+        name, allow_app_characters=allow_app_characters
     )
 
-    for character in name:
-        category = unicodedata.category(character)
-        if character in (_ALLOWED_MIDDLE_CHARACTERS + _APPLICATION_RESERVED_CHARACTERS):
-            continue
-        for allowed_category in _ALLOWED_UNICODE_CATEGORIES:
-            if category.startswith(allowed_category):
-                break
-        else:
-            invalid_characters.append(character)
-
     if invalid_characters:
         raise InvalidPlatformNameError(
             message=f"Invalid platform name: {name!r}",
-            details=f"Platform name contains invalid characters: {invalid_characters}",
+            details=f"Platform name contains invalid characters: {list(invalid_characters)}",
             resolution=f"Rename platform {name!r} to follow the naming rules.",
             doc_slug="platform-name-rules",
             reportable=False,
         )
 
     return name
+
+
+def validate_strict_platform_names(
+    names: Iterable[str], *, allow_app_characters: bool = True
+) -> List[str]:
+    """Validate many strictly-defined platform names.
+
+    Each distinct name is only checked once.
+
+    :param names: the platform names to validate.
+    :param allow_app_characters: Whether to allow characters that are reserved for use
+        by applications.
+    :returns: the platform names, if all are valid.
+    :raises: InvalidPlatformName for the first platform name that is invalid.
+    """
+    names = list(names)
+    for name in dict.fromkeys(names):
+        validate_strict_platform_name(name, allow_app_characters=allow_app_characters)
+    return names
@@ -0,0 +1,160 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Recording and comparing benchmark results.
+
+Benchmarks that use the ``benchmark`` fixture are timed and their results can be
+written to a JSON file with ``--cp-bench-json``. A previous results file can be
+given with ``--cp-bench-compare`` to fail any benchmark that became slower than
+``--cp-bench-tolerance`` allows.
+"""
+
+import json
+import math
+import pathlib
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import craft_platforms
+import pytest
+
+RESULTS_VERSION = 1
+"""The version of the format of the results file."""
+
+ROUNDS = 5
+"""The number of times each benchmark is timed."""
+
+MIN_ROUND_TIME = 0.05
+"""The least time in seconds that each round should take."""
+
+_RESULTS: Dict[str, Dict[str, Any]] = {}
+
+
+class Benchmark:
+    """Times a function and records the result under the current test's ID."""
+
+    def __init__(self, name: str, baseline: Optional[Dict[str, Any]], tolerance: float):
+        self.name = name
+        self.baseline = baseline
+        self.tolerance = tolerance
+
+    def __call__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Time a function called with the given arguments.
+
+        Each round calls the function enough times to take at least
+        :data:`MIN_ROUND_TIME`, and the per-call times of each round are recorded.
+
+        :returns: The function's return value.
+        """
+        # The first call warms up any caches and calibrates the number of calls.
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        iterations = max(1, math.ceil(MIN_ROUND_TIME / max(elapsed, 1e-9)))
+        timer = timeit.Timer(lambda: func(*args, **kwargs))
+        times = [
+            total / iterations for total in timer.repeat(ROUNDS, number=iterations)
+        ]
+        self.record(times, iterations=iterations)
+        return result
+
+    def record(self, times: Sequence[float], *, iterations: int = 1) -> None:
+        """Record times that were measured some other way, such as in a subprocess.
+
+        :param times: The time in seconds of a single call in each round.
+        :param iterations: The number of calls that each round's time is averaged
+            over.
+        """
+        _RESULTS[self.name] = {
+            "min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.mean(times),
+            "rounds": len(times),
+            "iterations": iterations,
+        }
+        self._compare(_RESULTS[self.name])
+
+    def _compare(self, stats: Dict[str, Any]) -> None:
+        if self.baseline is None or self.name not in self.baseline:
+            return
+        baseline_min = self.baseline[self.name]["min"]
+        limit = baseline_min * (1 + self.tolerance)
+        if stats["min"] > limit:
+            pytest.fail(
+                f"{self.name} took {stats['min'] * 1e6:.1f}µs per call, more than "
+                f"{self.tolerance:.0%} slower than the baseline of "
+                f"{baseline_min * 1e6:.1f}µs.",
+                pytrace=False,
+            )
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline(request) -> Optional[Dict[str, Any]]:
+    path = request.config.getoption("--cp-bench-compare")
+    if not path:
+        return None
+    with pathlib.Path(path).open() as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline.get("version") != RESULTS_VERSION:
+        raise pytest.UsageError(f"Unsupported benchmark results file: {path}")
+    return baseline["benchmarks"]
+
+
+@pytest.fixture
+def benchmark(request, benchmark_baseline) -> Benchmark:
+    """Time a function, recording and comparing the result."""
+    return Benchmark(
+        request.node.nodeid,
+        benchmark_baseline,
+        request.config.getoption("--cp-bench-tolerance"),
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    path = config.getoption("--cp-bench-compare")
+    if not path or not _RESULTS:
+        return
+    with pathlib.Path(path).open() as baseline_file:
+        baseline = json.load(baseline_file)["benchmarks"]
+    terminalreporter.section("benchmark comparison")
+    for name, stats in sorted(_RESULTS.items()):
+        if name in baseline:
+            ratio = stats["min"] / baseline[name]["min"]
+            terminalreporter.write_line(f"{ratio:6.2f}x  {name}")
+        else:
+            terminalreporter.write_line(f"{'new':>7}  {name}")
+
+
+def pytest_sessionfinish(session):
+    path = session.config.getoption("--cp-bench-json")
+    if not path or not _RESULTS:
+        return
+    results = {
+        "version": RESULTS_VERSION,
+        "machine": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "craft_platforms": craft_platforms.__version__,
+        },
+        "benchmarks": dict(sorted(_RESULTS.items())),
+    }
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2) + "\n")
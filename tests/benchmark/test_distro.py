@@ -0,0 +1,81 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmarks for distribution bases."""
+
+import contextlib
+import functools
+import operator
+import random
+
+import craft_platforms
+import pytest
+
+pytestmark = pytest.mark.slow
+
+
+def _legacy_series_tuple(series: str) -> tuple:
+    parts = series.split(".")
+    for idx, part in enumerate(parts):
+        with contextlib.suppress(ValueError):
+            parts[idx] = int(part)  # ty: ignore[invalid-assignment]
+    return tuple(parts)
+
+
+def _legacy_compare(
+    left: craft_platforms.DistroBase, right: craft_platforms.DistroBase
+) -> int:
+    """Compare two bases the way DistroBase did before sort keys were cached."""
+    if left.series == "devel" or right.series == "devel":
+        return (left.series == "devel") - (right.series == "devel")
+    left_tuple = _legacy_series_tuple(left.series)
+    right_tuple = _legacy_series_tuple(right.series)
+    if not all(type(lhs) is type(rhs) for lhs, rhs in zip(left_tuple, right_tuple)):
+        raise ValueError("incompatible")
+    return (left_tuple > right_tuple) - (left_tuple < right_tuple)
+
+
+@pytest.fixture(scope="module")
+def ubuntu_bases() -> list:
+    rng = random.Random(0)  # noqa: S311
+    bases = [
+        craft_platforms.DistroBase(
+            "ubuntu", f"{rng.randint(4, 99)}.{rng.choice(('04', '10'))}"
+        )
+        for _ in range(5000)
+    ]
+    bases.extend([craft_platforms.DistroBase("ubuntu", "devel")] * 10)
+    rng.shuffle(bases)
+    return bases
+
+
+def test_sort_key_matches_comparisons(ubuntu_bases):
+    by_key = sorted(ubuntu_bases, key=operator.attrgetter("sort_key"))
+
+    assert by_key == sorted(ubuntu_bases)
+    assert by_key == sorted(ubuntu_bases, key=functools.cmp_to_key(_legacy_compare))
+    assert max(ubuntu_bases) == craft_platforms.DistroBase("ubuntu", "devel")
+
+
+def test_sort_legacy(benchmark, ubuntu_bases):
+    benchmark(sorted, ubuntu_bases, key=functools.cmp_to_key(_legacy_compare))
+
+
+def test_sort_by_key(benchmark, ubuntu_bases):
+    benchmark(sorted, ubuntu_bases, key=operator.attrgetter("sort_key"))
+
+
+def test_sort_by_operators(benchmark, ubuntu_bases):
+    benchmark(sorted, ubuntu_bases)
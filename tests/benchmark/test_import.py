@@ -0,0 +1,52 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmarks for the time it takes to import craft_platforms."""
+
+import pytest
+
+from tests.benchmark.conftest import ROUNDS
+from tests.integration.test_import import get_import_times
+
+pytestmark = pytest.mark.slow
+
+EAGER_IMPORT = (
+    "import craft_platforms; [getattr(craft_platforms, name) "
+    "for name in craft_platforms.__all__]"
+)
+"""Import craft_platforms and every public name, as before imports were lazy."""
+
+
+def _import_time(code: str) -> float:
+    """Get the time in seconds that ``code`` spends on imports.
+
+    Imports made by the bare interpreter at startup aren't counted.
+    """
+    startup = get_import_times("pass").keys()
+    return (
+        sum(
+            cumulative
+            for name, cumulative in get_import_times(code, top_level=True).items()
+            if name not in startup
+        )
+        / 1e6
+    )
+
+
+@pytest.mark.parametrize(
+    "code", ["import craft_platforms", EAGER_IMPORT], ids=["lazy", "eager"]
+)
+def test_import_time(benchmark, code):
+    benchmark.record([_import_time(code) for _ in range(ROUNDS)])
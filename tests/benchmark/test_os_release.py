@@ -0,0 +1,65 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmarks for finding the bases of root filesystems."""
+
+import craft_platforms
+import distro
+import pytest
+
+from tests.unit.test_distro import CENTOS_7, DEBIAN_10
+
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture(scope="module")
+def roots(tmp_path_factory):
+    roots = []
+    for index in range(300):
+        root = tmp_path_factory.mktemp("root")
+        (root / "usr" / "lib").mkdir(parents=True)
+        (root / "usr" / "lib" / "os-release").write_text(
+            CENTOS_7 if index % 2 else DEBIAN_10
+        )
+        (root / "etc").mkdir()
+        (root / "etc" / "os-release").symlink_to("../usr/lib/os-release")
+        roots.append(root)
+    return roots
+
+
+def test_from_root_with_distro(benchmark, roots):
+    def with_distro():
+        for root in roots:
+            craft_platforms.DistroBase.from_linux_distribution(
+                distro.LinuxDistribution(
+                    include_lsb=False, include_uname=False, root_dir=str(root)
+                )
+            )
+
+    benchmark(with_distro)
+
+
+def test_from_root_sequential(benchmark, roots):
+    def sequential():
+        for root in roots:
+            craft_platforms.DistroBase.from_root(root)
+
+    benchmark(sequential)
+
+
+def test_get_root_bases(benchmark, roots):
+    results = benchmark(lambda: list(craft_platforms.get_root_bases(roots)))
+
+    assert all(result.error is None for result in results)
@@ -0,0 +1,190 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmarks for each build planner at realistic and extreme scales.
+
+Run these with ``make benchmark``. The timings are of warm caches, as when an
+application plans several projects in a single process.
+"""
+
+import pathlib
+
+import craft_platforms
+import pytest
+import yaml
+from craft_platforms import charm, deb, snap, validators
+
+pytestmark = pytest.mark.slow
+
+VALID_PROJECTS = pathlib.Path(__file__).parent.parent / "integration" / "valid-projects"
+ARCHITECTURES = [arch.value for arch in craft_platforms.DebianArchitecture]
+CHARM_BASES = ["ubuntu@20.04", "ubuntu@22.04", "ubuntu@24.04"]
+
+# The number of platforms in a project at each scale.
+SCALES = {"realistic": 8, "extreme": 500}
+
+
+@pytest.fixture(autouse=True)
+def fake_host():
+    host_info = craft_platforms.HostInfo(
+        craft_platforms.DistroBase("debian", "unstable"),
+        architecture=craft_platforms.DebianArchitecture.AMD64,
+    )
+    with craft_platforms.use_host_info(host_info):
+        yield
+
+
+@pytest.fixture(params=SCALES.values(), ids=list(SCALES))
+def scale(request) -> int:
+    return request.param
+
+
+def _native_platforms(count: int) -> dict:
+    """Platforms that build on and for a single architecture."""
+    return {
+        f"{ARCHITECTURES[i % len(ARCHITECTURES)]}-{i}": {
+            "build-on": [ARCHITECTURES[i % len(ARCHITECTURES)]],
+            "build-for": [ARCHITECTURES[i % len(ARCHITECTURES)]],
+        }
+        for i in range(count)
+    }
+
+
+def _cross_platforms(count: int) -> dict:
+    """Platforms that build on every architecture, with long build-on lists."""
+    return {
+        f"cross-{i}": {
+            "build-on": ARCHITECTURES,
+            "build-for": [ARCHITECTURES[i % len(ARCHITECTURES)]],
+        }
+        for i in range(count)
+    }
+
+
+def _multi_base_platforms(count: int) -> dict:
+    """Charm platforms with base-prefixed build-on and build-for entries."""
+    platforms = {}
+    for i in range(count):
+        base = CHARM_BASES[i % len(CHARM_BASES)]
+        arch = ARCHITECTURES[i % len(ARCHITECTURES)]
+        platforms[f"{base}-{arch}-{i}"] = {
+            "build-on": [f"{base}:{on}" for on in ARCHITECTURES],
+            "build-for": [f"{base}:{arch}"],
+        }
+    return platforms
+
+
+@pytest.mark.parametrize(
+    "path", sorted(VALID_PROJECTS.iterdir()), ids=lambda path: path.stem
+)
+def test_valid_project(benchmark, path):
+    app = path.name.partition("-")[0]
+    project_data = yaml.safe_load(path.read_text())
+
+    build_plan = benchmark(
+        craft_platforms.get_build_plan, app, project_data=project_data
+    )
+
+    assert [repr(info) for info in build_plan] == project_data["_build_plan"]
+
+
+@pytest.mark.parametrize("make_platforms", [_native_platforms, _cross_platforms])
+def test_get_platforms_build_plan(benchmark, scale, make_platforms):
+    platforms = make_platforms(scale)
+
+    build_plan = benchmark(
+        craft_platforms.get_platforms_build_plan, "ubuntu@24.04", platforms
+    )
+
+    assert len(build_plan) >= scale
+
+
+def test_get_build_plan(benchmark, scale):
+    project_data = {
+        "base": "ubuntu@24.04",
+        "platforms": {**_native_platforms(scale), **_cross_platforms(scale)},
+    }
+
+    build_plan = benchmark(
+        craft_platforms.get_build_plan,
+        "mycraft",
+        project_data=project_data,
+        strict_platform_names=True,
+    )
+
+    assert len(build_plan) == scale * (1 + len(ARCHITECTURES))
+
+
+def test_get_charm_multi_base_build_plan(benchmark, scale):
+    platforms = _multi_base_platforms(scale)
+
+    build_plan = benchmark(charm.get_platforms_charm_build_plan, None, platforms)
+
+    assert len(build_plan) == scale * len(ARCHITECTURES)
+
+
+def test_get_charm_bases_build_plan(benchmark, scale):
+    bases = [
+        {
+            "build-on": [
+                {"name": "ubuntu", "channel": channel, "architectures": ARCHITECTURES}
+            ],
+            "run-on": [
+                {"name": "ubuntu", "channel": channel, "architectures": [arch]}
+                for arch in ARCHITECTURES
+            ],
+        }
+        for channel in (f"{20 + i % 5}.04" for i in range(scale))
+    ]
+
+    build_plan = benchmark(charm.get_bases_charm_build_plan, bases)
+
+    assert len(build_plan) == scale * len(ARCHITECTURES) ** 2
+
+
+@pytest.mark.parametrize("make_platforms", [_native_platforms, _cross_platforms])
+def test_get_platforms_snap_build_plan(benchmark, scale, make_platforms):
+    platforms = make_platforms(scale)
+
+    build_plan = benchmark(
+        snap.get_platforms_snap_build_plan, "core24", platforms=platforms
+    )
+
+    assert len(build_plan) >= scale
+
+
+@pytest.mark.parametrize("base", ["ubuntu@24.04", None])
+def test_get_deb_build_plan(benchmark, scale, base):
+    platforms = {
+        **_native_platforms(scale),
+        "all": {"build-on": ARCHITECTURES, "build-for": ["all"]},
+    }
+
+    build_plan = benchmark(deb.get_deb_build_plan, base, platforms)
+
+    assert len(build_plan) == scale + len(ARCHITECTURES)
+
+
+def test_validate_strict_platform_name(benchmark, scale):
+    names = [
+        f"ubuntu@24.04:{ARCHITECTURES[i % len(ARCHITECTURES)]}-variant-{i}"
+        for i in range(scale * 10)
+    ]
+
+    def validate_all():
+        for name in names:
+            validators.validate_strict_platform_name(name)
+
+    benchmark(validate_all)
@@ -0,0 +1,78 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmarks for platform name validation."""
+
+import random
+import unicodedata
+from typing import List
+
+import craft_platforms
+import pytest
+from craft_platforms import validators
+
+pytestmark = pytest.mark.slow
+
+
+def _legacy_is_valid(name: str) -> bool:
+    """Check a name the way the validator did before its fast path."""
+    for character in name:
+        category = unicodedata.category(character)
+        if character in (
+            validators._ALLOWED_MIDDLE_CHARACTERS
+            + validators._APPLICATION_RESERVED_CHARACTERS
+        ):
+            continue
+        for allowed_category in validators._ALLOWED_UNICODE_CATEGORIES:
+            if category.startswith(allowed_category):
+                break
+        else:
+            return False
+    return True
+
+
+@pytest.fixture(scope="module")
+def platform_names() -> List[str]:
+    rng = random.Random(0)  # noqa: S311
+    architectures = [arch.value for arch in craft_platforms.DebianArchitecture]
+    names = [
+        f"ubuntu@{rng.randint(16, 26)}.04:{rng.choice(architectures)}-"
+        f"{rng.choice(('raspi', 'generic', 'nvidia'))}{rng.randint(0, 99)}"
+        for _ in range(2000)
+    ]
+    names.extend(f"plataforma-{i}-ñ" for i in range(50))
+    # Stay within the cache so that the cached run measures lookups.
+    assert len(set(names)) < validators.NAME_CACHE_SIZE
+    return names
+
+
+def test_validate_legacy(benchmark, platform_names):
+    def legacy():
+        for name in platform_names:
+            _legacy_is_valid(name)
+
+    benchmark(legacy)
+
+
+def test_validate_uncached(benchmark, platform_names):
+    def uncached():
+        craft_platforms.clear_caches()
+        validators.validate_strict_platform_names(platform_names)
+
+    benchmark(uncached)
+
+
+def test_validate_cached(benchmark, platform_names):
+    benchmark(validators.validate_strict_platform_names, platform_names)
@@ -17,6 +17,27 @@ import pytest
 from craft_platforms._distro import DistroBase
 
 
+def pytest_addoption(parser):
+    group = parser.getgroup("cp-bench", "benchmark results (see tests/benchmark)")
+    group.addoption(
+        "--cp-bench-json",
+        metavar="PATH",
+        help="Write the results of the benchmarks to a JSON file.",
+    )
+    group.addoption(
+        "--cp-bench-compare",
+        metavar="PATH",
+        help="Fail benchmarks that are slower than in this JSON file of results.",
+    )
+    group.addoption(
+        "--cp-bench-tolerance",
+        type=float,
+        default=0.2,
+        metavar="FRACTION",
+        help="How much slower than the baseline a benchmark may be (default: 0.2).",
+    )
+
+
 @pytest.fixture
 def project_main_module() -> types.ModuleType:
     """Fixture that returns the project's principal package (imported).
@@ -13,6 +13,7 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Integration tests that test end-to-end build planning."""
 
+import concurrent.futures
 import pathlib
 
 import craft_platforms
@@ -39,6 +40,10 @@ def test_valid_projects_succeed(filename: str) -> None:
     expected = project_data["_build_plan"]
 
     assert [repr(item) for item in build_plan] == expected
+    assert (
+        list(craft_platforms.iter_build_plan(app=app_name, project_data=project_data))
+        == build_plan
+    )
 
 
 @pytest.mark.parametrize(
@@ -59,3 +64,116 @@ def test_invalid_platform_names(filename: str) -> None:
         InvalidPlatformNameError, match="Platform name '.*' is reserved."
     ):
         craft_platforms.get_build_plan(app=app_name, project_data=project_data)
+
+
+@pytest.mark.usefixtures("fake_host_base_sid")
+def test_valid_projects_batch() -> None:
+    projects = []
+    for path in sorted((pathlib.Path(__file__).parent / "valid-projects").iterdir()):
+        with path.open() as f:
+            projects.append((path.name.partition("-")[0], yaml.safe_load(f)))
+
+    # The host base fixture only patches this process, so use threads.
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        results = list(craft_platforms.get_build_plans(projects, executor=executor))
+
+    assert len(results) == len(projects)
+    for result in results:
+        _, project_data = projects[result.index]
+        assert result.error is None
+        assert result.build_plan is not None
+        assert [repr(item) for item in result.build_plan] == project_data["_build_plan"]
+
+
+@pytest.mark.parametrize(
+    ("filename"),
+    [
+        path.name
+        for path in (pathlib.Path(__file__).parent / "valid-projects").iterdir()
+    ],
+)
+@pytest.mark.parametrize(
+    "build_filter",
+    [
+        pytest.param(craft_platforms.BuildPlanFilter(build_on="amd64"), id="build-on"),
+        pytest.param(
+            craft_platforms.BuildPlanFilter(build_for=["riscv64", "all"]),
+            id="build-for",
+        ),
+        pytest.param(
+            craft_platforms.BuildPlanFilter(platform=["amd64", "jammy-amd64"]),
+            id="platform",
+        ),
+        pytest.param(
+            craft_platforms.BuildPlanFilter(
+                build_base=craft_platforms.DistroBase("ubuntu", "22.04")
+            ),
+            id="build-base",
+        ),
+        pytest.param(
+            craft_platforms.BuildPlanFilter(
+                build_on=["arm64", "s390x"],
+                predicate=lambda info: info.build_on != info.build_for,
+            ),
+            id="predicate",
+        ),
+    ],
+)
+@pytest.mark.usefixtures("fake_host_base_sid")
+def test_valid_projects_filtered(
+    filename: str, build_filter: craft_platforms.BuildPlanFilter
+) -> None:
+    app_name = filename.partition("-")[0]
+    with (pathlib.Path(__file__).parent / "valid-projects" / filename).open() as f:
+        project_data = yaml.safe_load(f)
+
+    build_plan = craft_platforms.get_build_plan(
+        app=app_name, project_data=project_data, build_filter=build_filter
+    )
+
+    expected = [
+        repr(item)
+        for item in craft_platforms.get_build_plan(
+            app=app_name, project_data=project_data
+        )
+        if build_filter(item)
+    ]
+    assert [repr(item) for item in build_plan] == expected
+
+
+@pytest.mark.parametrize(
+    ("filename"),
+    [
+        path.name
+        for path in (pathlib.Path(__file__).parent / "valid-projects").iterdir()
+    ],
+)
+@pytest.mark.usefixtures("fake_host_base_sid")
+def test_valid_projects_no_errors(filename: str) -> None:
+    app_name = filename.partition("-")[0]
+    with (pathlib.Path(__file__).parent / "valid-projects" / filename).open() as f:
+        project_data = yaml.safe_load(f)
+
+    assert (
+        craft_platforms.get_build_plan_errors(app_name, project_data=project_data) == []
+    )
+
+
+@pytest.mark.parametrize(
+    ("filename"),
+    [
+        path.name
+        for path in (pathlib.Path(__file__).parent / "invalid-platform-names").iterdir()
+    ],
+)
+def test_invalid_platform_names_collected(filename: str) -> None:
+    app_name = filename.partition("-")[0]
+    with (
+        pathlib.Path(__file__).parent / "invalid-platform-names" / filename
+    ).open() as f:
+        project_data = yaml.safe_load(f)
+
+    errors = craft_platforms.get_build_plan_errors(app_name, project_data=project_data)
+
+    assert errors
+    assert isinstance(errors[0], InvalidPlatformNameError)
@@ -0,0 +1,143 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Import-time regression tests for craft_platforms."""
+
+import ast
+import pathlib
+import subprocess
+import sys
+from typing import Dict
+
+import craft_platforms
+import pytest
+
+# The most modules that ``import craft_platforms`` may add to a bare interpreter.
+# At the time of writing, it adds about 30.
+IMPORT_MODULE_BUDGET = 45
+
+# Modules that are expensive to import and are only needed by part of the package.
+HEAVY_MODULES = [
+    "annotated_types",
+    "craft_platforms._build",
+    "craft_platforms.charm",
+    "dataclasses",
+    "distro",
+    "hashlib",
+    "platform",
+    "sqlite3",
+    "typing_extensions",
+]
+
+
+def get_import_times(code: str, *, top_level: bool = False) -> Dict[str, int]:
+    """Get the cumulative import time in microseconds of each module ``code`` imports.
+
+    :param code: The Python code to run in a fresh interpreter.
+    :param top_level: Only include the modules that aren't imported by another
+        module. Their times already include the modules they import.
+    :returns: A dictionary of module names to their cumulative import time.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Nested imports are indented further.
+        if not (top_level and name.startswith("  ")):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_budget():
+    baseline = get_import_times("pass")
+    imported = get_import_times("import craft_platforms").keys() - baseline.keys()
+
+    assert len(imported) <= IMPORT_MODULE_BUDGET, sorted(imported)
+
+
+def test_import_is_lazy():
+    imported = get_import_times("import craft_platforms")
+
+    assert "craft_platforms" in imported
+    assert imported.keys().isdisjoint(HEAVY_MODULES)
+    assert {name for name in imported if name.startswith("craft_platforms.")} <= {
+        "craft_platforms._version"
+    }
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "from craft_platforms import DebianArchitecture, DistroBase",
+        "from craft_platforms import get_build_plan",
+        "import craft_platforms; craft_platforms.DistroBase.from_str('ubuntu@24.04')",
+        "import craft_platforms; craft_platforms.DebianArchitecture.from_host()",
+        (
+            "import craft_platforms as cp\n"
+            "with cp.use_host_info(cp.HostInfo(cp.DistroBase('ubuntu', '24.04'))):\n"
+            "    cp.DistroBase.from_host(), cp.is_ubuntu_like()"
+        ),
+    ],
+)
+def test_distro_not_imported(code):
+    assert "distro" not in get_import_times(code)
+
+
+@pytest.mark.parametrize("name", craft_platforms.__all__)
+def test_public_names(name):
+    assert name in dir(craft_platforms)
+    assert getattr(craft_platforms, name) is not None
+
+
+def _get_type_checking_imports() -> Dict[str, str]:
+    """Get the module that each name in the package's TYPE_CHECKING block is from."""
+    tree = ast.parse(pathlib.Path(craft_platforms.__file__).read_text())
+    (block,) = (
+        node
+        for node in tree.body
+        if isinstance(node, ast.If)
+        and isinstance(node.test, ast.Attribute)
+        and node.test.attr == "TYPE_CHECKING"
+    )
+    return {
+        alias.name: "." * node.level + (node.module or "")
+        for node in block.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+
+
+def test_lazy_attributes_match_type_checking():
+    imports = _get_type_checking_imports()
+
+    assert {name: module for name, module in imports.items() if module != "."} == (
+        craft_platforms._LAZY_ATTRIBUTES
+    )
+    assert {name for name, module in imports.items() if module == "."} == (
+        craft_platforms._LAZY_SUBPACKAGES
+    )
+    assert set(craft_platforms.__all__) == {"__version__", *imports}
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'nope'"):
+        craft_platforms.nope  # noqa: B018
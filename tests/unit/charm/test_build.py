@@ -758,11 +758,18 @@ def test_fuzz_get_platforms_build_plan_single_base(
     build_base: Optional[craft_platforms.DistroBase],
 ):
     assume(_is_valid_platform(platforms))
-    craft_platforms.charm.get_platforms_charm_build_plan(
+    build_plan = craft_platforms.charm.get_platforms_charm_build_plan(
         base=str(base),
         platforms=platforms,
         build_base=str(build_base) if build_base else None,
     )
+    assert build_plan == list(
+        craft_platforms.charm.iter_platforms_charm_build_plan(
+            base=str(base),
+            platforms=platforms,
+            build_base=str(build_base) if build_base else None,
+        )
+    )
 
 
 @pytest.mark.slow
@@ -1082,3 +1089,15 @@ def test_fuzz_get_platforms_build_plan_multi_base(
 )
 def test_bases_build_plan_success(bases, expected):
     assert charm.get_bases_charm_build_plan(bases) == expected
+    assert list(charm.iter_bases_charm_build_plan(bases)) == expected
+
+
+def test_iter_platforms_charm_build_plan_stops_early():
+    plan = charm.iter_platforms_charm_build_plan(
+        base="ubuntu@24.04",
+        platforms={"amd64": None, "ubuntu@22.04:riscv64": None},
+    )
+
+    assert next(plan).platform == "amd64"
+    with pytest.raises(craft_platforms.InvalidMultiBaseError):
+        next(plan)
@@ -309,3 +309,39 @@ def test_bare_base_no_build_base() -> None:
     """Make sure that an error is raised if base=="bare" but build-base==None"""
     with pytest.raises(_errors.NeedBuildBaseError):
         rock.get_rock_build_plan("bare", platforms={"amd64": None}, build_base=None)
+
+
+def test_build_base_without_base() -> None:
+    build_plan = rock.get_rock_build_plan(
+        None,  # ty: ignore[invalid-argument-type]
+        platforms={"amd64": None},
+        build_base="ubuntu@24.04",
+    )
+
+    assert build_plan == [
+        craft_platforms.BuildInfo(
+            "amd64",
+            craft_platforms.DebianArchitecture.AMD64,
+            craft_platforms.DebianArchitecture.AMD64,
+            craft_platforms.DistroBase("ubuntu", "24.04"),
+        )
+    ]
+
+
+def test_no_base_or_build_base() -> None:
+    with pytest.raises(
+        _errors.RequiresBaseError, match="No base or build-base is declared"
+    ):
+        rock.get_rock_build_plan(
+            None,  # ty: ignore[invalid-argument-type]
+            platforms={"amd64": None},
+        )
+
+
+def test_no_base_validated_first() -> None:
+    """Rock-specific rules are checked before the missing base."""
+    with pytest.raises(_errors.InvalidPlatformError):
+        rock.get_rock_build_plan(
+            None,  # ty: ignore[invalid-argument-type]
+            platforms={"amd64": {"build-on": ["amd64"], "build-for": ["all"]}},
+        )
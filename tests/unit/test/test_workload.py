@@ -0,0 +1,153 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the synthetic workload generator."""
+
+import collections
+import concurrent.futures
+import itertools
+import json
+
+import craft_platforms
+import pytest
+from craft_platforms import _errors
+from craft_platforms.test.workload import APPS, WorkloadConfig, iter_workload
+
+
+def test_deterministic():
+    config = WorkloadConfig(seed=42, invalid_ratio=0.1)
+
+    first = list(iter_workload(200, config=config))
+    second = list(iter_workload(200, config=config))
+
+    assert json.dumps(first) == json.dumps(second)
+    assert [project.index for project in first] == list(range(200))
+
+
+def test_seed_changes_workload():
+    first = list(iter_workload(50, config=WorkloadConfig(seed=1)))
+    second = list(iter_workload(50, config=WorkloadConfig(seed=2)))
+
+    assert first != second
+
+
+def test_shards_match_whole():
+    config = WorkloadConfig(seed=7)
+    whole = list(iter_workload(100, config=config))
+
+    shards = [
+        *iter_workload(30, config=config),
+        *iter_workload(70, config=config, start=30),
+    ]
+
+    assert shards == whole
+
+
+def test_unbounded_is_lazy():
+    workload = iter_workload()
+
+    projects = list(itertools.islice(workload, 5))
+
+    assert [project.index for project in projects] == list(range(5))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_valid_projects_plan(seed):
+    config = WorkloadConfig(
+        seed=seed,
+        multi_base_ratio=0.5,
+        build_for_all_ratio=0.5,
+        legacy_bases_ratio=0.3,
+    )
+
+    for project in iter_workload(500, config=config):
+        assert project.valid
+        assert list(
+            craft_platforms.get_build_plan(
+                project.app, project_data=project.project_data
+            )
+        )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_invalid_projects_fail(seed):
+    config = WorkloadConfig(seed=seed, legacy_bases_ratio=0.3, invalid_ratio=1.0)
+
+    for project in iter_workload(200, config=config):
+        assert not project.valid
+        with pytest.raises(_errors.PROJECT_ERRORS):
+            craft_platforms.get_build_plan(
+                project.app, project_data=project.project_data
+            )
+
+
+def test_distribution():
+    config = WorkloadConfig(
+        app_weights={"charmcraft": 3, "snapcraft": 1},
+        platform_counts={2: 1},
+        legacy_bases_ratio=0,
+        multi_base_ratio=0,
+        build_for_all_ratio=0,
+        invalid_ratio=0.25,
+    )
+
+    projects = list(iter_workload(4000, config=config))
+
+    apps = collections.Counter(project.app for project in projects)
+    assert set(apps) == {"charmcraft", "snapcraft"}
+    assert 2.5 < apps["charmcraft"] / apps["snapcraft"] < 3.5
+    assert {len(project.project_data["platforms"]) for project in projects} <= {2, 3}
+    assert 800 < sum(not project.valid for project in projects) < 1200
+
+
+def test_legacy_bases():
+    config = WorkloadConfig(app_weights={"charmcraft": 1}, legacy_bases_ratio=1)
+
+    for project in iter_workload(50, config=config):
+        assert "bases" in project.project_data
+        assert "platforms" not in project.project_data
+
+
+def test_get_build_plans():
+    config = WorkloadConfig(seed=3, invalid_ratio=0.2)
+    projects = list(iter_workload(100, config=config))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(
+            craft_platforms.get_build_plans(
+                ((project.app, project.project_data) for project in projects),
+                executor=executor,
+            )
+        )
+
+    assert len(results) == len(projects)
+    for result in results:
+        assert (result.error is None) == projects[result.index].valid
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"app_weights": {"mycraft": 1}}, "Unknown applications: mycraft"),
+        ({"app_weights": dict.fromkeys(APPS, 0)}, "positive weight"),
+        ({"platform_counts": {1: 0}}, "positive weight"),
+        ({"platform_counts": {0: 1}}, "at least 1"),
+        ({"invalid_ratio": 1.5}, "invalid_ratio must be between 0 and 1"),
+        ({"multi_base_ratio": -0.1}, "multi_base_ratio must be between 0 and 1"),
+    ],
+)
+def test_config_errors(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        WorkloadConfig(**kwargs)
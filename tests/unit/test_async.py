@@ -0,0 +1,201 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for asyncio build planning."""
+
+import asyncio
+import concurrent.futures
+import threading
+
+import craft_platforms
+import pytest
+from craft_platforms import (
+    DistroBase,
+    HostInfo,
+    get_build_plan_async,
+    get_build_plans_async,
+)
+
+ROCK = {"base": "ubuntu@24.04", "platforms": {"amd64": None, "riscv64": None}}
+SNAP_WITHOUT_BASE = {"platforms": {}}
+DEB = {"base": None}
+HOST = HostInfo(
+    base=DistroBase("ubuntu", "22.04"),
+    architecture=craft_platforms.DebianArchitecture.S390X,
+)
+
+
+async def _collect(results):
+    return [result async for result in results]
+
+
+def test_get_build_plan_async():
+    build_plan = asyncio.run(get_build_plan_async("rockcraft", project_data=ROCK))
+
+    assert build_plan == craft_platforms.get_build_plan("rockcraft", project_data=ROCK)
+
+
+def test_get_build_plan_async_error():
+    with pytest.raises(craft_platforms.RequiresBaseError):
+        asyncio.run(get_build_plan_async("snapcraft", project_data=SNAP_WITHOUT_BASE))
+
+
+def test_not_planned_in_loop_thread():
+    threads = set()
+
+    async def main():
+        with craft_platforms.stage_hook(lambda _: threads.add(threading.get_ident())):
+            await get_build_plan_async("rockcraft", project_data=ROCK)
+            await _collect(get_build_plans_async([("debcraft", DEB)] * 5))
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+
+    assert threads
+    assert loop_thread not in threads
+
+
+def test_host_info_override():
+    async def main():
+        with craft_platforms.use_host_info(HOST):
+            return await get_build_plan_async("debcraft", project_data=DEB)
+
+    build_plan = asyncio.run(main())
+
+    assert {info.build_base.series for info in build_plan} == {"22.04"}
+
+
+def test_get_build_plans_async():
+    projects = [("rockcraft", ROCK), ("snapcraft", SNAP_WITHOUT_BASE)] * 20
+
+    results = asyncio.run(
+        _collect(get_build_plans_async(projects, max_concurrency=3, chunk_size=2))
+    )
+
+    assert sorted(result.index for result in results) == list(range(40))
+    for result in results:
+        app, project_data = projects[result.index]
+        assert result.app == app
+        if app == "rockcraft":
+            assert result.build_plan == craft_platforms.get_build_plan(
+                app, project_data=project_data
+            )
+        else:
+            assert isinstance(result.error, craft_platforms.RequiresBaseError)
+
+
+def test_async_iterable_input():
+    async def projects():
+        for _ in range(5):
+            await asyncio.sleep(0)
+            yield "rockcraft", ROCK
+
+    results = asyncio.run(_collect(get_build_plans_async(projects(), chunk_size=2)))
+
+    assert sorted(result.index for result in results) == list(range(5))
+
+
+def test_host_info():
+    results = asyncio.run(
+        _collect(get_build_plans_async([("debcraft", DEB)], host_info=HOST))
+    )
+
+    assert results[0].build_plan[0].build_base == DistroBase("ubuntu", "22.04")
+
+
+def test_process_pool():
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        results = asyncio.run(
+            _collect(
+                get_build_plans_async(
+                    [("rockcraft", ROCK)] * 10, executor=executor, chunk_size=4
+                )
+            )
+        )
+        build_plan = asyncio.run(
+            get_build_plan_async("rockcraft", project_data=ROCK, executor=executor)
+        )
+
+    assert len(results) == 10
+    assert all(len(result.build_plan) == 2 for result in results)
+    assert len(build_plan) == 2
+
+
+def test_backpressure():
+    consumed = 0
+
+    def projects():
+        nonlocal consumed
+        for _ in range(100):
+            consumed += 1
+            yield "rockcraft", ROCK
+
+    async def main():
+        results = get_build_plans_async(projects(), max_concurrency=2)
+        await results.__anext__()
+        await asyncio.sleep(0.05)
+        try:
+            # Only the planning slots are filled, however long the consumer waits.
+            return consumed
+        finally:
+            await results.aclose()
+
+    assert asyncio.run(main()) <= 3
+
+
+def test_cancellation():
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    def hook(event):
+        nonlocal calls
+        if event.stage == craft_platforms.PlanningStage.PLAN:
+            calls += 1
+            started.set()
+            release.wait(5)
+
+    async def main(executor):
+        task = asyncio.ensure_future(
+            _collect(
+                get_build_plans_async(
+                    [("rockcraft", ROCK)] * 20, executor=executor, max_concurrency=4
+                )
+            )
+        )
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with craft_platforms.stage_hook(hook):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            asyncio.run(main(executor))
+            release.set()
+
+    # The running chunk finishes, but the queued ones were cancelled.
+    assert calls == 1
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"chunk_size": 0}, "chunk_size must be a positive integer"),
+        ({"max_concurrency": 0}, "max_concurrency must be a positive integer"),
+    ],
+)
+def test_invalid_arguments(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        asyncio.run(_collect(get_build_plans_async([], **kwargs)))
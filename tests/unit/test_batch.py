@@ -0,0 +1,167 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for batch build planning."""
+
+import concurrent.futures
+
+import craft_platforms
+import pytest
+from craft_platforms import _batch, _errors
+
+VALID_PROJECT = {
+    "base": "ubuntu@24.04",
+    "platforms": {"amd64": None, "riscv64": None},
+}
+INVALID_PROJECT = {
+    "base": "ubuntu@24.04",
+    "platforms": {"any": None},
+}
+
+
+@pytest.fixture
+def thread_pool():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_get_build_plans_matches_get_build_plan(thread_pool, chunk_size):
+    projects = [("mycraft", VALID_PROJECT)] * 7
+
+    results = sorted(
+        craft_platforms.get_build_plans(
+            projects, executor=thread_pool, chunk_size=chunk_size
+        ),
+        key=lambda result: result.index,
+    )
+
+    assert [result.index for result in results] == list(range(7))
+    for result in results:
+        assert result.error is None
+        assert result.build_plan == craft_platforms.get_build_plan(
+            "mycraft", project_data=VALID_PROJECT
+        )
+
+
+def test_get_build_plans_errors_as_data(thread_pool):
+    projects = [
+        ("mycraft", VALID_PROJECT),
+        ("mycraft", INVALID_PROJECT),
+        ("charmcraft", {}),
+        ("mycraft", {"base": "ubuntu@24.04", "platforms": {"nope": None}}),
+        ("mycraft", VALID_PROJECT),
+    ]
+
+    results = {
+        result.index: result
+        for result in craft_platforms.get_build_plans(projects, executor=thread_pool)
+    }
+
+    assert results[0].build_plan is not None
+    assert isinstance(results[1].error, craft_platforms.InvalidPlatformNameError)
+    assert isinstance(results[2].error, NotImplementedError)
+    assert isinstance(results[3].error, _errors.InvalidDebianArchPlatformNameError)
+    assert results[4].build_plan is not None
+    for index in (1, 2, 3):
+        assert results[index].build_plan is None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100])
+def test_get_build_plans_malformed_project(thread_pool, chunk_size):
+    projects = [
+        ("mycraft", VALID_PROJECT),
+        ("rockcraft", {"base": "ubuntu@24.04"}),
+        ("mycraft", VALID_PROJECT),
+        ("snapcraft", {"base": "core24", "platforms": ["amd64"]}),
+        ("mycraft", VALID_PROJECT),
+    ]
+
+    results = {
+        result.index: result
+        for result in craft_platforms.get_build_plans(
+            projects, executor=thread_pool, chunk_size=chunk_size
+        )
+    }
+
+    assert sorted(results) == list(range(5))
+    for index in (0, 2, 4):
+        assert results[index].build_plan is not None
+    for index in (1, 3):
+        assert isinstance(results[index].error, AttributeError)
+        assert results[index].build_plan is None
+
+
+def test_get_build_plans_strict_platform_names(thread_pool):
+    project = {"base": "ubuntu@24.04", "platforms": {"my_platform": None}}
+
+    (result,) = craft_platforms.get_build_plans(
+        [("mycraft", project)], executor=thread_pool, strict_platform_names=True
+    )
+
+    assert isinstance(result.error, craft_platforms.InvalidPlatformNameError)
+
+
+def test_get_build_plans_lazy_input(thread_pool):
+    consumed = []
+
+    def projects():
+        for index in range(100):
+            consumed.append(index)
+            yield ("mycraft", VALID_PROJECT)
+
+    results = craft_platforms.get_build_plans(
+        projects(), executor=thread_pool, max_workers=1, chunk_size=1
+    )
+    next(results)
+    results.close()
+
+    # One worker means at most two chunks in flight plus one refill.
+    assert len(consumed) <= 4
+
+
+def test_get_build_plans_invalid_chunk_size():
+    with pytest.raises(ValueError, match="chunk_size must be a positive integer"):
+        next(craft_platforms.get_build_plans([], chunk_size=0))
+
+
+def test_get_build_plans_process_pool():
+    projects = [("mycraft", VALID_PROJECT), ("mycraft", INVALID_PROJECT)] * 5
+
+    results = {
+        result.index: result
+        for result in craft_platforms.get_build_plans(
+            projects, max_workers=2, chunk_size=3
+        )
+    }
+
+    assert len(results) == 10
+    for index, result in results.items():
+        if index % 2:
+            assert result.error == craft_platforms.InvalidPlatformNameError(
+                "Platform name 'any' is reserved.",
+                resolution="Use a different platform name, perhaps 'all' for platform-agnostic artifacts.",
+            )
+        else:
+            assert result.build_plan is not None
+            assert len(result.build_plan) == 2
+
+
+def test_plan_chunk_indices():
+    results = _batch._plan_chunk(
+        10, [("mycraft", VALID_PROJECT), ("mycraft", INVALID_PROJECT)], {}
+    )
+
+    assert [result.index for result in results] == [10, 11]
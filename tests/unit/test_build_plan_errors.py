@@ -0,0 +1,374 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for collecting every error in a project."""
+
+from typing import Any, Dict
+
+import craft_platforms
+import pytest
+from craft_platforms import _buildinfo, _errors, charm
+
+
+def _describe(errors):
+    return [(type(error).__name__, str(error)) for error in errors]
+
+
+@pytest.mark.parametrize(
+    "project",
+    [
+        {"base": "ubuntu@24.04", "platforms": {"amd64": None}},
+        {
+            "base": "ubuntu@24.04",
+            "platforms": {
+                "all": {"build-on": ["amd64"], "build-for": ["all"]},
+            },
+        },
+    ],
+)
+def test_valid_project(project):
+    assert craft_platforms.get_build_plan_errors("mycraft", project_data=project) == []
+
+
+def test_every_error_collected():
+    project = {
+        "base": "ubuntu@24.04",
+        "platforms": {
+            "any": None,
+            "nope": None,
+            "bad-archs": {"build-on": ["amd64", "z80"], "build-for": ["6502"]},
+            "no-build-on": {"build-for": ["amd64"]},
+            "all": {"build-on": ["amd64"], "build-for": ["all"]},
+            "riscv64": None,
+        },
+    }
+
+    errors = craft_platforms.get_build_plan_errors("mycraft", project_data=project)
+
+    assert [type(error) for error in errors] == [
+        craft_platforms.InvalidPlatformNameError,
+        _errors.InvalidDebianArchPlatformNameError,
+        ValueError,
+        ValueError,
+        KeyError,
+        craft_platforms.AllOnlyBuildError,
+    ]
+    assert "'any' is reserved" in str(errors[0])
+    assert "'6502'" in str(errors[2])
+    assert "'z80'" in str(errors[3])
+
+
+def test_first_error_matches_get_build_plan():
+    project = {
+        "base": "ubuntu@24.04",
+        "platforms": {
+            "nope": None,
+            "a": {"build-on": ["amd64"], "build-for": ["all"]},
+            "b": {"build-on": ["amd64"], "build-for": ["all"]},
+        },
+    }
+
+    errors = craft_platforms.get_build_plan_errors("mycraft", project_data=project)
+    with pytest.raises(_errors.InvalidDebianArchPlatformNameError) as exc_info:
+        craft_platforms.get_build_plan("mycraft", project_data=project)
+
+    assert _describe(errors[:1]) == _describe([exc_info.value])
+    assert [type(error) for error in errors[1:]] == [
+        craft_platforms.AllSinglePlatformError,
+    ]
+
+
+def test_every_build_for_all_rule():
+    project = {
+        "platforms": {
+            "a": {"build-on": ["amd64"], "build-for": ["all", "amd64"]},
+            "b": {"build-on": ["amd64"], "build-for": ["all"]},
+        },
+    }
+
+    errors = craft_platforms.get_build_plan_errors(
+        "debcraft", project_data={"base": "ubuntu@24.04", **project}
+    )
+
+    assert [type(error) for error in errors] == [
+        _errors.AllInMultiplePlatformsError,
+        _errors.AllOnlyBuildInPlatformError,
+    ]
+
+
+def test_strict_platform_names():
+    project = {
+        "base": "ubuntu@24.04",
+        "platforms": {
+            ";": {"build-on": ["amd64"], "build-for": ["amd64"]},
+            "nope": None,
+        },
+    }
+
+    errors = craft_platforms.get_build_plan_errors(
+        "mycraft", project_data=project, strict_platform_names=True
+    )
+
+    assert [type(error) for error in errors] == [
+        craft_platforms.InvalidPlatformNameError,
+        _errors.InvalidDebianArchPlatformNameError,
+    ]
+
+
+@pytest.mark.parametrize(
+    ("platforms", "messages"),
+    [
+        ({"any": None}, ["Platform name 'any' is reserved."]),
+        ({"x y": None}, ["Invalid platform name: 'x y'"]),
+        (
+            {"any": None, "x y": None, "amd64": None, "nope": None},
+            [
+                "Platform name 'any' is reserved.",
+                "Invalid platform name: 'x y'",
+                (
+                    "platform name 'nope' is not a valid Debian architecture and "
+                    "needs 'build-on' and 'build-for' specified"
+                ),
+            ],
+        ),
+    ],
+)
+def test_strict_platform_names_reported_once(platforms, messages):
+    project = {"base": "ubuntu@24.04", "platforms": platforms}
+
+    errors = craft_platforms.get_build_plan_errors(
+        "rockcraft", project_data=project, strict_platform_names=True
+    )
+
+    assert [str(error) for error in errors] == messages
+
+
+def test_invalid_base_still_validates_platforms():
+    project = {"base": "ubuntu", "platforms": {"nope": None, "amd64": None}}
+
+    errors = craft_platforms.get_build_plan_errors("mycraft", project_data=project)
+
+    assert [type(error) for error in errors] == [
+        ValueError,
+        _errors.InvalidDebianArchPlatformNameError,
+    ]
+
+
+def test_no_entries_created(mocker):
+    build_info = mocker.patch.object(
+        _buildinfo, "BuildInfo", wraps=_buildinfo.BuildInfo, autospec=False
+    )
+    project = {
+        "base": "ubuntu@24.04",
+        "platforms": {
+            "amd64": None,
+            "cross": {"build-on": ["amd64", "arm64"], "build-for": ["riscv64"]},
+        },
+    }
+
+    assert craft_platforms.get_build_plan_errors("mycraft", project_data=project) == []
+    assert build_info.call_count == 0
+
+
+def test_charm_platforms():
+    project = {
+        "base": "ubuntu@22.04",
+        "platforms": {
+            "ubuntu@24.04:amd64": None,
+            "mismatched": {
+                "build-on": ["ubuntu@22.04:amd64"],
+                "build-for": ["ubuntu@24.04:amd64"],
+            },
+            "bad-archs": {"build-on": ["all"], "build-for": ["z80"]},
+            "nope": None,
+            "amd64": None,
+        },
+    }
+
+    errors = craft_platforms.get_build_plan_errors("charmcraft", project_data=project)
+
+    assert [type(error) for error in errors] == [
+        _errors.InvalidMultiBaseError,
+        _errors.InvalidMultiBaseError,
+        ValueError,
+        ValueError,
+    ]
+    assert "top-level base" in str(errors[0])
+    assert "mismatched bases" in str(errors[1])
+    assert "'z80'" in str(errors[2])
+    assert "'nope' is not a valid Debian architecture" in str(errors[3])
+
+
+def test_charm_build_on_all():
+    errors = []
+    platforms: Dict[str, Any] = {
+        "p1": {"build-on": ["all", "amd64"], "build-for": ["riscv64"]},
+        "p2": {"build-on": ["amd64", "all"], "build-for": ["riscv64"]},
+        "p3": {"build-on": ["amd64"], "build-for": ["riscv64"]},
+    }
+
+    build_plan = list(
+        charm.iter_platforms_charm_build_plan(
+            None, platforms, build_base="ubuntu@22.04", errors=errors
+        )
+    )
+
+    assert [info.platform for info in build_plan] == ["p3"]
+    assert [str(error) for error in errors] == [
+        "Platform 'p1' has an invalid 'build-on' entry of 'all'.",
+        "Platform 'p2' has an invalid 'build-on' entry of 'all'.",
+    ]
+
+
+def test_charm_base_rules_in_one_platform():
+    errors = []
+    platforms: Dict[str, Any] = {
+        "ubuntu@24.04:amd64": {
+            "build-on": ["amd64"],
+            "build-for": ["ubuntu@22.04:amd64"],
+        }
+    }
+
+    build_plan = list(
+        charm.iter_platforms_charm_build_plan("ubuntu@22.04", platforms, errors=errors)
+    )
+
+    assert build_plan == []
+    assert [type(error) for error in errors] == [
+        _errors.InvalidMultiBaseError,
+        _errors.InvalidMultiBaseError,
+    ]
+    assert "incompatible 'build-for' entry (ubuntu@22.04)" in str(errors[0])
+    assert "mismatched bases" in str(errors[1])
+
+
+def test_charm_bad_architecture_and_incompatible_bases():
+    project = {
+        "platforms": {
+            "ubuntu@22.04:foo": {
+                "build-on": ["ubuntu@22.04:notanarch"],
+                "build-for": ["ubuntu@24.04:amd64"],
+            }
+        }
+    }
+
+    errors = craft_platforms.get_build_plan_errors("charmcraft", project_data=project)
+
+    assert [type(error) for error in errors] == [
+        _errors.InvalidMultiBaseError,
+        ValueError,
+    ]
+    assert "incompatible 'build-for' entry" in str(errors[0])
+    assert "'notanarch' is not a valid Debian architecture" in str(errors[1])
+    with pytest.raises(_errors.InvalidMultiBaseError):
+        craft_platforms.get_build_plan("charmcraft", project_data=project)
+
+
+def test_charm_bases():
+    project = {
+        "bases": [
+            {"name": "ubuntu", "channel": "22.04", "architectures": ["z80"]},
+            {"name": "ubuntu", "channel": "24.04", "architectures": ["amd64"]},
+            {"channel": "24.04"},
+        ]
+    }
+
+    errors = craft_platforms.get_build_plan_errors("charmcraft", project_data=project)
+
+    assert [type(error) for error in errors] == [ValueError, KeyError]
+
+
+def test_charm_unknown_type():
+    errors = craft_platforms.get_build_plan_errors("charmcraft", project_data={})
+
+    assert [type(error) for error in errors] == [NotImplementedError]
+
+
+def test_snap():
+    project = {
+        "base": "core24",
+        "build-base": "core22",
+        "platforms": {"nope": None, "amd64": None},
+    }
+
+    errors = craft_platforms.get_build_plan_errors("snapcraft", project_data=project)
+
+    assert [type(error) for error in errors] == [
+        craft_platforms.InvalidBaseError,
+        _errors.InvalidDebianArchPlatformNameError,
+    ]
+
+
+def test_rock():
+    project = {
+        "base": "bare",
+        "platforms": {
+            "a": {"build-on": ["amd64"], "build-for": ["all"]},
+            "nope": None,
+        },
+    }
+
+    errors = craft_platforms.get_build_plan_errors("rockcraft", project_data=project)
+
+    assert [type(error) for error in errors] == [
+        craft_platforms.NeedBuildBaseError,
+        craft_platforms.InvalidPlatformError,
+        _errors.InvalidDebianArchPlatformNameError,
+    ]
+
+
+def test_deb():
+    project = {
+        "base": "ubuntu@24.04",
+        "platforms": {
+            "any": None,
+            "*": None,
+            "riscv64": {"build-on": ["riscv64"], "build-for": ["amd64", "nope"]},
+        },
+    }
+
+    errors = craft_platforms.get_build_plan_errors("debcraft", project_data=project)
+
+    assert [type(error) for error in errors] == [
+        craft_platforms.InvalidPlatformNameError,
+        ValueError,
+    ]
+    assert "Reserved platform names used: '*', 'any'" in str(errors[0])
+
+
+@pytest.mark.parametrize(
+    ("app", "project"),
+    [
+        ("mycraft", {"base": "ubuntu@24.04"}),
+        ("rockcraft", {"base": "ubuntu@24.04"}),
+        ("mycraft", {"base": "ubuntu@24.04", "platforms": ["amd64"]}),
+        ("snapcraft", {"base": "core24", "platforms": ["amd64"]}),
+    ],
+)
+def test_malformed_platforms(app, project):
+    errors = craft_platforms.get_build_plan_errors(app, project_data=project)
+
+    assert [type(error) for error in errors] == [AttributeError]
+
+
+def test_errors_kept_before_malformed_data():
+    errors = craft_platforms.get_build_plan_errors(
+        "rockcraft", project_data={"base": "bare"}
+    )
+
+    assert [type(error) for error in errors] == [
+        _errors.NeedBuildBaseError,
+        AttributeError,
+    ]
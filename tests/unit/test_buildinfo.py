@@ -0,0 +1,129 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for build info."""
+
+import copy
+import dataclasses
+import pickle
+
+import craft_platforms
+import pytest
+from craft_platforms import (
+    BuildInfo,
+    DebianArchitecture,
+    DistroBase,
+    FrozenBuildInfo,
+)
+
+AMD64 = DebianArchitecture.AMD64
+RISCV64 = DebianArchitecture.RISCV64
+
+
+@pytest.mark.parametrize(
+    "info",
+    [
+        BuildInfo("amd64", AMD64, AMD64, DistroBase("ubuntu", "24.04")),
+        BuildInfo("all", RISCV64, "all", DistroBase("ubuntu", "devel")),
+        BuildInfo("ubuntu@22.04:x", AMD64, RISCV64, DistroBase("ubuntu", "22.04")),
+    ],
+)
+def test_frozen_build_info_round_trip(info):
+    frozen = FrozenBuildInfo.from_build_info(info)
+
+    assert frozen == info
+    assert info == frozen
+    assert frozen.to_build_info() == info
+    assert isinstance(frozen.to_build_info(), BuildInfo)
+    assert dataclasses.astuple(info) == (
+        frozen.platform,
+        frozen.build_on,
+        frozen.build_for,
+        frozen.build_base,
+    )
+    assert pickle.loads(pickle.dumps(frozen)) == frozen  # noqa: S301
+    assert copy.deepcopy(frozen) == frozen
+
+
+def test_frozen_build_info_inequality():
+    info = FrozenBuildInfo("amd64", AMD64, AMD64, DistroBase("ubuntu", "24.04"))
+
+    assert info != FrozenBuildInfo("amd64", AMD64, AMD64, DistroBase("ubuntu", "22.04"))
+    assert info != BuildInfo("amd64", AMD64, RISCV64, DistroBase("ubuntu", "24.04"))
+    assert info != ("amd64", AMD64, AMD64, DistroBase("ubuntu", "24.04"))
+
+
+def test_frozen_build_info_immutable():
+    info = FrozenBuildInfo("amd64", AMD64, AMD64, DistroBase("ubuntu", "24.04"))
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        info.platform = "riscv64"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del info.build_base
+    with pytest.raises(AttributeError):
+        info.extra = "nope"
+
+
+def test_frozen_build_info_hashable():
+    first = FrozenBuildInfo("amd64", AMD64, AMD64, DistroBase("ubuntu", "24.04"))
+    second = FrozenBuildInfo("amd64", AMD64, AMD64, DistroBase("ubuntu", "24.04"))
+
+    assert hash(first) == hash(second)
+    assert {first, second} == {first}
+    assert {first: "value"}[second] == "value"
+
+
+def test_frozen_build_info_interned():
+    # Build the names at runtime so they aren't already the same constant.
+    names = [f"my-{suffix}" for suffix in ("platform", "platform")]
+    first = FrozenBuildInfo(names[0], AMD64, AMD64, DistroBase("ubuntu", "24.04"))
+    second = FrozenBuildInfo(names[1], AMD64, AMD64, DistroBase("ubuntu", "24.04"))
+
+    assert names[0] is not names[1]
+    assert first.platform is second.platform
+    assert first.build_base is second.build_base
+
+
+def test_frozen_build_info_bases_bounded():
+    craft_platforms.clear_caches()
+    FrozenBuildInfo("amd64", AMD64, AMD64, DistroBase("ubuntu", "24.04"))
+
+    info = craft_platforms.get_cache_info()["interned_base"]
+
+    assert info.currsize == 1
+    assert info.maxsize == craft_platforms._distro.BASE_CACHE_SIZE
+    craft_platforms.clear_caches()
+    assert craft_platforms.get_cache_info()["interned_base"].currsize == 0
+
+
+def test_frozen_build_info_architecture_platform():
+    info = FrozenBuildInfo(AMD64, AMD64, AMD64, DistroBase("ubuntu", "24.04"))
+
+    assert info.platform is AMD64
+
+
+def test_frozen_build_info_no_dict():
+    info = FrozenBuildInfo("amd64", AMD64, AMD64, DistroBase("ubuntu", "24.04"))
+
+    assert not hasattr(info, "__dict__")
+
+
+def test_frozen_build_info_repr():
+    info = FrozenBuildInfo("all", AMD64, "all", DistroBase("ubuntu", "24.04"))
+
+    assert repr(info) == (
+        "FrozenBuildInfo(platform='all', build_on='amd64', build_for='all', "
+        "build_base=DistroBase(distribution='ubuntu', series='24.04'))"
+    )
@@ -0,0 +1,156 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for indexed build plans."""
+
+import itertools
+
+import pytest
+from craft_platforms import (
+    BuildInfo,
+    BuildPlan,
+    DebianArchitecture,
+    DistroBase,
+    get_build_plan,
+)
+
+AMD64 = DebianArchitecture.AMD64
+ARM64 = DebianArchitecture.ARM64
+RISCV64 = DebianArchitecture.RISCV64
+JAMMY = DistroBase("ubuntu", "22.04")
+NOBLE = DistroBase("ubuntu", "24.04")
+
+ENTRIES = [
+    BuildInfo("amd64", AMD64, AMD64, NOBLE),
+    BuildInfo("arm64", ARM64, ARM64, NOBLE),
+    BuildInfo("cross", AMD64, RISCV64, NOBLE),
+    BuildInfo("cross", ARM64, RISCV64, NOBLE),
+    BuildInfo("jammy", ARM64, ARM64, JAMMY),
+    BuildInfo("all", AMD64, "all", JAMMY),
+]
+
+
+@pytest.fixture
+def build_plan():
+    return BuildPlan(ENTRIES)
+
+
+def test_sequence(build_plan):
+    assert len(build_plan) == len(ENTRIES)
+    assert list(build_plan) == ENTRIES
+    assert build_plan[2] is ENTRIES[2]
+    assert build_plan[-1] is ENTRIES[-1]
+    assert isinstance(build_plan[1:3], BuildPlan)
+    assert build_plan[1:3] == ENTRIES[1:3]
+    assert build_plan.index(ENTRIES[3]) == 3
+    assert ENTRIES[4] in build_plan
+
+
+def test_equality(build_plan):
+    assert build_plan == ENTRIES
+    assert build_plan == tuple(ENTRIES)
+    assert build_plan == BuildPlan(ENTRIES)
+    assert build_plan != ENTRIES[:-1]
+    assert build_plan != list(reversed(ENTRIES))
+    assert build_plan != "amd64"
+
+
+def test_unhashable(build_plan):
+    with pytest.raises(TypeError):
+        hash(build_plan)
+
+
+@pytest.mark.parametrize(
+    ("index", "key", "expected"),
+    [
+        ("by_platform", "cross", [2, 3]),
+        ("by_build_on", AMD64, [0, 2, 5]),
+        ("by_build_on", "arm64", [1, 3, 4]),
+        ("by_build_for", RISCV64, [2, 3]),
+        ("by_build_for", "all", [5]),
+        ("by_build_base", JAMMY, [4, 5]),
+    ],
+)
+def test_single_indexes(build_plan, index, key, expected):
+    assert getattr(build_plan, index)[key] == tuple(ENTRIES[i] for i in expected)
+
+
+def test_indexes_cached(build_plan):
+    assert build_plan.by_build_on is build_plan.by_build_on
+
+
+def test_indexes_read_only(build_plan):
+    with pytest.raises(TypeError):
+        build_plan.by_platform["new"] = ()  # type: ignore[index]
+
+
+def test_distinct_values(build_plan):
+    assert build_plan.platforms == {"amd64", "arm64", "cross", "jammy", "all"}
+    assert build_plan.build_on_architectures == {AMD64, ARM64}
+    assert build_plan.build_for_architectures == {AMD64, ARM64, RISCV64, "all"}
+    assert build_plan.build_bases == {JAMMY, NOBLE}
+
+
+_CRITERIA = {
+    "platform": ["cross", "jammy", "missing"],
+    "build_on": [AMD64, ARM64, RISCV64],
+    "build_for": [ARM64, RISCV64, "all"],
+    "build_base": [JAMMY, NOBLE],
+}
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        fields
+        for size in range(len(_CRITERIA) + 1)
+        for fields in itertools.combinations(_CRITERIA, size)
+    ],
+)
+def test_get_matches_scan(build_plan, fields):
+    for values in itertools.product(*(_CRITERIA[field] for field in fields)):
+        criteria = dict(zip(fields, values))
+
+        expected = tuple(
+            info
+            for info in ENTRIES
+            if all(getattr(info, field) == value for field, value in criteria.items())
+        )
+        assert build_plan.get(**criteria) == expected
+
+
+def test_get_builds_composite_index_once(build_plan):
+    build_plan.get(build_on=ARM64, build_base=NOBLE)
+    indexes = dict(build_plan._composite_indexes)
+
+    assert build_plan.get(build_on=ARM64, build_base=NOBLE) == (ENTRIES[1], ENTRIES[3])
+    assert build_plan.get(build_on=AMD64, build_base=JAMMY) == (ENTRIES[5],)
+    assert build_plan._composite_indexes == indexes
+    assert list(indexes) == [("build_on", "build_base")]
+
+
+def test_from_project():
+    project = {
+        "base": "ubuntu@24.04",
+        "platforms": {
+            "amd64": None,
+            "cross": {"build-on": ["amd64", "arm64"], "build-for": ["riscv64"]},
+        },
+    }
+
+    build_plan = BuildPlan.from_project("mycraft", project_data=project)
+
+    assert build_plan == get_build_plan("mycraft", project_data=project)
+    assert len(build_plan.get(build_on=AMD64)) == 2
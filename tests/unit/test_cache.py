@@ -0,0 +1,101 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for internal caches."""
+
+import craft_platforms
+import pytest
+from craft_platforms import CacheInfo, _cache
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    craft_platforms.clear_caches()
+    yield
+    craft_platforms.clear_caches()
+
+
+def test_distro_base_from_str_shared():
+    first = craft_platforms.DistroBase.from_str("ubuntu@22.04")
+    second = craft_platforms.DistroBase.from_str("ubuntu@22.04")
+
+    assert first is second
+    assert craft_platforms.get_cache_info()["distro_base"] == CacheInfo(
+        hits=1, misses=1, maxsize=craft_platforms._distro.BASE_CACHE_SIZE, currsize=1
+    )
+
+
+def test_distro_base_from_str_subclass_not_cached():
+    class MyBase(craft_platforms.DistroBase):
+        pass
+
+    base = MyBase.from_str("ubuntu@22.04")
+
+    assert type(base) is MyBase
+    assert base == craft_platforms.DistroBase.from_str("ubuntu@22.04")
+    assert craft_platforms.get_cache_info()["distro_base"].currsize == 1
+
+
+def test_distro_base_from_str_errors_not_cached():
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid base string"):
+            craft_platforms.DistroBase.from_str("invalid")
+
+    assert craft_platforms.get_cache_info()["distro_base"].currsize == 0
+
+
+@pytest.mark.parametrize(
+    ("parser", "cache_name", "token"),
+    [
+        (
+            craft_platforms.parse_base_and_architecture,
+            "base_and_architecture",
+            "ubuntu@22.04:amd64",
+        ),
+        (craft_platforms.parse_base_and_name, "base_and_name", "ubuntu@22.04:my-p"),
+    ],
+)
+def test_base_prefixed_tokens_shared(parser, cache_name, token):
+    first = parser(token)
+    second = parser(token)
+
+    assert first is second
+    assert first[0] is craft_platforms.DistroBase.from_str("ubuntu@22.04")
+    assert craft_platforms.get_cache_info()[cache_name].hits == 1
+
+
+def test_clear_caches():
+    craft_platforms.DistroBase.from_str("ubuntu@22.04")
+    craft_platforms.parse_base_and_architecture("ubuntu@22.04:amd64")
+
+    craft_platforms.clear_caches()
+
+    for info in craft_platforms.get_cache_info().values():
+        assert info == CacheInfo(hits=0, misses=0, maxsize=info.maxsize, currsize=0)
+
+
+def test_lru_cache_bounded(monkeypatch):
+    monkeypatch.setattr(_cache, "_CACHES", {})
+
+    @_cache.lru_cache("squares", maxsize=2)
+    def square(value: int) -> int:
+        return value * value
+
+    for value in (1, 2, 3, 1):
+        square(value)
+
+    assert craft_platforms.get_cache_info() == {
+        "squares": CacheInfo(hits=0, misses=4, maxsize=2, currsize=2)
+    }
@@ -0,0 +1,234 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the command-line tool."""
+
+import io
+import json
+import sys
+
+import pytest
+from craft_platforms import _batch, _cli
+
+SNAP = """\
+name: my-snap
+base: core24
+platforms:
+  amd64:
+  riscv64:
+"""
+CHARM = """\
+name: my-charm
+base: ubuntu@24.04
+platforms:
+  s390x:
+"""
+
+
+def _run(capsys, *args):
+    code = _cli.main(["plan", *args])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    return code, sorted(lines, key=lambda line: (line["source"], line.get("platform")))
+
+
+@pytest.fixture
+def projects(tmp_path):
+    (tmp_path / "snap").mkdir()
+    (tmp_path / "snap" / "snapcraft.yaml").write_text(SNAP)
+    (tmp_path / "charmcraft.yaml").write_text(CHARM)
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_plan_files(capsys, projects, jobs):
+    code, lines = _run(
+        capsys,
+        "-j",
+        jobs,
+        str(projects / "snap" / "snapcraft.yaml"),
+        str(projects / "charmcraft.yaml"),
+    )
+
+    assert code == 0
+    assert lines == [
+        {
+            "source": str(projects / "charmcraft.yaml"),
+            "app": "charmcraft",
+            "platform": "s390x",
+            "build_on": "s390x",
+            "build_for": "s390x",
+            "build_base": "ubuntu@24.04",
+        },
+        {
+            "source": str(projects / "snap" / "snapcraft.yaml"),
+            "app": "snapcraft",
+            "platform": "amd64",
+            "build_on": "amd64",
+            "build_for": "amd64",
+            "build_base": "ubuntu@24.04",
+        },
+        {
+            "source": str(projects / "snap" / "snapcraft.yaml"),
+            "app": "snapcraft",
+            "platform": "riscv64",
+            "build_on": "riscv64",
+            "build_for": "riscv64",
+            "build_base": "ubuntu@24.04",
+        },
+    ]
+
+
+def test_plan_file_errors(capsys, projects):
+    (projects / "project.yaml").write_text(CHARM)
+    (projects / "rockcraft.yaml").write_text("- not a project\n")
+    (projects / "snapcraft.yaml").write_text("platforms: {}\n")
+
+    code, lines = _run(
+        capsys,
+        "-j1",
+        str(projects / "charmcraft.yaml"),
+        str(projects / "missing.yaml"),
+        str(projects / "project.yaml"),
+        str(projects / "rockcraft.yaml"),
+        str(projects / "snapcraft.yaml"),
+    )
+
+    assert code == 1
+    assert [(line["app"], line.get("error")) for line in lines] == [
+        ("charmcraft", None),
+        (None, "FileNotFoundError"),
+        (None, "UsageError"),
+        ("rockcraft", "UsageError"),
+        ("snapcraft", "RequiresBaseError"),
+    ]
+    assert lines[-1]["resolution"] == "Declare a 'base' in 'snapcraft.yaml'"
+
+
+def test_app_option(capsys, projects):
+    path = projects / "project.yaml"
+    path.write_text(CHARM)
+
+    code, lines = _run(capsys, "-j1", "--app", "charmcraft", str(path))
+
+    assert code == 0
+    assert [line["app"] for line in lines] == ["charmcraft"]
+
+
+def test_plan_stdin(capsys, monkeypatch):
+    records = [
+        {"app": "snapcraft", "id": "my-snap", "project": {"platforms": {}}},
+        {"project": {"base": "ubuntu@24.04", "platforms": {"amd64": None}}},
+        {"app": "snapcraft"},
+        "not json",
+    ]
+    stdin = "\n".join(
+        json.dumps(record) if isinstance(record, dict) else record for record in records
+    )
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin + "\n\n"))
+
+    code, lines = _run(capsys, "-j1", "--app", "mycraft")
+
+    assert code == 1
+    assert [
+        (line["source"], line["app"], line.get("platform"), line.get("error"))
+        for line in lines
+    ] == [
+        ("<stdin>:2", "mycraft", "amd64", None),
+        ("<stdin>:3", "mycraft", None, "UsageError"),
+        ("<stdin>:4", "mycraft", None, "JSONDecodeError"),
+        ("my-snap", "snapcraft", None, "RequiresBaseError"),
+    ]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_plan_stdin_many(capsys, monkeypatch, jobs):
+    # More projects than are planned at a time, so results arrive while input is
+    # still being read.
+    records = [
+        {
+            "id": f"{'valid' if index % 2 else 'invalid'}-{index}",
+            "project": {
+                "base": "ubuntu@24.04",
+                "platforms": {"amd64" if index % 2 else "nope": None},
+            },
+        }
+        for index in range(500)
+    ]
+    stdin = "".join(json.dumps(record) + "\n" for record in records)
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+
+    code, lines = _run(capsys, "-j", jobs, "--app", "rockcraft")
+
+    assert code == 1
+    assert len(lines) == len(records)
+    for line in lines:
+        if line["source"].startswith("valid-"):
+            assert line["platform"] == "amd64"
+        else:
+            assert line["error"] == "InvalidDebianArchPlatformNameError"
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_plan_stdin_malformed(capsys, monkeypatch, jobs):
+    records = [
+        {"id": "valid-1", "project": {"base": "core24", "platforms": {"amd64": None}}},
+        {"id": "list", "project": {"base": "core24", "platforms": ["amd64"]}},
+        {"id": "valid-2", "project": {"base": "core24", "platforms": {"s390x": None}}},
+    ]
+    stdin = "".join(json.dumps(record) + "\n" for record in records)
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+
+    code, lines = _run(capsys, "-j", jobs, "--app", "snapcraft")
+
+    assert code == 1
+    assert [
+        (line["source"], line.get("platform"), line.get("error")) for line in lines
+    ] == [
+        ("list", None, "AttributeError"),
+        ("valid-1", "amd64", None),
+        ("valid-2", "s390x", None),
+    ]
+
+
+def test_one_job_window(capsys, monkeypatch, mocker):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(""))
+    get_build_plans = mocker.spy(_batch, "get_build_plans")
+
+    assert _cli.main(["plan", "-j", "1"]) == 0
+
+    assert get_build_plans.call_args.kwargs["max_workers"] == 1
+
+
+def test_invalid_jobs(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        _cli.main(["plan", "-j", "0"])
+
+    assert exc_info.value.code == 2
+    assert "--jobs must be at least 1" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ("name", "app"),
+    [
+        ("snapcraft.yaml", "snapcraft"),
+        (".charmcraft.yaml", "charmcraft"),
+        ("rockcraft.yml", "rockcraft"),
+        ("mycraft.yaml", "mycraft"),
+        ("project.yaml", None),
+        ("snapcraft.json", None),
+    ],
+)
+def test_infer_app(tmp_path, name, app):
+    assert _cli._infer_app(tmp_path / name) == app
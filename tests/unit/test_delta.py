@@ -0,0 +1,213 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for incremental build planning."""
+
+import copy
+from typing import Any, Dict
+
+import craft_platforms
+import pytest
+from craft_platforms import _build, _errors
+
+CROSS = {"build-on": ["amd64", "arm64"], "build-for": ["riscv64"]}
+
+PROJECTS: Dict[str, Dict[str, Any]] = {
+    "mycraft": {
+        "base": "ubuntu@24.04",
+        "platforms": {"amd64": None, "cross": CROSS},
+    },
+    "charmcraft": {
+        "base": "ubuntu@24.04",
+        "platforms": {"amd64": None, "cross": CROSS},
+    },
+    "debcraft": {
+        "base": "ubuntu@24.04",
+        "platforms": {
+            "amd64": None,
+            "all": {"build-on": ["amd64"], "build-for": ["all"]},
+        },
+    },
+    "rockcraft": {
+        "base": "ubuntu@24.04",
+        "platforms": {"amd64": None, "cross": CROSS},
+    },
+    "snapcraft": {
+        "base": "core24",
+        "platforms": {"amd64": None, "cross": CROSS},
+    },
+}
+
+EDITS = {
+    "unchanged": lambda project: None,
+    "add-platform": lambda project: project["platforms"].update(s390x=None),
+    "remove-platform": lambda project: project["platforms"].pop("amd64"),
+    "change-platform": lambda project: project["platforms"].update(
+        cross={"build-on": ["amd64"], "build-for": ["s390x"]}
+    ),
+    "reorder-platforms": lambda project: project.update(
+        platforms=dict(reversed(list(project["platforms"].items())))
+    ),
+    "change-build-base": lambda project: project.update({"build-base": "devel"}),
+    "drop-platforms": lambda project: project.pop("platforms"),
+}
+
+
+def _as_tuples(build_plan):
+    return sorted(
+        (info.platform, info.build_on, str(info.build_for), str(info.build_base))
+        for info in build_plan
+    )
+
+
+@pytest.mark.parametrize("edit", EDITS)
+@pytest.mark.parametrize("app", PROJECTS)
+def test_delta_matches_full_plan(app, edit):
+    previous_project = copy.deepcopy(PROJECTS[app])
+    project = copy.deepcopy(previous_project)
+    EDITS[edit](project)
+    previous_plan = craft_platforms.get_build_plan(
+        app, project_data=copy.deepcopy(previous_project)
+    )
+    try:
+        expected = craft_platforms.get_build_plan(
+            app, project_data=copy.deepcopy(project)
+        )
+    except (
+        craft_platforms.CraftPlatformsError,
+        AttributeError,
+        NotImplementedError,
+        ValueError,
+    ) as exc:
+        with pytest.raises(type(exc)):
+            craft_platforms.get_build_plan_delta(
+                app,
+                previous_project_data=previous_project,
+                previous_build_plan=previous_plan,
+                project_data=project,
+            )
+        return
+
+    delta = craft_platforms.get_build_plan_delta(
+        app,
+        previous_project_data=previous_project,
+        previous_build_plan=previous_plan,
+        project_data=project,
+    )
+
+    assert list(delta.build_plan) == list(expected)
+    assert _as_tuples([*delta.unchanged, *delta.added]) == _as_tuples(expected)
+    assert _as_tuples([*delta.unchanged, *delta.removed]) == _as_tuples(previous_plan)
+    assert delta.changed == (edit not in ("unchanged", "reorder-platforms"))
+
+
+def test_delta_only_plans_changed_platforms(mocker):
+    previous_project = copy.deepcopy(PROJECTS["mycraft"])
+    previous_plan = list(
+        craft_platforms.get_build_plan("mycraft", project_data=previous_project)
+    )
+    project = copy.deepcopy(previous_project)
+    project["platforms"]["cross"] = {"build-on": ["amd64"], "build-for": ["s390x"]}
+    spy = mocker.spy(_build, "get_build_plan")
+
+    delta = craft_platforms.get_build_plan_delta(
+        "mycraft",
+        previous_project_data=previous_project,
+        previous_build_plan=previous_plan,
+        project_data=project,
+    )
+
+    spy.assert_called_once_with(
+        "mycraft",
+        project_data={
+            "base": "ubuntu@24.04",
+            "platforms": {"cross": {"build-on": ["amd64"], "build-for": ["s390x"]}},
+        },
+    )
+    assert delta.unchanged == [previous_plan[0]]
+    assert _as_tuples(delta.added) == [
+        ("cross", "amd64", "s390x", "ubuntu@24.04"),
+    ]
+    assert _as_tuples(delta.removed) == [
+        ("cross", "amd64", "riscv64", "ubuntu@24.04"),
+        ("cross", "arm64", "riscv64", "ubuntu@24.04"),
+    ]
+
+
+def test_delta_no_changes_skips_planning(mocker):
+    project = PROJECTS["mycraft"]
+    previous_plan = craft_platforms.get_build_plan("mycraft", project_data=project)
+    spy = mocker.spy(_build, "get_build_plan")
+
+    delta = craft_platforms.get_build_plan_delta(
+        "mycraft",
+        previous_project_data=project,
+        previous_build_plan=previous_plan,
+        project_data=copy.deepcopy(project),
+    )
+
+    spy.assert_not_called()
+    assert not delta.changed
+    assert delta.unchanged == previous_plan
+
+
+@pytest.mark.parametrize(
+    ("app", "error"),
+    [
+        ("mycraft", craft_platforms.AllOnlyBuildError),
+        ("debcraft", _errors.AllInMultiplePlatformsError),
+    ],
+)
+def test_delta_validates_whole_plan(app, error):
+    previous_project: Dict[str, Any] = {
+        "base": "ubuntu@24.04",
+        "platforms": {"all": {"build-on": ["amd64"], "build-for": ["all"]}},
+    }
+    if app == "mycraft":
+        added = {"amd64": None}
+    else:
+        added = {"all2": {"build-on": ["amd64"], "build-for": ["all"]}}
+    project = copy.deepcopy(previous_project)
+    project["platforms"].update(added)
+
+    with pytest.raises(error):
+        craft_platforms.get_build_plan_delta(
+            app,
+            previous_project_data=previous_project,
+            previous_build_plan=craft_platforms.get_build_plan(
+                app, project_data=copy.deepcopy(previous_project)
+            ),
+            project_data=project,
+        )
+
+
+def test_delta_strict_platform_names():
+    previous_project: Dict[str, Any] = {
+        "base": "ubuntu@24.04",
+        "platforms": {"my_platform": CROSS},
+    }
+    project = copy.deepcopy(previous_project)
+    project["platforms"]["amd64"] = None
+
+    with pytest.raises(craft_platforms.InvalidPlatformNameError):
+        craft_platforms.get_build_plan_delta(
+            "mycraft",
+            previous_project_data=previous_project,
+            previous_build_plan=craft_platforms.get_build_plan(
+                "mycraft", project_data=previous_project
+            ),
+            project_data=project,
+            strict_platform_names=True,
+        )
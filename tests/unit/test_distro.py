@@ -16,6 +16,7 @@
 """Unit tests for distro utilities."""
 
 import itertools
+import operator
 
 import craft_platforms
 import distro
@@ -313,3 +314,37 @@ def test_fuzz_distrobase_from_linux_distribution(
 @given(hp_strat.builds(distro.LinuxDistribution))
 def test_fuzz_is_ubuntu_like(distribution):
     craft_platforms.is_ubuntu_like(distribution)
+
+
+def test_sort_key_total_ordering():
+    bases = [DEVEL, BOOKWORM, NOBLE, ALMA_NINE, DAPPER, BUSTER, ALMA_EIGHT]
+
+    assert sorted(bases, key=operator.attrgetter("sort_key")) == [
+        ALMA_EIGHT,
+        ALMA_NINE,
+        BUSTER,
+        BOOKWORM,
+        DAPPER,
+        NOBLE,
+        DEVEL,
+    ]
+
+
+def test_sort_key_cached():
+    base = craft_platforms.DistroBase("ubuntu", "24.04")
+
+    assert base.sort_key is base.sort_key
+
+
+@given(first=strategies.real_distro_base(), second=strategies.real_distro_base())
+def test_fuzz_sort_key_matches_comparisons(
+    first: craft_platforms.DistroBase, second: craft_platforms.DistroBase
+):
+    try:
+        less_than = first < second
+    except ValueError:
+        return
+    assert less_than == (first.sort_key < second.sort_key)  # ty: ignore[unsupported-operator]
+    assert (first <= second) == (first.sort_key <= second.sort_key)  # ty: ignore[unsupported-operator]
+    assert (first > second) == (first.sort_key > second.sort_key)  # ty: ignore[unsupported-operator]
+    assert (first >= second) == (first.sort_key >= second.sort_key)  # ty: ignore[unsupported-operator]
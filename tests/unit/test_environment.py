@@ -0,0 +1,144 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for grouping build plans by build environment."""
+
+import pytest
+from craft_platforms import (
+    BuildEnvironment,
+    BuildInfo,
+    DebianArchitecture,
+    DistroBase,
+    charm,
+    get_build_plan,
+    group_build_plans_by_build_environment,
+    group_by_build_environment,
+    order_by_build_environment,
+)
+
+AMD64 = DebianArchitecture.AMD64
+ARM64 = DebianArchitecture.ARM64
+RISCV64 = DebianArchitecture.RISCV64
+JAMMY = DistroBase("ubuntu", "22.04")
+NOBLE = DistroBase("ubuntu", "24.04")
+
+ENTRIES = [
+    BuildInfo("amd64", AMD64, AMD64, NOBLE),
+    BuildInfo("arm64", ARM64, ARM64, NOBLE),
+    BuildInfo("cross", AMD64, RISCV64, NOBLE),
+    BuildInfo("jammy", ARM64, ARM64, JAMMY),
+    BuildInfo("cross", ARM64, RISCV64, NOBLE),
+]
+
+
+def test_from_build_info():
+    assert BuildEnvironment.from_build_info(ENTRIES[3]) == (JAMMY, ARM64)
+
+
+def test_group_by_build_environment():
+    assert group_by_build_environment(ENTRIES) == {
+        BuildEnvironment(NOBLE, AMD64): [ENTRIES[0], ENTRIES[2]],
+        BuildEnvironment(NOBLE, ARM64): [ENTRIES[1], ENTRIES[4]],
+        BuildEnvironment(JAMMY, ARM64): [ENTRIES[3]],
+    }
+
+
+def test_group_by_build_environment_order():
+    groups = group_by_build_environment(ENTRIES)
+
+    assert list(groups) == [(NOBLE, AMD64), (NOBLE, ARM64), (JAMMY, ARM64)]
+
+
+def test_order_by_build_environment():
+    assert order_by_build_environment(iter(ENTRIES)) == [
+        ENTRIES[0],
+        ENTRIES[2],
+        ENTRIES[1],
+        ENTRIES[4],
+        ENTRIES[3],
+    ]
+
+
+@pytest.mark.parametrize("build_plan", [[], ENTRIES[:1], ENTRIES])
+def test_order_by_build_environment_is_permutation(build_plan):
+    ordered = order_by_build_environment(build_plan)
+
+    assert sorted(map(id, ordered)) == sorted(map(id, build_plan))
+
+
+def test_platforms_build_plan():
+    project = {
+        "base": "ubuntu@24.04",
+        "platforms": {
+            "amd64": None,
+            "arm64": None,
+            "cross": {"build-on": ["amd64", "arm64"], "build-for": ["riscv64"]},
+        },
+    }
+    build_plan = get_build_plan("mycraft", project_data=project)
+
+    groups = group_by_build_environment(build_plan)
+
+    assert {
+        environment: [info.platform for info in entries]
+        for environment, entries in groups.items()
+    } == {
+        (NOBLE, AMD64): ["amd64", "cross"],
+        (NOBLE, ARM64): ["arm64", "cross"],
+    }
+
+
+def test_bases_charm_build_plan():
+    bases = [
+        {
+            "build-on": [
+                {"name": "ubuntu", "channel": "22.04", "architectures": ["amd64"]}
+            ],
+            "run-on": [{"name": "ubuntu", "channel": "22.04"}],
+        },
+        {"name": "ubuntu", "channel": "24.04", "architectures": ["arm64"]},
+        {
+            "build-on": [
+                {"name": "ubuntu", "channel": "22.04", "architectures": ["amd64"]}
+            ],
+            "run-on": [
+                {"name": "ubuntu", "channel": "22.04", "architectures": ["all"]}
+            ],
+        },
+    ]
+    build_plan = charm.get_bases_charm_build_plan(bases)
+
+    groups = group_by_build_environment(build_plan)
+
+    assert {
+        environment: [info.platform for info in entries]
+        for environment, entries in groups.items()
+    } == {
+        (JAMMY, AMD64): ["ubuntu-22.04-amd64", "ubuntu-22.04-all"],
+        (NOBLE, ARM64): ["ubuntu-24.04-arm64"],
+    }
+
+
+def test_group_build_plans_by_build_environment():
+    build_plans = {
+        "first": ENTRIES[:2],
+        "second": [ENTRIES[3], ENTRIES[0]],
+    }
+
+    assert group_build_plans_by_build_environment(build_plans) == {
+        (NOBLE, AMD64): [("first", ENTRIES[0]), ("second", ENTRIES[0])],
+        (NOBLE, ARM64): [("first", ENTRIES[1])],
+        (JAMMY, ARM64): [("second", ENTRIES[3])],
+    }
@@ -15,9 +15,11 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Unit tests for error classes."""
 
+import pickle
 from typing import Optional
 
 import pytest
+from craft_platforms import _errors
 from craft_platforms._errors import CraftPlatformsError
 
 FULL_PLATFORMS_ERROR = CraftPlatformsError(
@@ -196,3 +198,21 @@ class NonError:
 )
 def test_platforms_error_equality(this, that, expected):
     assert (this == that) == expected
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        _errors.CraftPlatformsError("message", details="details"),
+        _errors.InvalidPlatformError("my-platform", resolution="Fix it."),
+        _errors.AllOnlyBuildError(["a", "b"]),
+        _errors.InvalidDebianArchPlatformNameError("my-platform"),
+    ],
+)
+def test_errors_pickle(error):
+    unpickled = pickle.loads(pickle.dumps(error))  # noqa: S301
+
+    assert type(unpickled) is type(error)
+    assert unpickled == error
+    assert unpickled.args == error.args
+    assert unpickled.__dict__ == error.__dict__
@@ -0,0 +1,208 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for build plan filters."""
+
+from typing import Any, Dict
+
+import craft_platforms
+import pytest
+from craft_platforms import DebianArchitecture, DistroBase, _buildinfo, charm
+
+AMD64 = DebianArchitecture.AMD64
+RISCV64 = DebianArchitecture.RISCV64
+NOBLE = DistroBase("ubuntu", "24.04")
+
+CROSS_PROJECT: Dict[str, Any] = {
+    "base": "ubuntu@24.04",
+    "platforms": {
+        "amd64": None,
+        "riscv64": None,
+        "cross": {
+            "build-on": ["amd64", "arm64", "s390x"],
+            "build-for": ["riscv64", "ppc64el"],
+        },
+    },
+}
+
+
+@pytest.fixture
+def count_build_infos(mocker):
+    return mocker.patch.object(
+        _buildinfo, "BuildInfo", wraps=_buildinfo.BuildInfo, autospec=False
+    )
+
+
+def test_filter_normalizes_criteria():
+    build_filter = craft_platforms.BuildPlanFilter(
+        build_on="amd64",
+        build_for=[RISCV64, "all"],
+        platform="my-platform",
+        build_base=NOBLE,
+    )
+
+    assert build_filter.build_on == frozenset({AMD64})
+    assert build_filter.build_for == frozenset({RISCV64, "all"})
+    assert build_filter.platform == frozenset({"my-platform"})
+    assert build_filter.build_base == (NOBLE,)
+    assert build_filter.predicate is None
+
+
+def test_filter_invalid_architecture():
+    with pytest.raises(ValueError, match="'nope' is not a valid DebianArchitecture"):
+        craft_platforms.BuildPlanFilter(build_on="nope")
+
+
+def test_filter_build_on_all():
+    with pytest.raises(ValueError, match="Cannot build on 'all'"):
+        craft_platforms.BuildPlanFilter(build_on="all")
+
+
+@pytest.mark.parametrize(
+    ("build_filter", "expected"),
+    [
+        (craft_platforms.BuildPlanFilter(), True),
+        (craft_platforms.BuildPlanFilter(build_on="amd64"), True),
+        (craft_platforms.BuildPlanFilter(build_on="arm64"), False),
+        (craft_platforms.BuildPlanFilter(build_for="riscv64"), True),
+        (craft_platforms.BuildPlanFilter(build_for="all"), False),
+        (craft_platforms.BuildPlanFilter(platform="cross"), True),
+        (craft_platforms.BuildPlanFilter(platform=["a", "b"]), False),
+        (craft_platforms.BuildPlanFilter(build_base=NOBLE), True),
+        (
+            craft_platforms.BuildPlanFilter(build_base=DistroBase("ubuntu", "22.04")),
+            False,
+        ),
+        (craft_platforms.BuildPlanFilter(predicate=lambda _: False), False),
+    ],
+)
+def test_filter_call(build_filter, expected):
+    info = craft_platforms.BuildInfo("cross", AMD64, RISCV64, NOBLE)
+
+    assert build_filter(info) is expected
+
+
+def test_filter_skips_construction(count_build_infos):
+    build_plan = craft_platforms.get_build_plan(
+        "mycraft",
+        project_data=CROSS_PROJECT,
+        build_filter=craft_platforms.BuildPlanFilter(
+            build_on="amd64", build_for="riscv64"
+        ),
+    )
+
+    assert build_plan == [
+        craft_platforms.BuildInfo("cross", AMD64, RISCV64, NOBLE),
+    ]
+    assert count_build_infos.call_count == 1
+
+
+def test_filter_charm_skips_construction(count_build_infos):
+    build_plan = charm.get_platforms_charm_build_plan(
+        base=CROSS_PROJECT["base"],
+        platforms=CROSS_PROJECT["platforms"],
+        build_filter=craft_platforms.BuildPlanFilter(platform="riscv64"),
+    )
+
+    assert build_plan == [
+        craft_platforms.BuildInfo("riscv64", RISCV64, RISCV64, NOBLE),
+    ]
+    assert count_build_infos.call_count == 1
+
+
+def test_filter_build_base_skips_everything(count_build_infos):
+    build_plan = craft_platforms.get_build_plan(
+        "mycraft",
+        project_data=CROSS_PROJECT,
+        build_filter=craft_platforms.BuildPlanFilter(
+            build_base=DistroBase("ubuntu", "22.04")
+        ),
+    )
+
+    assert build_plan == []
+    assert count_build_infos.call_count == 0
+
+
+@pytest.mark.parametrize("app", ["mycraft", "charmcraft"])
+def test_filter_still_validates_architectures(app):
+    project = {
+        "base": "ubuntu@24.04",
+        "platforms": {
+            "amd64": None,
+            "broken": {"build-on": ["amd64"], "build-for": ["nope"]},
+        },
+    }
+
+    with pytest.raises(ValueError, match="'nope' is not a valid Debian ?[Aa]rch"):
+        craft_platforms.get_build_plan(
+            app,
+            project_data=project,
+            build_filter=craft_platforms.BuildPlanFilter(platform="amd64"),
+        )
+
+
+def test_filter_still_validates_build_for_all():
+    project = {
+        "base": "ubuntu@24.04",
+        "platforms": {
+            "amd64": None,
+            "all": {"build-on": ["amd64"], "build-for": ["all"]},
+        },
+    }
+
+    with pytest.raises(craft_platforms.AllOnlyBuildError):
+        craft_platforms.get_build_plan(
+            "mycraft",
+            project_data=project,
+            build_filter=craft_platforms.BuildPlanFilter(build_for="amd64"),
+        )
+
+
+@pytest.mark.parametrize(
+    ("build_on", "build_for", "error"),
+    [
+        (["nope", "amd64"], ["also-nope"], "'nope'"),
+        (["amd64", "nope"], ["also-nope"], "'also-nope'"),
+        (["amd64", "nope"], ["riscv64"], "'nope'"),
+    ],
+)
+def test_filter_same_first_error(build_on, build_for, error):
+    project = {
+        "base": "ubuntu@24.04",
+        "platforms": {"p": {"build-on": build_on, "build-for": build_for}},
+    }
+
+    with pytest.raises(ValueError, match=error):
+        craft_platforms.get_build_plan(
+            "mycraft",
+            project_data=project,
+            build_filter=craft_platforms.BuildPlanFilter(build_on="s390x"),
+        )
+
+
+def test_filter_bases_charm():
+    bases = [
+        {
+            "name": "ubuntu",
+            "channel": "22.04",
+            "architectures": ["amd64", "riscv64"],
+        },
+    ]
+
+    build_plan = charm.get_bases_charm_build_plan(
+        bases, build_filter=craft_platforms.BuildPlanFilter(build_on="riscv64")
+    )
+
+    assert [info.build_on for info in build_plan] == [RISCV64]
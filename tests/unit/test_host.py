@@ -0,0 +1,262 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for host information."""
+
+import concurrent.futures
+import os
+import subprocess
+
+import craft_platforms
+import distro
+import pytest
+from craft_platforms import DebianArchitecture, DistroBase, HostInfo, _host
+
+from tests.unit.test_distro import CENTOS_7, DEBIAN_10
+
+NOBLE_OS_RELEASE = """\
+PRETTY_NAME="Ubuntu 24.04.1 LTS"
+NAME="Ubuntu"
+VERSION_ID="24.04"
+VERSION="24.04.1 LTS (Noble Numbat)"
+VERSION_CODENAME=noble
+ID=ubuntu
+ID_LIKE=debian
+UBUNTU_CODENAME=noble
+LOGO=ubuntu-logo
+"""
+NOBLE = DistroBase("ubuntu", "24.04")
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    craft_platforms.clear_caches()
+    yield
+    craft_platforms.clear_caches()
+
+
+@pytest.fixture
+def os_release(tmp_path, monkeypatch):
+    """An os-release file used as the host's."""
+    path = tmp_path / "os-release"
+    path.write_text(NOBLE_OS_RELEASE)
+    monkeypatch.setattr(
+        _host, "OS_RELEASE_PATHS", (tmp_path / "missing", path, tmp_path / "other")
+    )
+    return path
+
+
+@pytest.mark.parametrize(
+    ("os_release", "expected"),
+    [
+        (
+            {"ID": "ubuntu", "VERSION_ID": "24.04"},
+            HostInfo(NOBLE, (), DebianArchitecture.RISCV64),
+        ),
+        (
+            {"ID": "pop", "VERSION_ID": "22.04", "ID_LIKE": "ubuntu debian"},
+            HostInfo(
+                DistroBase("pop", "22.04"),
+                ("ubuntu", "debian"),
+                DebianArchitecture.RISCV64,
+            ),
+        ),
+        (
+            {"ID": "ol", "VERSION_ID": "9.4"},
+            HostInfo(DistroBase("oracle", "9.4"), (), DebianArchitecture.RISCV64),
+        ),
+        (
+            {"ID": "My Distro", "VERSION_ID": "1"},
+            HostInfo(DistroBase("my_distro", "1"), (), DebianArchitecture.RISCV64),
+        ),
+        ({"ID": "debian"}, None),
+        ({"VERSION_ID": "1"}, None),
+    ],
+)
+def test_from_os_release(os_release, expected):
+    actual = HostInfo.from_os_release(
+        os_release, architecture=DebianArchitecture.RISCV64
+    )
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    ("host_info", "expected"),
+    [
+        (HostInfo(NOBLE), True),
+        (HostInfo(DistroBase("pop", "22.04"), ("ubuntu", "debian")), True),
+        (HostInfo(DistroBase("debian", "12"), ("debian",)), False),
+    ],
+)
+def test_is_ubuntu_like(host_info, expected):
+    assert host_info.is_ubuntu_like is expected
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (NOBLE_OS_RELEASE, NOBLE),
+        (DEBIAN_10, DistroBase("debian", "10")),
+        (CENTOS_7, DistroBase("centos", "7")),
+    ],
+)
+def test_probe_matches_distro(tmp_path, content, expected):
+    path = tmp_path / "os-release"
+    path.write_text(content)
+    distribution = distro.LinuxDistribution(
+        include_lsb=False, include_uname=False, os_release_file=str(path)
+    )
+
+    host_info = HostInfo.probe(path)
+
+    assert host_info.base == expected
+    assert host_info.base == DistroBase.from_linux_distribution(distribution)
+    assert host_info.id_like == tuple(distribution.like().split())
+    assert host_info.architecture == DebianArchitecture.from_host()
+
+
+def test_probe_unknown_architecture(os_release, mocker):
+    mocker.patch("platform.machine", return_value="z80")
+
+    assert HostInfo.probe().architecture is None
+
+
+def test_probe_falls_back_to_distro(os_release, mocker):
+    os_release.write_text("ID=debian\n")
+    distribution = mocker.patch("distro.LinuxDistribution")
+    distribution.return_value.id.return_value = "debian"
+    distribution.return_value.version.return_value = "13"
+    distribution.return_value.like.return_value = ""
+
+    host_info = HostInfo.probe()
+
+    assert host_info.base == DistroBase("debian", "13")
+    distribution.assert_called_once_with(include_lsb=False, include_uname=False)
+
+
+def test_probe_no_subprocess(os_release, mocker):
+    popen = mocker.patch.object(subprocess, "Popen", side_effect=AssertionError)
+
+    HostInfo.probe()
+
+    popen.assert_not_called()
+
+
+def test_get_host_info_cached(os_release, mocker):
+    probe = mocker.spy(HostInfo, "probe")
+
+    first = craft_platforms.get_host_info()
+    second = craft_platforms.get_host_info()
+
+    assert first is second
+    assert first.base == NOBLE
+    assert probe.call_count == 1
+    assert craft_platforms.get_cache_info()["host_info"] == craft_platforms.CacheInfo(
+        hits=1, misses=1, maxsize=1, currsize=1
+    )
+
+
+def test_get_host_info_os_release_changed(os_release):
+    before = craft_platforms.get_host_info()
+    os_release.write_text(DEBIAN_10)
+    stat = os_release.stat()
+    os.utime(os_release, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    after = craft_platforms.get_host_info()
+
+    assert before.base == NOBLE
+    assert after.base == DistroBase("debian", "10")
+
+
+def test_get_host_info_refresh(os_release, mocker):
+    probe = mocker.spy(HostInfo, "probe")
+
+    craft_platforms.get_host_info()
+    craft_platforms.get_host_info(refresh=True)
+
+    assert probe.call_count == 2
+
+
+def test_clear_caches(os_release, mocker):
+    probe = mocker.spy(HostInfo, "probe")
+    craft_platforms.get_host_info()
+
+    craft_platforms.clear_caches()
+    craft_platforms.get_host_info()
+
+    assert probe.call_count == 2
+
+
+def test_distro_base_from_host(os_release):
+    assert DistroBase.from_host() is craft_platforms.get_host_info().base
+
+
+def test_distro_base_from_host_subclass(os_release):
+    class MyBase(DistroBase):
+        pass
+
+    base = MyBase.from_host()
+
+    assert type(base) is MyBase
+    assert base == NOBLE
+
+
+def test_is_ubuntu_like_host(os_release):
+    assert craft_platforms.is_ubuntu_like() is True
+
+
+def test_use_host_info(mocker):
+    probe = mocker.patch.object(HostInfo, "probe", side_effect=AssertionError)
+    host_info = HostInfo(DistroBase("pop", "22.04"), ("ubuntu",))
+
+    with craft_platforms.use_host_info(host_info) as used:
+        assert used is host_info
+        assert craft_platforms.get_host_info() is host_info
+        assert DistroBase.from_host() == DistroBase("pop", "22.04")
+        assert craft_platforms.is_ubuntu_like()
+
+    probe.assert_not_called()
+
+
+def test_use_host_info_nested(os_release):
+    outer = HostInfo(DistroBase("debian", "12"))
+    inner = HostInfo(NOBLE)
+
+    with craft_platforms.use_host_info(outer):
+        with craft_platforms.use_host_info(inner):
+            assert craft_platforms.get_host_info() is inner
+        assert craft_platforms.get_host_info() is outer
+    assert craft_platforms.get_host_info().base == NOBLE
+
+
+def test_get_build_plans_host_info(mocker):
+    mocker.patch.object(HostInfo, "probe", side_effect=AssertionError)
+    projects = [("debcraft", {"platforms": {"amd64": None}})] * 3
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(
+            craft_platforms.get_build_plans(
+                projects,
+                executor=executor,
+                chunk_size=1,
+                host_info=HostInfo(DistroBase("debian", "13")),
+            )
+        )
+
+    assert [result.error for result in results] == [None, None, None]
+    assert {
+        info.build_base for result in results for info in result.build_plan or []
+    } == {DistroBase("debian", "13")}
@@ -0,0 +1,284 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the instrumentation of build planning."""
+
+import time
+
+import craft_platforms
+import pytest
+from craft_platforms import PlanningStage, _instrument
+
+ALL_PLATFORM = {"build-on": ["amd64"], "build-for": ["all"]}
+
+
+@pytest.fixture
+def events():
+    events = []
+    with craft_platforms.stage_hook(events.append):
+        yield events
+
+
+def _stages(events):
+    return [(event.app, event.stage, event.count) for event in events]
+
+
+@pytest.mark.parametrize(
+    ("app", "project_data", "expected"),
+    [
+        pytest.param(
+            "charmcraft",
+            {"base": "ubuntu@24.04", "platforms": {"amd64": None, "riscv64": None}},
+            [
+                ("charmcraft", PlanningStage.RESOLVE_BASE, 1),
+                ("charmcraft", PlanningStage.RESOLVE_BASE, 1),
+                ("charmcraft", PlanningStage.EXPAND, 2),
+                ("charmcraft", PlanningStage.PLAN, 2),
+            ],
+            id="charm",
+        ),
+        pytest.param(
+            "snapcraft",
+            {"base": "core24", "platforms": {"all": ALL_PLATFORM}},
+            [
+                ("snapcraft", PlanningStage.RESOLVE_BASE, 1),
+                ("snapcraft", PlanningStage.VALIDATE_BUILD_FOR_ALL, 1),
+                ("snapcraft", PlanningStage.EXPAND, 1),
+                ("snapcraft", PlanningStage.PLAN, 1),
+            ],
+            id="snap",
+        ),
+        pytest.param(
+            "rockcraft",
+            {"base": "ubuntu@24.04", "platforms": {"amd64": None}},
+            [
+                ("rockcraft", PlanningStage.RESOLVE_BASE, 1),
+                ("rockcraft", PlanningStage.VALIDATE_BUILD_FOR_ALL, 1),
+                ("rockcraft", PlanningStage.EXPAND, 1),
+                ("rockcraft", PlanningStage.PLAN, 1),
+            ],
+            id="rock",
+        ),
+        pytest.param(
+            "debcraft",
+            {"base": "ubuntu@24.04", "platforms": {"amd64": None, "all": ALL_PLATFORM}},
+            [
+                ("debcraft", PlanningStage.RESOLVE_BASE, 1),
+                ("debcraft", PlanningStage.VALIDATE_BUILD_FOR_ALL, 1),
+                ("debcraft", PlanningStage.EXPAND, 2),
+                ("debcraft", PlanningStage.PLAN, 2),
+            ],
+            id="deb",
+        ),
+        pytest.param(
+            "mycraft",
+            {"base": "ubuntu@24.04", "platforms": {"amd64": None}},
+            [
+                ("mycraft", PlanningStage.RESOLVE_BASE, 1),
+                ("mycraft", PlanningStage.VALIDATE_BUILD_FOR_ALL, 1),
+                ("mycraft", PlanningStage.EXPAND, 1),
+                ("mycraft", PlanningStage.PLAN, 1),
+            ],
+            id="generic",
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "plan", [craft_platforms.get_build_plan, craft_platforms.iter_build_plan]
+)
+def test_stages(events, plan, app, project_data, expected):
+    build_plan = list(plan(app, project_data=project_data))
+
+    stages = [event for event in events if event.stage != PlanningStage.PLANNER]
+    assert _stages(stages) == expected
+    assert stages[-1].count == len(build_plan)
+    assert stages[-1].details == {"platforms": len(project_data["platforms"])}
+    # Expansion is the time that isn't spent in any other stage.
+    assert sum(event.duration for event in stages[:-1]) == pytest.approx(
+        stages[-1].duration
+    )
+    assert all(event.start >= stages[-1].start for event in events)
+
+
+@pytest.mark.parametrize(
+    ("app", "planner"),
+    [
+        ("charmcraft", "get_charm_build_plan"),
+        ("snapcraft", "get_platforms_snap_build_plan"),
+        ("rockcraft", "get_rock_build_plan"),
+        ("debcraft", "get_deb_build_plan"),
+        ("mycraft", "get_platforms_build_plan"),
+    ],
+)
+def test_planner_stage(events, app, planner):
+    project_data = {
+        "name": "my-project",
+        "base": "core24" if app == "snapcraft" else "ubuntu@24.04",
+        "platforms": {"amd64": None, "riscv64": None},
+    }
+
+    build_plan = list(craft_platforms.get_build_plan(app, project_data=project_data))
+
+    (planner_event,) = (
+        event for event in events if event.stage == PlanningStage.PLANNER
+    )
+    assert planner_event.app == app
+    assert planner_event.count == len(build_plan)
+    assert planner_event.details == {"planner": planner, "platforms": 2}
+    assert events[-1].details == {"name": "my-project", "platforms": 2}
+    assert events[-1].start <= planner_event.start
+    assert planner_event.duration <= events[-1].duration
+
+
+def test_validate_names(events):
+    craft_platforms.get_build_plan(
+        "mycraft",
+        project_data={
+            "base": "ubuntu@24.04",
+            "platforms": {
+                "amd64": None,
+                "x": {"build-on": "amd64", "build-for": "s390x"},
+            },
+        },
+        strict_platform_names=True,
+        build_filter=craft_platforms.BuildPlanFilter(platform="amd64"),
+    )
+
+    assert _stages(events)[0] == ("mycraft", PlanningStage.VALIDATE_NAMES, 2)
+
+
+def test_iter_excludes_consumer_time(events):
+    project_data = {"base": "ubuntu@24.04", "platforms": {"amd64": None, "s390x": None}}
+
+    for _ in craft_platforms.iter_build_plan("rockcraft", project_data=project_data):
+        time.sleep(0.05)
+
+    assert events[-1].stage == PlanningStage.PLAN
+    assert events[-1].duration < 0.05
+
+
+def test_iter_closed_early(events):
+    project_data = {"base": "ubuntu@24.04", "platforms": {"amd64": None, "s390x": None}}
+
+    build_plan = craft_platforms.iter_build_plan("rockcraft", project_data=project_data)
+    next(build_plan)
+    assert PlanningStage.PLAN not in [event.stage for event in events]
+    build_plan.close()
+
+    assert _stages(events)[-2:] == [
+        ("rockcraft", PlanningStage.EXPAND, 1),
+        ("rockcraft", PlanningStage.PLAN, 1),
+    ]
+
+
+def test_error(events):
+    with pytest.raises(craft_platforms.RequiresBaseError):
+        craft_platforms.get_build_plan("snapcraft", project_data={"platforms": {}})
+
+    assert _stages(events) == [
+        ("snapcraft", PlanningStage.RESOLVE_BASE, 1),
+        ("snapcraft", PlanningStage.PLANNER, 0),
+        ("snapcraft", PlanningStage.EXPAND, 0),
+        ("snapcraft", PlanningStage.PLAN, 0),
+    ]
+    assert isinstance(events[-1].error, craft_platforms.RequiresBaseError)
+    assert all(event.error is None for event in events[:-1])
+
+
+def test_app_specific_planner(events):
+    craft_platforms.snap.get_platforms_snap_build_plan(
+        "core24", platforms={"amd64": None}
+    )
+
+    assert _stages(events) == [
+        (None, PlanningStage.RESOLVE_BASE, 1),
+        (None, PlanningStage.VALIDATE_BUILD_FOR_ALL, 1),
+        (None, PlanningStage.PLANNER, 1),
+    ]
+
+
+def test_hook_error_raised():
+    def hook(event):
+        raise RuntimeError(event.stage)
+
+    with craft_platforms.stage_hook(hook), pytest.raises(RuntimeError):
+        craft_platforms.get_build_plan(
+            "mycraft", project_data={"base": "ubuntu@24.04", "platforms": {}}
+        )
+
+
+def test_no_hooks_not_instrumented(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Instrumented without a hook")
+
+    for name in ("timed", "collect_plan", "run_plan", "iter_plan", "in_plan"):
+        monkeypatch.setattr(_instrument, name, fail)
+
+    assert _instrument.HOOKS == ()
+    project_data = {"base": "core24", "platforms": {"all": ALL_PLATFORM}}
+    assert list(
+        craft_platforms.get_build_plan(
+            "snapcraft", project_data=project_data, strict_platform_names=True
+        )
+    )
+    assert list(craft_platforms.iter_build_plan("snapcraft", project_data=project_data))
+    assert list(
+        craft_platforms.get_build_plan(
+            "charmcraft", project_data={"base": "ubuntu@24.04", "platforms": None}
+        )
+    )
+    assert list(craft_platforms.get_build_plan("debcraft", project_data={"base": None}))
+
+
+def test_add_and_remove_hooks():
+    first = []
+    second = []
+    project_data = {"base": "ubuntu@24.04", "platforms": {"amd64": None}}
+
+    craft_platforms.add_stage_hook(first.append)
+    try:
+        with craft_platforms.stage_hook(second.append):
+            craft_platforms.get_build_plan("mycraft", project_data=project_data)
+        craft_platforms.get_build_plan("mycraft", project_data=project_data)
+    finally:
+        craft_platforms.remove_stage_hook(first.append)
+
+    assert len(first) == 2 * len(second)
+    assert _instrument.HOOKS == ()
+    with pytest.raises(ValueError, match="not in"):
+        craft_platforms.remove_stage_hook(first.append)
+
+
+def test_stage_timings():
+    timings = craft_platforms.StageTimings()
+    project_data = {"base": "ubuntu@24.04", "platforms": {"amd64": None, "s390x": None}}
+
+    with craft_platforms.stage_hook(timings):
+        for _ in range(3):
+            craft_platforms.get_build_plan("charmcraft", project_data=project_data)
+
+    totals = timings.totals
+    assert set(totals) == {
+        ("charmcraft", PlanningStage.RESOLVE_BASE),
+        ("charmcraft", PlanningStage.PLANNER),
+        ("charmcraft", PlanningStage.EXPAND),
+        ("charmcraft", PlanningStage.PLAN),
+    }
+    assert totals[("charmcraft", PlanningStage.RESOLVE_BASE)][:2] == (6, 6)
+    assert totals[("charmcraft", PlanningStage.PLAN)][:2] == (3, 6)
+    assert totals[("charmcraft", PlanningStage.PLAN)].duration > 0
+
+    timings.clear()
+    assert timings.totals == {}
@@ -0,0 +1,165 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the planning metrics registry."""
+
+import math
+
+import craft_platforms
+import pytest
+from craft_platforms import MetricsRegistry, PlanningStage, StageEvent
+
+CHARM = {"base": "ubuntu@24.04", "platforms": {"amd64": None, "riscv64": None}}
+ROCK = {"base": "ubuntu@24.04", "platforms": {"amd64": None}}
+
+
+@pytest.fixture
+def metrics():
+    craft_platforms.clear_caches()
+    metrics = MetricsRegistry()
+    with craft_platforms.stage_hook(metrics):
+        yield metrics
+
+
+def _event(duration, app="mycraft", count=1, error=None):
+    return StageEvent(
+        stage=PlanningStage.PLAN,
+        app=app,
+        duration=duration,
+        count=count,
+        start=0.0,
+        error=error,
+    )
+
+
+def test_counts(metrics):
+    craft_platforms.get_build_plan("charmcraft", project_data=CHARM)
+    craft_platforms.get_build_plan("charmcraft", project_data=CHARM)
+    list(craft_platforms.iter_build_plan("rockcraft", project_data=ROCK))
+    with pytest.raises(craft_platforms.RequiresBaseError):
+        craft_platforms.get_build_plan("snapcraft", project_data={"platforms": {}})
+    with pytest.raises(craft_platforms.CraftPlatformsError):
+        list(
+            craft_platforms.iter_build_plan(
+                "rockcraft", project_data={**ROCK, "platforms": {"z80": None}}
+            )
+        )
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["plans"] == {"charmcraft": 2, "rockcraft": 1}
+    assert snapshot["entries"] == {"charmcraft": 4, "rockcraft": 1}
+    assert snapshot["errors"] == {
+        "rockcraft": {"InvalidDebianArchPlatformNameError": 1},
+        "snapcraft": {"RequiresBaseError": 1},
+    }
+    assert {app: latency["count"] for app, latency in snapshot["latency"].items()} == {
+        "charmcraft": 2,
+        "rockcraft": 2,
+        "snapcraft": 1,
+    }
+    assert snapshot["caches"]["distro_base"]["hits"] > 0
+    assert 0 < snapshot["caches"]["distro_base"]["hit_rate"] < 1
+
+
+def test_unused_cache_hit_rate(metrics):
+    assert all(
+        cache == {"hits": 0, "misses": 0, "size": 0, "hit_rate": None}
+        for cache in metrics.snapshot()["caches"].values()
+    )
+
+
+def test_app_specific_planner_not_counted(metrics):
+    craft_platforms.charm.get_charm_build_plan(CHARM)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["plans"] == snapshot["latency"] == {}
+
+
+def test_histogram():
+    metrics = MetricsRegistry(buckets=[0.1, 1.0])
+
+    for duration in (0.05, 0.1, 0.5, 2.0, 3.0):
+        metrics(_event(duration))
+
+    assert metrics.snapshot()["latency"] == {
+        "mycraft": {
+            "buckets": [(0.1, 2), (1.0, 3), (math.inf, 5)],
+            "count": 5,
+            "sum": pytest.approx(5.65),
+        }
+    }
+
+
+def test_prometheus():
+    metrics = MetricsRegistry(buckets=[0.5])
+    metrics(_event(0.25, count=3))
+    metrics(_event(1.0, app='my"craft', error=craft_platforms.InvalidBaseError("x")))
+
+    text = metrics.to_prometheus()
+
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    assert "# TYPE craft_platforms_plans_total counter" in lines
+    assert 'craft_platforms_plans_total{app="mycraft"} 1' in lines
+    assert 'craft_platforms_build_infos_total{app="mycraft"} 3' in lines
+    assert (
+        'craft_platforms_plan_errors_total{app="my\\"craft",error="InvalidBaseError"} 1'
+        in lines
+    )
+    assert "# TYPE craft_platforms_plan_duration_seconds histogram" in lines
+    assert [line for line in lines if line.startswith("craft_platforms_plan_dur")] == [
+        'craft_platforms_plan_duration_seconds_bucket{app="my\\"craft",le="0.5"} 0',
+        'craft_platforms_plan_duration_seconds_bucket{app="my\\"craft",le="+Inf"} 1',
+        'craft_platforms_plan_duration_seconds_sum{app="my\\"craft"} 1.0',
+        'craft_platforms_plan_duration_seconds_count{app="my\\"craft"} 1',
+        'craft_platforms_plan_duration_seconds_bucket{app="mycraft",le="0.5"} 1',
+        'craft_platforms_plan_duration_seconds_bucket{app="mycraft",le="+Inf"} 1',
+        'craft_platforms_plan_duration_seconds_sum{app="mycraft"} 0.25',
+        'craft_platforms_plan_duration_seconds_count{app="mycraft"} 1',
+    ]
+    assert "# TYPE craft_platforms_cache_hits_total counter" in lines
+    assert "# TYPE craft_platforms_cache_hit_ratio gauge" in lines
+
+
+def test_ignores_other_stages():
+    metrics = MetricsRegistry()
+
+    metrics(
+        StageEvent(
+            stage=PlanningStage.EXPAND, app="mycraft", duration=1, count=1, start=0
+        )
+    )
+    metrics(_event(1, app=None))
+
+    assert metrics.snapshot()["latency"] == {}
+
+
+def test_clear():
+    metrics = MetricsRegistry()
+    metrics(_event(0.1))
+    metrics(_event(0.1, error=ValueError()))
+
+    metrics.clear()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["plans"] == snapshot["errors"] == snapshot["latency"] == {}
+
+
+@pytest.mark.parametrize("buckets", [[], [1.0, 0.5], [0.5, 0.5]])
+def test_invalid_buckets(buckets):
+    with pytest.raises(ValueError, match="bucket"):
+        MetricsRegistry(buckets=buckets)
@@ -0,0 +1,254 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for reading os-release files."""
+
+import concurrent.futures
+import io
+
+import craft_platforms
+import distro
+import pytest
+from craft_platforms import DistroBase, _os_release
+
+from tests.unit.test_distro import CENTOS_7, DEBIAN_10
+from tests.unit.test_host import NOBLE_OS_RELEASE
+
+TRICKY_OS_RELEASE = """\
+# A comment
+  NAME='Single quoted'
+ID=my-distro # a trailing comment
+ID_LIKE="ubuntu debian"
+VERSION_ID=1.0
+PRETTY_NAME="Escaped \\"quotes\\" and \\$dollars"
+VARIANT=Unquoted words
+EMPTY=
+"""
+MULTI_LINE_OS_RELEASE = """\
+ID=multi
+DESCRIPTION="A description
+over two lines"
+VERSION_ID=2
+"""
+
+NOBLE = DistroBase("ubuntu", "24.04")
+
+
+def _make_root(path, os_release=NOBLE_OS_RELEASE, location="etc/os-release"):
+    os_release_path = path / location
+    os_release_path.parent.mkdir(parents=True, exist_ok=True)
+    os_release_path.write_text(os_release)
+    return path
+
+
+@pytest.mark.parametrize(
+    "content",
+    [NOBLE_OS_RELEASE, TRICKY_OS_RELEASE, MULTI_LINE_OS_RELEASE, CENTOS_7, DEBIAN_10],
+)
+def test_parse_os_release_matches_distro(content):
+    expected = distro.LinuxDistribution._parse_os_release_content(io.StringIO(content))
+
+    actual = _os_release.parse_os_release(content)
+
+    assert {key.lower(): value for key, value in actual.items()} == {
+        key: value for key, value in expected.items() if key.upper() in actual
+    }
+    assert len(actual) == len(set(expected) - {"codename", "release_codename"})
+
+
+def test_parse_os_release_tricky():
+    assert _os_release.parse_os_release(TRICKY_OS_RELEASE) == {
+        "NAME": "Single quoted",
+        "ID": "my-distro",
+        "ID_LIKE": "ubuntu debian",
+        "VERSION_ID": "1.0",
+        "PRETTY_NAME": 'Escaped "quotes" and \\$dollars',
+        "VARIANT": "Unquoted",
+        "EMPTY": "",
+    }
+
+
+@pytest.mark.parametrize(
+    ("os_release", "expected"),
+    [
+        ({"ID": "ubuntu", "VERSION_ID": "24.04"}, NOBLE),
+        ({"ID": "ol", "VERSION_ID": "9.4"}, DistroBase("oracle", "9.4")),
+        ({"ID": "opensuse-leap", "VERSION_ID": "15"}, DistroBase("opensuse", "15")),
+        ({"ID": "My Distro", "VERSION_ID": "1"}, DistroBase("my_distro", "1")),
+        ({"ID": "debian"}, None),
+        ({"VERSION_ID": "1"}, None),
+    ],
+)
+def test_base_from_os_release(os_release, expected):
+    assert _os_release.base_from_os_release(os_release) == expected
+
+
+@pytest.mark.parametrize("location", ["etc/os-release", "usr/lib/os-release"])
+def test_from_root(tmp_path, location):
+    root = _make_root(tmp_path, location=location)
+
+    assert DistroBase.from_root(root) == NOBLE
+    assert DistroBase.from_root(str(root)) == NOBLE
+
+
+def test_from_root_etc_first(tmp_path):
+    _make_root(tmp_path, DEBIAN_10)
+    _make_root(tmp_path, location="usr/lib/os-release")
+
+    assert DistroBase.from_root(tmp_path) == DistroBase("debian", "10")
+
+
+@pytest.mark.parametrize(
+    "target",
+    [
+        "/usr/lib/os-release",
+        "../usr/lib/os-release",
+        "../../../../usr/lib/os-release",
+        "/usr/../usr/./lib/os-release",
+    ],
+)
+def test_from_root_symlink_stays_in_root(tmp_path, target):
+    root = _make_root(tmp_path / "root", location="usr/lib/os-release")
+    (root / "etc").mkdir()
+    (root / "etc" / "os-release").symlink_to(target)
+
+    assert DistroBase.from_root(root) == NOBLE
+
+
+def test_from_root_symlinked_directory(tmp_path):
+    root = _make_root(tmp_path / "root", location="real/os-release")
+    (root / "usr").mkdir()
+    (root / "usr" / "lib").symlink_to("/real")
+
+    assert DistroBase.from_root(root) == NOBLE
+
+
+def test_from_root_symlink_loop(tmp_path):
+    (tmp_path / "etc").mkdir()
+    (tmp_path / "etc" / "os-release").symlink_to("os-release")
+    _make_root(tmp_path, location="usr/lib/os-release")
+
+    assert DistroBase.from_root(tmp_path) == NOBLE
+
+
+def test_from_root_dangling_symlink(tmp_path):
+    (tmp_path / "etc").mkdir()
+    (tmp_path / "etc" / "os-release").symlink_to("/usr/lib/os-release")
+
+    with pytest.raises(ValueError, match="No os-release file found in"):
+        DistroBase.from_root(tmp_path)
+
+
+def test_from_root_missing(tmp_path):
+    with pytest.raises(ValueError, match="No os-release file found in"):
+        DistroBase.from_root(tmp_path)
+
+
+def test_from_root_incomplete(tmp_path):
+    _make_root(tmp_path, "ID=debian\nVERSION_CODENAME=sid\n")
+
+    with pytest.raises(ValueError, match="does not set both ID and VERSION_ID"):
+        DistroBase.from_root(tmp_path)
+
+
+def test_from_root_subclass(tmp_path):
+    class MyBase(DistroBase):
+        pass
+
+    base = MyBase.from_root(_make_root(tmp_path))
+
+    assert type(base) is MyBase
+    assert base == NOBLE
+
+
+@pytest.mark.parametrize("content", [NOBLE_OS_RELEASE, DEBIAN_10, CENTOS_7])
+def test_from_root_matches_distro(tmp_path, content):
+    root = _make_root(tmp_path, content)
+    distribution = distro.LinuxDistribution(
+        include_lsb=False, include_uname=False, root_dir=str(root)
+    )
+
+    assert DistroBase.from_root(root) == DistroBase.from_linux_distribution(
+        distribution
+    )
+
+
+def test_get_root_bases(tmp_path):
+    roots = [
+        _make_root(tmp_path / "noble"),
+        _make_root(tmp_path / "buster", DEBIAN_10),
+        tmp_path / "empty",
+        _make_root(tmp_path / "centos", CENTOS_7, "usr/lib/os-release"),
+        tmp_path / "does-not-exist",
+    ]
+    (tmp_path / "empty").mkdir()
+
+    results = sorted(
+        craft_platforms.get_root_bases(roots, max_workers=2),
+        key=lambda result: result.index,
+    )
+
+    assert [result.root for result in results] == roots
+    assert [result.base for result in results] == [
+        NOBLE,
+        DistroBase("debian", "10"),
+        None,
+        DistroBase("centos", "7"),
+        None,
+    ]
+    assert [type(result.error) for result in results] == [
+        type(None),
+        type(None),
+        ValueError,
+        type(None),
+        ValueError,
+    ]
+
+
+def test_get_root_bases_many(tmp_path):
+    root = _make_root(tmp_path)
+
+    results = list(craft_platforms.get_root_bases([str(root)] * 500, max_workers=4))
+
+    assert sorted(result.index for result in results) == list(range(500))
+    assert {result.base for result in results} == {NOBLE}
+
+
+def test_get_root_bases_streams(tmp_path):
+    root = _make_root(tmp_path)
+    consumed = []
+
+    def roots():
+        for index in range(1000):
+            consumed.append(index)
+            yield root
+
+    results = craft_platforms.get_root_bases(roots(), max_workers=1)
+    first = next(results)
+    results.close()
+
+    assert first.base == NOBLE
+    assert len(consumed) < 1000
+
+
+def test_get_root_bases_executor(tmp_path):
+    root = _make_root(tmp_path)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(craft_platforms.get_root_bases([root] * 3, executor=executor))
+        # The caller's executor isn't shut down.
+        assert executor.submit(int).result() == 0
+
+    assert [result.base for result in results] == [NOBLE] * 3
@@ -0,0 +1,160 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the persistent build plan cache."""
+
+import concurrent.futures
+
+import craft_platforms
+import pytest
+from craft_platforms import _build, _persistent_cache
+
+# Debcraft allows "build-for: all" alongside architecture-dependent builds.
+PROJECT = {
+    "base": "ubuntu@24.04",
+    "build-base": "ubuntu@devel",
+    "platforms": {
+        "amd64": None,
+        "all": {"build-on": ["riscv64"], "build-for": ["all"]},
+    },
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with craft_platforms.PersistentPlanCache(
+        tmp_path / "cache", version="1.0"
+    ) as cache:
+        yield cache
+
+
+def _plan_in_process(directory, index):
+    platform = {"build-on": ["amd64"], "build-for": ["s390x"]}
+    project = {"base": "ubuntu@24.04", "platforms": {f"p{index % 3}": platform}}
+    with craft_platforms.PersistentPlanCache(directory, version="1.0") as cache:
+        return list(cache.get_build_plan("mycraft", project_data=project))
+
+
+def test_round_trip(tmp_path, mocker):
+    spy = mocker.spy(_build, "get_build_plan")
+    with craft_platforms.PersistentPlanCache(tmp_path, version="1.0") as cache:
+        first = cache.get_build_plan("debcraft", project_data=PROJECT)
+
+    with craft_platforms.PersistentPlanCache(tmp_path, version="1.0") as cache:
+        second = cache.get_build_plan("debcraft", project_data=PROJECT)
+        info = cache.cache_info()
+
+    assert second == first
+    assert list(first) == spy.spy_return
+    assert spy.call_count == 1
+    assert all(isinstance(item, craft_platforms.FrozenBuildInfo) for item in second)
+    assert info == craft_platforms.CacheInfo(hits=1, misses=0, maxsize=None, currsize=1)
+
+
+def test_version_mismatch(tmp_path):
+    with craft_platforms.PersistentPlanCache(tmp_path, version="1.0") as cache:
+        cache.get_build_plan("debcraft", project_data=PROJECT)
+
+    with craft_platforms.PersistentPlanCache(tmp_path, version="2.0") as cache:
+        cache.get_build_plan("debcraft", project_data=PROJECT)
+        info = cache.cache_info()
+
+    assert info == craft_platforms.CacheInfo(hits=0, misses=1, maxsize=None, currsize=1)
+
+
+def test_default_version(tmp_path):
+    with craft_platforms.PersistentPlanCache(tmp_path) as cache:
+        version, _, digest = cache.version.rpartition("+")
+
+    assert version == craft_platforms.__version__
+    assert len(digest) == 16
+
+
+def test_default_version_code_changes(tmp_path):
+    package = tmp_path / "package"
+    (package / "sub").mkdir(parents=True)
+    (package / "_version.py").write_text("version = 'dev'")
+    (package / "sub" / "planner.py").write_text("PLAN = 1")
+    before = _persistent_cache._get_code_digest.__wrapped__(package)
+
+    (package / "_version.py").write_text("version = 'dev2'")
+    assert _persistent_cache._get_code_digest.__wrapped__(package) == before
+
+    (package / "sub" / "planner.py").write_text("PLAN = 2")
+    assert _persistent_cache._get_code_digest.__wrapped__(package) != before
+
+
+def test_errors_not_cached(cache):
+    project = {"base": "ubuntu@24.04", "platforms": {"any": None}}
+
+    for _ in range(2):
+        with pytest.raises(craft_platforms.InvalidPlatformNameError):
+            cache.get_build_plan("mycraft", project_data=project)
+
+    assert cache.cache_info().currsize == 0
+
+
+def test_clear(cache):
+    cache.get_build_plan("debcraft", project_data=PROJECT)
+
+    cache.clear()
+
+    assert cache.cache_info() == craft_platforms.CacheInfo(
+        hits=0, misses=0, maxsize=None, currsize=0
+    )
+
+
+def test_export_import(cache, tmp_path):
+    snapshot = tmp_path / "snapshot.sqlite3"
+    plan = cache.get_build_plan("debcraft", project_data=PROJECT)
+    cache.export_to(snapshot)
+
+    with craft_platforms.PersistentPlanCache(tmp_path / "new", version="1.0") as new:
+        new.import_from(snapshot)
+        # Importing twice is harmless.
+        new.import_from(snapshot)
+
+        assert new.get_build_plan("debcraft", project_data=PROJECT) == plan
+        assert new.cache_info() == craft_platforms.CacheInfo(
+            hits=1, misses=0, maxsize=None, currsize=1
+        )
+
+
+def test_import_missing(cache, tmp_path):
+    with pytest.raises(FileNotFoundError, match="No plan cache snapshot"):
+        cache.import_from(tmp_path / "missing.sqlite3")
+
+
+def test_concurrent_threads(cache):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        plans = list(
+            executor.map(
+                lambda _: cache.get_build_plan("debcraft", project_data=PROJECT),
+                range(50),
+            )
+        )
+
+    assert all(plan == plans[0] for plan in plans)
+    assert cache.cache_info().currsize == 1
+
+
+def test_concurrent_processes(tmp_path):
+    with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
+        plans = list(executor.map(_plan_in_process, [tmp_path] * 12, range(12)))
+
+    for index, plan in enumerate(plans):
+        assert plan == plans[index % 3]
+    with craft_platforms.PersistentPlanCache(tmp_path, version="1.0") as cache:
+        assert cache.cache_info().currsize == 3
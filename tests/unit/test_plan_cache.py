@@ -0,0 +1,158 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the build plan cache."""
+
+import craft_platforms
+import pytest
+from craft_platforms import _build
+
+PROJECT = {
+    "name": "my-project",
+    "base": "ubuntu@24.04",
+    "platforms": {"amd64": None, "riscv64": None},
+}
+
+
+def _fingerprint(app="mycraft", **project_data):
+    return craft_platforms.get_project_fingerprint(app, project_data=project_data)
+
+
+def test_fingerprint_ignores_unplanned_keys():
+    assert _fingerprint(**PROJECT) == _fingerprint(
+        **{**PROJECT, "name": "other", "summary": "A summary."}
+    )
+
+
+@pytest.mark.parametrize(
+    ("key", "value"),
+    [
+        ("base", "ubuntu@22.04"),
+        ("build-base", "ubuntu@devel"),
+        ("platforms", {"amd64": None}),
+        ("type", "base"),
+        ("bases", []),
+    ],
+)
+def test_fingerprint_planner_keys(key, value):
+    assert _fingerprint(**PROJECT) != _fingerprint(**{**PROJECT, key: value})
+
+
+def test_fingerprint_platform_order():
+    reordered = {**PROJECT, "platforms": {"riscv64": None, "amd64": None}}
+
+    assert _fingerprint(**PROJECT) != _fingerprint(**reordered)
+
+
+def test_fingerprint_platform_key_order():
+    first = {"build-on": ["amd64"], "build-for": ["riscv64"]}
+    second = {"build-for": ["riscv64"], "build-on": ["amd64"]}
+
+    assert _fingerprint(platforms={"p": first}) == _fingerprint(platforms={"p": second})
+
+
+def test_fingerprint_missing_and_none():
+    assert _fingerprint(platforms=None) != _fingerprint()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"app": "othercraft"},
+        {"strict_platform_names": True},
+        {"allow_app_characters": True},
+    ],
+)
+def test_fingerprint_app_and_flags(kwargs):
+    app = kwargs.pop("app", "mycraft")
+
+    assert craft_platforms.get_project_fingerprint(
+        app, project_data=PROJECT, **kwargs
+    ) != _fingerprint(**PROJECT)
+
+
+def test_fingerprint_debcraft_host(mocker):
+    mock_host = mocker.patch.object(craft_platforms.DistroBase, "from_host")
+    mock_host.return_value = craft_platforms.DistroBase("ubuntu", "24.04")
+    noble = _fingerprint("debcraft", platforms={"amd64": None})
+    mock_host.return_value = craft_platforms.DistroBase("ubuntu", "22.04")
+
+    assert _fingerprint("debcraft", platforms={"amd64": None}) != noble
+
+
+def test_cache_hit(mocker):
+    cache = craft_platforms.PlanCache()
+    spy = mocker.spy(_build, "get_build_plan")
+
+    first = cache.get_build_plan("mycraft", project_data=PROJECT)
+    second = cache.get_build_plan("mycraft", project_data=dict(PROJECT))
+
+    assert first is second
+    assert spy.call_count == 1
+    assert list(first) == spy.spy_return
+    assert all(isinstance(info, craft_platforms.FrozenBuildInfo) for info in first)
+    assert cache.cache_info() == craft_platforms.CacheInfo(
+        hits=1, misses=1, maxsize=256, currsize=1
+    )
+
+
+def test_cache_eviction():
+    cache = craft_platforms.PlanCache(maxsize=2)
+    projects = [
+        {"base": "ubuntu@24.04", "platforms": {arch: None}}
+        for arch in ("amd64", "arm64", "riscv64")
+    ]
+
+    cache.get_build_plan("mycraft", project_data=projects[0])
+    cache.get_build_plan("mycraft", project_data=projects[1])
+    # Use the first project so that the second is the least recently used.
+    cache.get_build_plan("mycraft", project_data=projects[0])
+    cache.get_build_plan("mycraft", project_data=projects[2])
+    cache.get_build_plan("mycraft", project_data=projects[0])
+    cache.get_build_plan("mycraft", project_data=projects[1])
+
+    assert len(cache) == 2
+    assert cache.cache_info() == craft_platforms.CacheInfo(
+        hits=2, misses=4, maxsize=2, currsize=2
+    )
+
+
+def test_cache_errors_not_cached():
+    cache = craft_platforms.PlanCache()
+    project = {"base": "ubuntu@24.04", "platforms": {"any": None}}
+
+    for _ in range(2):
+        with pytest.raises(craft_platforms.InvalidPlatformNameError):
+            cache.get_build_plan("mycraft", project_data=project)
+
+    assert cache.cache_info() == craft_platforms.CacheInfo(
+        hits=0, misses=2, maxsize=256, currsize=0
+    )
+
+
+def test_cache_clear():
+    cache = craft_platforms.PlanCache()
+    cache.get_build_plan("mycraft", project_data=PROJECT)
+
+    cache.clear()
+
+    assert cache.cache_info() == craft_platforms.CacheInfo(
+        hits=0, misses=0, maxsize=256, currsize=0
+    )
+
+
+def test_cache_invalid_maxsize():
+    with pytest.raises(ValueError, match="maxsize must be a positive integer"):
+        craft_platforms.PlanCache(maxsize=0)
@@ -314,6 +314,13 @@ def test_build_plans_bad_base(base, error_msg):
         craft_platforms.get_platforms_build_plan(base, {"amd64": None})
 
 
+def test_build_plans_no_base():
+    with pytest.raises(
+        craft_platforms.RequiresBaseError, match="No base or build-base is declared"
+    ):
+        craft_platforms.get_platforms_build_plan(None, {"amd64": None})  # ty: ignore[invalid-argument-type]
+
+
 @pytest.mark.parametrize("platform_name", RESERVED_PLATFORM_NAMES)
 @pytest.mark.parametrize(
     "platform_value", [None, {}, {"build-on": ["ppc64el"], "build-for": ["s390x"]}]
@@ -429,6 +436,48 @@ def test_build_plans_with_allow_all_and_architecture_dependent(platforms):
     )
 
 
+@pytest.mark.parametrize(
+    "platforms",
+    [
+        pytest.param(
+            {"amd64": None, "not-an-arch": None},
+            id="invalid-platform-name",
+        ),
+        pytest.param(
+            {
+                "amd64": None,
+                "all": {"build-on": ["amd64"], "build-for": ["all"]},
+            },
+            id="all-and-architecture-dependent",
+        ),
+    ],
+)
+def test_iter_build_plan_stops_early(platforms):
+    plan = craft_platforms.iter_platforms_build_plan("ubuntu@26.04", platforms)
+
+    assert next(plan) == craft_platforms.BuildInfo(
+        "amd64",
+        craft_platforms.DebianArchitecture.AMD64,
+        craft_platforms.DebianArchitecture.AMD64,
+        craft_platforms.DistroBase("ubuntu", "26.04"),
+    )
+    with pytest.raises(ValueError):  # noqa: PT011 (errors differ by param)
+        list(plan)
+
+
+def test_iter_build_plan_is_lazy():
+    platforms = {
+        f"platform-{idx}": {"build-on": ["amd64", "riscv64"], "build-for": ["s390x"]}
+        for idx in range(1000)
+    }
+    # A broken platform at the end is never reached.
+    platforms["broken"] = {"build-on": ["nope"], "build-for": ["nope"]}
+
+    plan = craft_platforms.iter_platforms_build_plan("ubuntu@26.04", platforms)  # ty: ignore[invalid-argument-type]
+
+    assert any(info.build_on == "riscv64" for info in plan)
+
+
 @pytest.mark.slow
 @given(
     base=strategies.any_distro_base(),
@@ -449,8 +498,13 @@ def test_fuzz_get_platforms_build_plan(
     build_base: craft_platforms.DistroBase,
 ):
     build_base_str = str(build_base) if build_base else None
-    craft_platforms.get_platforms_build_plan(base, platforms, build_base_str)
+    build_plan = craft_platforms.get_platforms_build_plan(
+        base, platforms, build_base_str
+    )
     craft_platforms.get_platforms_build_plan(str(base), platforms, build_base_str)
+    assert build_plan == list(
+        craft_platforms.iter_platforms_build_plan(base, platforms, build_base_str)
+    )
 
 
 @pytest.mark.parametrize(
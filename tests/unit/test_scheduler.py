@@ -0,0 +1,206 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for build plan scheduling."""
+
+import collections
+
+import pytest
+from craft_platforms import (
+    BuildInfo,
+    DebianArchitecture,
+    DistroBase,
+    Runner,
+    schedule_build_plan,
+)
+
+AMD64 = DebianArchitecture.AMD64
+ARM64 = DebianArchitecture.ARM64
+RISCV64 = DebianArchitecture.RISCV64
+S390X = DebianArchitecture.S390X
+JAMMY = DistroBase("ubuntu", "22.04")
+NOBLE = DistroBase("ubuntu", "24.04")
+
+
+def _entries(count, build_on=AMD64, build_base=NOBLE):
+    return [BuildInfo(f"p{i}", build_on, build_on, build_base) for i in range(count)]
+
+
+@pytest.mark.parametrize(
+    ("machine", "expected"),
+    [("x86_64", AMD64), ("aarch64", ARM64), ("riscv64", RISCV64)],
+)
+def test_runner_from_machine(machine, expected):
+    runner = Runner.from_machine("r", machine, bases=[NOBLE], capacity=2, cost=3)
+
+    assert runner == Runner("r", expected, frozenset({NOBLE}), 2, 3)
+
+
+def test_runner_from_machine_invalid():
+    with pytest.raises(ValueError, match="'z80'"):
+        Runner.from_machine("r", "z80")
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error"),
+    [
+        ({"capacity": 0}, "capacity of at least 1"),
+        ({"cost": 0}, "positive cost"),
+    ],
+)
+def test_runner_invalid(kwargs, error):
+    with pytest.raises(ValueError, match=error):
+        Runner("r", AMD64, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ("runner", "expected"),
+    [
+        (Runner("r", AMD64), True),
+        (Runner("r", ARM64), False),
+        (Runner("r", AMD64, bases=frozenset({NOBLE})), True),
+        (Runner("r", AMD64, bases=frozenset({JAMMY})), False),
+        (Runner("r", AMD64, bases=frozenset({DistroBase("ubuntu", "24.04")})), True),
+    ],
+)
+def test_runner_can_build(runner, expected):
+    assert runner.can_build(BuildInfo("p", AMD64, RISCV64, NOBLE)) is expected
+
+
+def test_schedule_empty():
+    schedule = schedule_build_plan([], [Runner("r", AMD64)])
+
+    assert schedule.assignments == []
+    assert schedule.unschedulable == []
+    assert schedule.makespan == 0
+
+
+def test_schedule_unschedulable():
+    build_plan = [
+        BuildInfo("amd64", AMD64, AMD64, NOBLE),
+        BuildInfo("s390x", S390X, S390X, NOBLE),
+        BuildInfo("jammy", AMD64, AMD64, JAMMY),
+    ]
+
+    schedule = schedule_build_plan(
+        build_plan, [Runner("r", AMD64, bases=frozenset({NOBLE}))]
+    )
+
+    assert schedule.unschedulable == build_plan[1:]
+    assert [a.build_info for a in schedule.assignments] == build_plan[:1]
+
+
+def test_schedule_no_runners():
+    build_plan = _entries(3)
+
+    schedule = schedule_build_plan(build_plan, [])
+
+    assert schedule.unschedulable == build_plan
+    assert schedule.makespan == 0
+
+
+def test_schedule_duplicate_runner():
+    with pytest.raises(ValueError, match="Duplicate runner name 'r'"):
+        schedule_build_plan([], [Runner("r", AMD64), Runner("r", ARM64)])
+
+
+def test_schedule_balances_capacity():
+    runners = [Runner("big", AMD64, capacity=3), Runner("small", AMD64)]
+
+    schedule = schedule_build_plan(_entries(8), runners)
+
+    assert schedule.makespan == 2
+    per_slot = collections.Counter(
+        (a.runner.name, a.slot) for a in schedule.assignments
+    )
+    assert per_slot == dict.fromkeys(per_slot, 2)
+    assert len(per_slot) == 4
+
+
+def test_schedule_prefers_faster_runners():
+    runners = [Runner("fast", RISCV64), Runner("slow", RISCV64, cost=4)]
+
+    schedule = schedule_build_plan(_entries(5, build_on=RISCV64), runners)
+
+    assert len(schedule.for_runner("fast")) == 4
+    assert len(schedule.for_runner("slow")) == 1
+    assert schedule.makespan == 4
+
+
+def test_schedule_longest_first():
+    build_plan = _entries(5)
+    costs = {"p0": 1, "p1": 1, "p2": 1, "p3": 3, "p4": 2}
+
+    schedule = schedule_build_plan(
+        build_plan,
+        [Runner("a", AMD64), Runner("b", AMD64)],
+        cost=lambda info: costs[info.platform],
+    )
+
+    assert schedule.makespan == 4
+    assert [a.build_info.platform for a in schedule.assignments[:2]] == ["p3", "p4"]
+
+
+def test_schedule_for_runner_in_start_order():
+    schedule = schedule_build_plan(_entries(3), [Runner("r", AMD64)])
+
+    assignments = schedule.for_runner("r")
+
+    assert [(a.start, a.end) for a in assignments] == [(0, 1), (1, 2), (2, 3)]
+    assert [a.build_info.platform for a in assignments] == ["p0", "p1", "p2"]
+
+
+def test_schedule_respects_architecture_and_base():
+    build_plan = [
+        *_entries(4, build_on=AMD64, build_base=NOBLE),
+        *_entries(4, build_on=ARM64, build_base=NOBLE),
+        *_entries(4, build_on=AMD64, build_base=JAMMY),
+    ]
+    runners = [
+        Runner("amd64-noble", AMD64, bases=frozenset({NOBLE})),
+        Runner("amd64-any", AMD64),
+        Runner("arm64", ARM64, capacity=2),
+    ]
+
+    schedule = schedule_build_plan(build_plan, runners)
+
+    assert not schedule.unschedulable
+    assert len(schedule.assignments) == len(build_plan)
+    for assignment in schedule.assignments:
+        assert assignment.runner.can_build(assignment.build_info)
+    assert all(
+        a.build_info.build_base == NOBLE for a in schedule.for_runner("amd64-noble")
+    )
+    assert schedule.makespan == 4
+
+
+def test_schedule_no_overlap():
+    build_plan = _entries(500)
+    runners = [
+        Runner(f"r{i}", AMD64, capacity=i % 3 + 1, cost=i % 4 + 1) for i in range(12)
+    ]
+
+    schedule = schedule_build_plan(
+        build_plan, runners, cost=lambda info: int(info.platform[1:]) % 7 + 1
+    )
+
+    slots = collections.defaultdict(list)
+    for assignment in schedule.assignments:
+        slots[assignment.runner.name, assignment.slot].append(assignment)
+    for assignments in slots.values():
+        assignments.sort(key=lambda a: a.start)
+        for before, after in zip(assignments, assignments[1:]):
+            assert before.end <= after.start
+    assert len(schedule.assignments) == len(build_plan)
@@ -0,0 +1,256 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for build plan serialization."""
+
+import copy
+import dataclasses
+import json
+import pickle
+
+import craft_platforms
+import pytest
+from craft_platforms import (
+    BuildInfo,
+    BuildPlan,
+    DebianArchitecture,
+    DistroBase,
+    build_plan_from_bytes,
+    build_plan_from_json,
+    build_plan_to_bytes,
+    build_plan_to_json,
+)
+from craft_platforms.test import strategies
+from hypothesis import given
+from hypothesis import strategies as hp_strat
+
+AMD64 = DebianArchitecture.AMD64
+RISCV64 = DebianArchitecture.RISCV64
+
+PLAN = [
+    BuildInfo("amd64", AMD64, AMD64, DistroBase("ubuntu", "24.04")),
+    BuildInfo(
+        DebianArchitecture.S390X,
+        AMD64,
+        DebianArchitecture.S390X,
+        DistroBase("ubuntu", "24.04"),
+    ),
+    BuildInfo("all", RISCV64, "all", DistroBase("ubuntu", "devel")),
+    BuildInfo("ubuntu@22.04:x", AMD64, RISCV64, DistroBase("ubuntu", "22.04")),
+    BuildInfo("my-platform", RISCV64, AMD64, DistroBase("debian", "13")),
+]
+
+build_infos = hp_strat.builds(
+    BuildInfo,
+    platform=hp_strat.text().filter(lambda name: "\0" not in name),
+    build_on=hp_strat.sampled_from(DebianArchitecture),
+    build_for=hp_strat.one_of(
+        hp_strat.sampled_from(DebianArchitecture), hp_strat.just("all")
+    ),
+    build_base=strategies.any_distro_base(),
+)
+
+
+@dataclasses.dataclass
+class _ExtraBuildInfo(BuildInfo):
+    extra: str = "default"
+
+
+@dataclasses.dataclass(frozen=True)
+class _ExtraDistroBase(DistroBase):
+    extra: str = "default"
+
+
+def _assert_same(actual, expected):
+    assert actual == expected
+    # DistroBase equality allows one series to be more specific than the other.
+    assert [
+        (info.build_base.distribution, info.build_base.series) for info in actual
+    ] == [(info.build_base.distribution, info.build_base.series) for info in expected]
+
+
+@pytest.mark.parametrize("info", PLAN)
+def test_build_info_dict(info):
+    data = info.to_dict()
+
+    assert json.loads(json.dumps(data)) == data
+    assert BuildInfo.from_dict(data) == info
+
+
+def test_build_info_to_dict():
+    assert PLAN[2].to_dict() == {
+        "platform": "all",
+        "build_on": "riscv64",
+        "build_for": "all",
+        "build_base": "ubuntu@devel",
+    }
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"platform": "x", "build_on": "z80", "build_for": "all", "build_base": "a@1"},
+        {"platform": "x", "build_on": "amd64", "build_for": "z80", "build_base": "a@1"},
+        {"platform": "x", "build_on": "amd64", "build_for": "all", "build_base": 1},
+    ],
+)
+def test_build_info_from_dict_invalid(data):
+    with pytest.raises(ValueError, match="Invalid build info"):
+        BuildInfo.from_dict(data)
+
+
+@pytest.mark.parametrize(
+    ("dump", "load"),
+    [
+        (build_plan_to_json, build_plan_from_json),
+        (build_plan_to_bytes, build_plan_from_bytes),
+    ],
+)
+@pytest.mark.parametrize("plan", [PLAN, [], PLAN * 100])
+def test_round_trip(dump, load, plan):
+    _assert_same(load(dump(plan)), plan)
+
+
+@given(plan=hp_strat.lists(build_infos, max_size=10))
+def test_round_trip_any(plan):
+    _assert_same(build_plan_from_bytes(build_plan_to_bytes(plan)), plan)
+    _assert_same(build_plan_from_json(build_plan_to_json(plan)), plan)
+
+
+def test_json_format():
+    assert json.loads(build_plan_to_json(PLAN[:1])) == [
+        {
+            "platform": "amd64",
+            "build_on": "amd64",
+            "build_for": "amd64",
+            "build_base": "ubuntu@24.04",
+        }
+    ]
+
+
+def test_bytes_compact():
+    plan = list(
+        craft_platforms.get_build_plan(
+            "charmcraft",
+            project_data={
+                "base": "ubuntu@24.04",
+                "platforms": dict.fromkeys(DebianArchitecture),
+            },
+        )
+    )
+
+    encoded = build_plan_to_bytes(plan * 1000)
+
+    assert len(encoded) < 8 * len(plan) * 1000 + 100
+    decoded = build_plan_from_bytes(encoded)
+    assert len({id(info.build_base) for info in decoded}) == 1
+
+
+def test_bytes_many_strings():
+    plan = [
+        BuildInfo(f"platform-{index}", AMD64, "all", DistroBase("ubuntu", "24.04"))
+        for index in range(70_000)
+    ]
+
+    assert build_plan_from_bytes(build_plan_to_bytes(plan)) == plan
+
+
+@pytest.mark.parametrize(
+    ("plan", "message"),
+    [
+        ([BuildInfo("a\0b", AMD64, AMD64, DistroBase("ubuntu", "24.04"))], "null"),
+        (
+            [BuildInfo("z80", "z80", AMD64, DistroBase("ubuntu", "24.04"))],  # ty: ignore[invalid-argument-type]
+            "'z80'",
+        ),
+    ],
+)
+def test_to_bytes_invalid(plan, message):
+    with pytest.raises(ValueError, match=message):
+        build_plan_to_bytes(plan)
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (b"", "Not an encoded build plan"),
+        (b"nope" + bytes(6), "Not an encoded build plan"),
+        (b"CPBP\x02H" + bytes(4), "Unsupported build plan encoding version: 2"),
+        (b"CPBP\x01x" + bytes(4), "Invalid encoded build plan"),
+        (build_plan_to_bytes(PLAN)[:-1], "truncated"),
+        (build_plan_to_bytes(PLAN)[:12], "truncated"),
+        (build_plan_to_bytes(PLAN)[:-8] + b"\xff" * 8, "Invalid encoded build plan"),
+    ],
+)
+def test_from_bytes_invalid(data, message):
+    with pytest.raises(ValueError, match=message):
+        build_plan_from_bytes(data)
+
+
+@pytest.mark.parametrize("data", ["{}", "[1]", "[{}]"])
+def test_from_json_invalid(data):
+    with pytest.raises(ValueError, match="build"):
+        build_plan_from_json(data)
+
+
+def test_pickle_build_info():
+    for info in PLAN:
+        assert pickle.loads(pickle.dumps(info)) == info  # noqa: S301
+
+
+def test_pickle_distro_base():
+    base = DistroBase("ubuntu", "24.04")
+    assert base.sort_key  # ty: ignore[redundant-condition]
+
+    assert pickle.loads(pickle.dumps(base)) == base  # noqa: S301
+    assert "sort_key" not in pickle.dumps(base).decode("latin-1")
+
+
+@pytest.mark.parametrize(
+    "copier",
+    [
+        copy.copy,
+        copy.deepcopy,
+        lambda obj: pickle.loads(pickle.dumps(obj)),  # noqa: S301
+    ],
+)
+def test_copy_subclass(copier):
+    info = _ExtraBuildInfo(
+        "amd64",
+        AMD64,
+        AMD64,
+        _ExtraDistroBase("ubuntu", "24.04", extra="base"),
+        extra="info",
+    )
+
+    copied = copier(info)
+
+    assert type(copied) is _ExtraBuildInfo
+    assert copied.extra == "info"
+    assert type(copied.build_base) is _ExtraDistroBase
+    assert copied.build_base.extra == "base"
+
+
+def test_pickle_build_plan():
+    plan = BuildPlan(PLAN)
+    # Indexes aren't pickled.
+    assert plan.by_platform
+
+    unpickled = pickle.loads(pickle.dumps(plan))  # noqa: S301
+
+    assert isinstance(unpickled, BuildPlan)
+    _assert_same(list(unpickled), PLAN)
+    assert len(pickle.dumps(plan)) < len(pickle.dumps(PLAN))
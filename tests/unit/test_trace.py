@@ -0,0 +1,169 @@
+# This file is part of craft-platforms.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for Chrome traces of build planning."""
+
+import concurrent.futures
+import json
+
+import craft_platforms
+import pytest
+from craft_platforms import ChromeTracer, _instrument
+
+PROJECT = {
+    "name": "my-charm",
+    "base": "ubuntu@24.04",
+    "platforms": {"amd64": None, "riscv64": None, "s390x": None},
+}
+
+
+def _spans(path):
+    trace = json.loads(path.read_text())
+    return [event for event in trace["traceEvents"] if event["ph"] == "X"]
+
+
+def test_trace(tmp_path):
+    path = tmp_path / "plan.trace.json"
+
+    with ChromeTracer(path) as tracer, tracer.span("project", project="my-charm"):
+        craft_platforms.get_build_plan("charmcraft", project_data=PROJECT)
+
+    assert _instrument.HOOKS == ()
+    spans = _spans(path)
+    assert [span["name"] for span in spans] == [
+        "resolve_base",
+        "resolve_base",
+        "resolve_base",
+        "get_charm_build_plan",
+        "plan",
+        "project",
+    ]
+    by_name = {span["name"]: span for span in spans}
+    assert by_name["plan"]["args"] == {
+        "app": "charmcraft",
+        "count": 3,
+        "name": "my-charm",
+        "platforms": 3,
+    }
+    assert by_name["get_charm_build_plan"]["args"] == {
+        "app": "charmcraft",
+        "count": 3,
+        "planner": "get_charm_build_plan",
+        "platforms": 3,
+    }
+    assert by_name["project"]["args"] == {"project": "my-charm"}
+    # Each span is inside the one that contains it.
+    for inner, outer in [
+        *((span, by_name["get_charm_build_plan"]) for span in spans[:3]),
+        (by_name["get_charm_build_plan"], by_name["plan"]),
+        (by_name["plan"], by_name["project"]),
+    ]:
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_trace_threads(tmp_path):
+    path = tmp_path / "plan.trace.json"
+
+    with ChromeTracer(path), concurrent.futures.ThreadPoolExecutor(2) as executor:
+        list(
+            executor.map(
+                lambda _: craft_platforms.get_build_plan(
+                    "charmcraft", project_data=PROJECT
+                ),
+                range(20),
+            )
+        )
+
+    trace = json.loads(path.read_text())["traceEvents"]
+    thread_names = {
+        event["tid"]: event["args"]["name"]
+        for event in trace
+        if event["name"] == "thread_name"
+    }
+    plans = [event for event in trace if event["name"] == "plan"]
+    assert len(plans) == 20
+    assert {plan["tid"] for plan in plans} <= set(thread_names)
+
+
+def test_buffered(tmp_path):
+    path = tmp_path / "plan.trace.json"
+    tracer = ChromeTracer(path, buffer_size=100)
+
+    with craft_platforms.stage_hook(tracer):
+        craft_platforms.get_build_plan("charmcraft", project_data=PROJECT)
+        assert not path.exists()
+        for _ in range(30):
+            craft_platforms.get_build_plan("charmcraft", project_data=PROJECT)
+        written = path.read_text()
+        assert 0 < written.count('"ph": "X"') < 31 * 5
+
+    tracer.close()
+    assert len(_spans(path)) == 31 * 5
+
+
+def test_flush(tmp_path):
+    path = tmp_path / "plan.trace.json"
+    tracer = ChromeTracer(path)
+
+    with tracer.span("first"):
+        pass
+    tracer.flush()
+    assert '"first"' in path.read_text()
+    with tracer.span("second"):
+        pass
+    tracer.close()
+
+    assert [span["name"] for span in _spans(path)] == ["first", "second"]
+
+
+def test_empty(tmp_path):
+    path = tmp_path / "plan.trace.json"
+
+    with ChromeTracer(path):
+        pass
+
+    assert json.loads(path.read_text()) == {
+        "displayTimeUnit": "ms",
+        "traceEvents": [],
+    }
+
+
+def test_closed(tmp_path):
+    path = tmp_path / "plan.trace.json"
+    tracer = ChromeTracer(path)
+    with tracer.span("before"):
+        pass
+    tracer.close()
+
+    with tracer.span("after"):
+        pass
+    tracer.flush()
+    tracer.close()
+
+    assert [span["name"] for span in _spans(path)] == ["before"]
+
+
+def test_error_in_plan(tmp_path):
+    path = tmp_path / "plan.trace.json"
+
+    with ChromeTracer(path), pytest.raises(craft_platforms.RequiresBaseError):
+        craft_platforms.get_build_plan("snapcraft", project_data={"platforms": {}})
+
+    assert [span["name"] for span in _spans(path)] == [
+        "resolve_base",
+        "get_platforms_snap_build_plan",
+        "plan",
+    ]
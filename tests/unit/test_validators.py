@@ -15,13 +15,19 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Unit tests for validator functions."""
 
+import unicodedata
+from typing import List
+
+import craft_platforms
 import pytest
 from craft_platforms import InvalidPlatformNameError
+from craft_platforms._platforms import RESERVED_PLATFORM_NAMES
 from craft_platforms.validators import (
     _ALLOWED_MIDDLE_CHARACTERS,
     _ALLOWED_UNICODE_CATEGORIES,
     _APPLICATION_RESERVED_CHARACTERS,
     validate_strict_platform_name,
+    validate_strict_platform_names,
 )
 from hypothesis import given, strategies
 
@@ -133,3 +139,98 @@ def test_fuzz_banned_categories_user_name(name: str):
 def test_fuzz_banned_categories_app_name(name: str):
     with pytest.raises(InvalidPlatformNameError):
         validate_strict_platform_name(name, allow_app_characters=True)
+
+
+def _legacy_invalid_characters(name: str, *, allow_app_characters: bool) -> List[str]:
+    """Find invalid characters the way the validator did before its fast path."""
+    invalid_characters: List[str] = []
+    if not allow_app_characters:
+        invalid_characters.extend(
+            character
+            for character in _APPLICATION_RESERVED_CHARACTERS
+            if character in name
+        )
+    invalid_characters.extend(
+        character
+        for character in _ALLOWED_MIDDLE_CHARACTERS
+        if name.startswith(character) or name.endswith(character)
+    )
+    for character in name:
+        category = unicodedata.category(character)
+        if character in (_ALLOWED_MIDDLE_CHARACTERS + _APPLICATION_RESERVED_CHARACTERS):
+            continue
+        for allowed_category in _ALLOWED_UNICODE_CATEGORIES:
+            if category.startswith(allowed_category):
+                break
+        else:
+            invalid_characters.append(character)
+    return invalid_characters
+
+
+@given(
+    name=strategies.one_of(
+        strategies.text(
+            strategies.sampled_from(
+                [chr(i) for i in range(128)] + ["é", "🇧", "\u00a0", "\u0301"]
+            )
+        ),
+        strategies.text(),
+    ).filter(lambda name: name not in RESERVED_PLATFORM_NAMES),
+    allow_app_characters=strategies.booleans(),
+)
+def test_fuzz_matches_legacy(name: str, *, allow_app_characters: bool):
+    craft_platforms.clear_caches()
+    expected = _legacy_invalid_characters(
+        name, allow_app_characters=allow_app_characters
+    )
+
+    # Check both the computed and the cached result.
+    for _ in range(2):
+        if expected:
+            with pytest.raises(InvalidPlatformNameError) as exc_info:
+                validate_strict_platform_name(
+                    name, allow_app_characters=allow_app_characters
+                )
+            assert exc_info.value.details == (
+                f"Platform name contains invalid characters: {expected}"
+            )
+        else:
+            assert (
+                validate_strict_platform_name(
+                    name, allow_app_characters=allow_app_characters
+                )
+                == name
+            )
+
+
+def test_validate_strict_platform_name_cached():
+    craft_platforms.clear_caches()
+
+    for _ in range(3):
+        validate_strict_platform_name("ubuntu@24.04:amd64")
+        with pytest.raises(InvalidPlatformNameError):
+            validate_strict_platform_name(";")
+
+    info = craft_platforms.get_cache_info()["strict_platform_name"]
+    assert (info.hits, info.misses) == (4, 2)
+
+
+def test_validate_strict_platform_names():
+    names = ["amd64", "riscv64", "amd64"]
+
+    assert validate_strict_platform_names(iter(names)) == names
+
+
+@pytest.mark.parametrize(
+    ("names", "allow_app_characters", "invalid"),
+    [
+        (["amd64", ";", "-a"], True, "';'"),
+        (["amd64", "x86_64"], False, "'x86_64'"),
+        (["amd64", "any"], True, "'any' is reserved"),
+    ],
+)
+def test_validate_strict_platform_names_first_error(
+    names, allow_app_characters, invalid
+):
+    with pytest.raises(InvalidPlatformNameError, match=invalid):
+        validate_strict_platform_names(names, allow_app_characters=allow_app_characters)